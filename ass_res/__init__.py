@@ -26,4 +26,7 @@ Created on Sun Jun 11 15:42:16 2017
 
 
 __all__ = ['init_nasa_wind', 'init_nasa_solar', 'ass_singlesite_ws', 
-'ass_singlesite_lsy', 'draw_geo_fig', 'ass_widearea_dis', 'ass_widearea_wsy']
+'ass_singlesite_lsy', 'draw_geo_fig', 'ass_widearea_dis', 'ass_widearea_wsy', 
+'init_nasa_hdf', 'init_nasa_cube', 'init_nasa_cache', 'init_nasa_manifest', 
+'init_power_curve', 'init_calibration', 'init_pv_model', 'init_solar_position', 
+'ass_param_sweep', 'init_time_axis']
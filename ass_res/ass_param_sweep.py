@@ -0,0 +1,134 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 23:58:40 2026
+########################################################################################
+# @ File name: ass_param_sweep.py
+# @ Function: Perform parameter sweeps.
+# 	Assess the statistical indices of all sites for many WTGs and PV design parameters in one run.
+# @ Author: Yongji Cao, Hengxu Zhang
+# @ Version: 1.0
+# @ Revision date: Oct/18/2026
+# @ Copyright (c) 2016-2026 School of Electrical Engineering, Shandong University, China
+########################################################################################
+"""
+
+
+import itertools
+import numpy as np
+
+import init_nasa_cube as mcube
+import init_power_curve as mpc
+import init_pv_model as mpv
+
+
+wind_default = {'ihref': 50.0, 'ihw': 65.0, 'ialpha': 0.35, 'ispeed_in': 3.0, 'ispeed_out': 25.0,
+	'ispeed_rate': 13.5, 'inita': 0.95, 'ipower_curve': None}
+
+
+def cparam_grid(**iaxes):
+	'''Construct the grid of parameters.
+	Args:
+		iaxes: the values of each parameter, e.g. ispeed_in=[2.5, 3.0], ispeed_rate=[12.0, 13.5].
+	Returns:
+		list of dict; the parameters of each grid point, the last parameter varying fastest.
+	'''
+	names = sorted(iaxes.keys())
+	return [dict(zip(names, each)) for each in itertools.product(*[iaxes[each_name] for each_name in names])]
+
+
+def cass_stats(ibuf):
+	'''Assess the statistical indices of capacity factors in hour scale.
+		The capacity factors are overwritten.
+	Args:
+		ibuf: float32 (param_num, site_num, day_num, 24) capacity factors.
+	Returns:
+		fc_mean_hourly: (param_num, site_num) means in hour scale.
+		fc_std_hourly: (param_num, site_num) std in hour scale.
+		fc_varcoef_hourly: (param_num, site_num) variable coefficient in hour scale.
+		fc_half_prob: (param_num, site_num) half power probability.
+	'''
+	hour_num = ibuf.shape[2] * ibuf.shape[3]
+	fc_half_prob = np.sum(ibuf > 0.5, axis=(2, 3)) * 1.0 / hour_num
+	fc_mean_hourly = np.sum(ibuf, axis=(2, 3), dtype=np.float64) / hour_num
+	ibuf -= fc_mean_hourly[:, :, np.newaxis, np.newaxis].astype(np.float32)
+	np.square(ibuf, ibuf)
+	fc_std_hourly = np.sqrt(np.sum(ibuf, axis=(2, 3), dtype=np.float64) / hour_num)
+	with np.errstate(divide='ignore', invalid='ignore'):
+		fc_varcoef_hourly = fc_std_hourly / fc_mean_hourly
+	return fc_mean_hourly, fc_std_hourly, fc_varcoef_hourly, fc_half_prob
+
+
+def csweep(iparam_num, ishape, ifill, ichunk_size):
+	'''Assess the statistical indices of each parameter set, chunk by chunk of the parameter sets.
+	Args:
+		iparam_num: int; the number of parameter sets.
+		ishape: the shape (site_num, day_num, 24) of capacity factors.
+		ifill: the function writing the capacity factors of a parameter set, called as ifill(paramth, out).
+		ichunk_size: int; the number of parameter sets calculated at a time.
+	Returns:
+		see cass_stats.
+	'''
+	stats = [np.empty((iparam_num, ishape[0])) for each in range(4)]
+	buf = np.empty((min(ichunk_size, iparam_num),) + tuple(ishape), np.float32)
+	for each_start in range(0, iparam_num, ichunk_size):
+		each_end = min(each_start + ichunk_size, iparam_num)
+		chunk = buf[:each_end - each_start]
+		for each_paramth in range(each_start, each_end):
+			ifill(each_paramth, chunk[each_paramth - each_start])
+		for each_stat, each_value in zip(stats, cass_stats(chunk)):
+			each_stat[each_start:each_end] = each_value
+	return tuple(stats)
+
+
+def csweep_wind(iwind_data, iparams, ichunk_size=4):
+	'''Assess all sites for each set of WTGs parameters.
+		The capacity factors are calculated from the speed at reference height, see WindData.cref2cf.
+	Args:
+		iwind_data: the WindData with the speed at reference height.
+		iparams: list of dict; the parameters of each set, of 'ihref', 'ihw', 'ialpha' (see WindData.cref2hw),
+			'ispeed_in', 'ispeed_out', 'ispeed_rate', 'inita' and 'ipower_curve' (see WindData.cwind2cf),
+			the defaults for the others; e.g. from cparam_grid.
+		ichunk_size: int; the number of parameter sets calculated at a time.
+	Returns:
+		(param_num, site_num) means, std, variable coefficient in hour scale and half power probability.
+	'''
+	ref_wind = mcube.cto_cube(iwind_data.dict_ref_wind, len(iwind_data.site_index), \
+		iwind_data.start_year, iwind_data.end_year)
+	params = []
+	for each in iparams:
+		param = dict(wind_default)
+		param.update(each)
+		if set(param.keys()) != set(wind_default.keys()):
+			raise ValueError('unknown WTGs parameters: %s' % ', '.join(set(param.keys()) - set(wind_default.keys())))
+		params.append(param)
+	def cfill(iparamth, iout):
+		param = params[iparamth]
+		power_curve = param['ipower_curve']
+		if power_curve is None:
+			power_curve = mpc.PowerCurve.cfrom_param(param['ispeed_in'], param['ispeed_out'],
+				param['ispeed_rate'], param['inita'])
+		np.multiply(ref_wind.data, (param['ihw'] / param['ihref']) ** param['ialpha'], iout)
+		power_curve.cspeed2cf(iout, iout)
+	return csweep(len(params), ref_wind.data.shape, cfill, ichunk_size)
+
+
+def csweep_solar(isolar_data, iparams, imodel=1, iclip=False, ipoa=False, ichunk_size=4):
+	'''Assess all sites for each set of PV module parameters.
+	Args:
+		isolar_data: the SolarData with solar irradiation, and ambient temperature for PV model2.
+		iparams: list of dict; the parameters of each set, see SolarData.csolar2cf_model1 or
+			SolarData.csolar2cf_model2, the defaults for the others; e.g. from cparam_grid.
+		imodel: 1 or 2; the PV model.
+		iclip: True or False; clip the capacity factors to [0, 1].
+		ipoa: True or False; use the plane-of-array irradiation, see SolarData.cpoa_irradiance.
+		ichunk_size: int; the number of parameter sets calculated at a time.
+	Returns:
+		(param_num, site_num) means, std, variable coefficient in hour scale and half power probability.
+	'''
+	model_from = {1: mpv.PvModel.cfrom_model1, 2: mpv.PvModel.cfrom_model2}[imodel]
+	models = [model_from(**each) for each in iparams]
+	(solar, temperature) = isolar_data.cpv_input(models, ipoa)
+	def cfill(iparamth, iout):
+		models[iparamth].csolar2cf(solar.data, None if temperature is None else temperature.data, iout, iclip)
+	return csweep(len(models), solar.data.shape, cfill, ichunk_size)
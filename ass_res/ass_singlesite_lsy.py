@@ -37,39 +37,10 @@ def cass_varh_monthly(iwind_data, isolar_data, isiteth_plotted=3, iyear_plotted=
 	Returns: 
 		the graphs of monthly variation.
 	'''
-	year_index = range(iwind_data.start_year, iwind_data.end_year + 1)
-	year_num = len(year_index)
-	site_num = len(iwind_data.site_index)
-	month_index = iwind_data.month_name
-	wfc_mean_monthly = np.empty((site_num, 12), np.float32)
-	wfc_sum_monthly = np.empty((site_num, 12, year_num), np.float32)
-	sfc_mean_monthly = np.empty((site_num, 12), np.float32)
-	sfc_sum_monthly = np.empty((site_num, 12, year_num), np.float32)
-	wfc_ploted = np.empty((1, 12), np.float32)
-	sfc_ploted = np.empty((1, 12), np.float32)
-	for each_siteth in range(1, site_num + 1):
-		for each_monthth in range(0, 12, 1):
-			for each_year in year_index:
-				wfc_mean_monthly[each_siteth-1,each_monthth] = \
-				wfc_mean_monthly[each_siteth-1,each_monthth] + \
-				np.sum(iwind_data.cselect_1site_1month(each_siteth, each_year, month_index[each_monthth]), axis=1)
-				wfc_mean_monthly[each_siteth-1,each_monthth] = \
-				wfc_mean_monthly[each_siteth-1,each_monthth] * 1.0 / year_num
-				wfc_sum_monthly[each_siteth - 1, each_monthth, each_year - iwind_data.start_year] = \
-				np.sum(iwind_data.cselect_1site_1month(each_siteth, each_year, month_index[each_monthth]), axis=1)
-				
-				sfc_mean_monthly[each_siteth-1,each_monthth] = \
-				sfc_mean_monthly[each_siteth-1,each_monthth] + \
-				np.sum(isolar_data.cselect_1site_1month(each_siteth, each_year, month_index[each_monthth]), axis=1)
-				sfc_mean_monthly[each_siteth-1,each_monthth] = \
-				sfc_mean_monthly[each_siteth-1,each_monthth] * 1.0 / year_num
-				sfc_sum_monthly[each_siteth - 1, each_monthth, each_year - iwind_data.start_year] = \
-				np.sum(isolar_data.cselect_1site_1month(each_siteth, each_year, month_index[each_monthth]), axis=1)
-	for each_monthth in range(0, 12, 1):
-			wfc_ploted[0, each_monthth] = \
-			np.sum(iwind_data.cselect_1site_1month(isiteth_plotted, iyear_plotted, month_index[each_monthth]), axis=1)
-			sfc_ploted[0, each_monthth] = \
-			np.sum(isolar_data.cselect_1site_1month(isiteth_plotted, iyear_plotted, month_index[each_monthth]), axis=1)
+	wfc_sum_monthly = masw.cass_varws_allsites(iwind_data)[4]
+	sfc_sum_monthly = masw.cass_varws_allsites(isolar_data)[4]
+	wfc_ploted = wfc_sum_monthly[isiteth_plotted - 1:isiteth_plotted, :, iyear_plotted - iwind_data.start_year]
+	sfc_ploted = sfc_sum_monthly[isiteth_plotted - 1:isiteth_plotted, :, iyear_plotted - isolar_data.start_year]
 	if plot_flag == True:
 		plt.rcParams['font.family'] = 'Times New Roman'
 		plt.figure(dpi=300)
@@ -93,7 +64,7 @@ def cass_varh_monthly(iwind_data, isolar_data, isiteth_plotted=3, iyear_plotted=
 		# plt.savefig('cwp43000.png', dpi=300, bbox_inches='tight')
 
 
-def cass_varh_hourly(iwind_data, isolar_data, isiteth_plotted=3, imonth_ploted='Apr', plot_flag=False):
+def cass_varh_hourly(iwind_data, isolar_data, isiteth_plotted=3, imonth_ploted='Apr', plot_flag=False, iutc_offset=8):
 	'''Assess local synergy of selected sites in hour style.
 		Output graphs.
 	Args:
@@ -102,27 +73,13 @@ def cass_varh_hourly(iwind_data, isolar_data, isiteth_plotted=3, imonth_ploted='
 		isiteth_plotted: the serial number of selected site.
 		imonth_ploted: the selected month
 		plot_flag: True or False. Draw graphs or not.
+		iutc_offset: int; the hours of local time ahead of UTC, 8 for China.
 	Returns:
 		the graphs of hourly variation.
 	'''
-	year_index = range(iwind_data.start_year, iwind_data.end_year + 1)
-	year_num = len(year_index)
-	site_num = len(iwind_data.site_index)
-	wfc_mean_hourly = np.zeros((site_num, year_num, 24), np.float32)
-	sfc_mean_hourly = np.zeros((site_num, year_num, 24), np.float32)
-	for each_siteth in range(1, site_num + 1):
-		for each_yearth in range(0, year_num, 1):
-			for each_day in range(2, 29, 1):
-				wfc_mean_hourly[each_siteth - 1, each_yearth, :] = \
-				wfc_mean_hourly[each_siteth - 1, each_yearth, :] + \
-				np.hstack((iwind_data.cselect_1site_1day(each_siteth, year_index[each_yearth], imonth_ploted, each_day - 1)[0, 16:24], \
-					iwind_data.cselect_1site_1day(each_siteth, year_index[each_yearth], imonth_ploted,each_day)[0, 0:16]))
-				sfc_mean_hourly[each_siteth - 1, each_yearth, :] = \
-				sfc_mean_hourly[each_siteth - 1, each_yearth, :] + \
-				np.hstack((isolar_data.cselect_1site_1day(each_siteth, year_index[each_yearth], imonth_ploted, each_day - 1)[0, 16:24], \
-					isolar_data.cselect_1site_1day(each_siteth, year_index[each_yearth], imonth_ploted, each_day)[0, 0:16]))
-	wfc_ploted = np.mean(wfc_mean_hourly, axis=1) / 27.0
-	sfc_ploted = np.mean(sfc_mean_hourly, axis=1) / 27.0
+	monthth = iwind_data.month_name.index(imonth_ploted)
+	wfc_ploted = masw.cass_varws_diurnal(iwind_data, iutc_offset)[0][:, monthth, :]
+	sfc_ploted = masw.cass_varws_diurnal(isolar_data, iutc_offset)[0][:, monthth, :]
 	if plot_flag == True:
 		plt.rcParams['font.family'] = 'Times New Roman'
 		plt.figure(dpi=300)
@@ -259,16 +216,15 @@ def cass_single_site(iwind_data, isolar_data, isiteth=3, ikw=0.60, ikf=0.98, ikc
 		hfc_comp_profits: the comprehensive profit coefficient.
 	'''
 	matching_coef_opt = cass_configh(iwind_data, isolar_data, isiteth, False)
-	hfc_ramp_rate = cass_rampopt(iwind_data, isolar_data, matching_coef_opt, 3, False)
+	hfc_ramp_rate = cass_rampopt(iwind_data, isolar_data, matching_coef_opt, isiteth, False)
 	wfc_10years = iwind_data.cselect_1site_10year(isiteth)
 	sfc_10years = isolar_data.cselect_1site_10year(isiteth)
 	hfc_10years = wfc_10years * matching_coef_opt + (1 - matching_coef_opt) * sfc_10years
 	hfc_mean_yearly = np.sum(hfc_10years) / 10.0
 	hfc_mean_hourly = np.mean(hfc_10years)
 	hfc_std_hourly = np.std(hfc_10years)
-	hfc_varcoef_hourly = hfc_mean_hourly * 1.0 / hfc_std_hourly
-	hfc_half_prob = (hfc_10years[0, hfc_10years[0, :] > 0.5].shape[0]) / (hfc_10years.shape[1])
-	hfc_ramp_rate = cass_rampopt(wind_data, solar_data, matching_coef_opt, 3, False)
+	hfc_varcoef_hourly = hfc_std_hourly * 1.0 / hfc_mean_hourly
+	hfc_half_prob = (hfc_10years[0, hfc_10years[0, :] > 0.5].shape[0] * 1.0) / (hfc_10years.shape[1] * 1.0)
 	hfc_ramp_mean = np.mean(hfc_ramp_rate)
 	hfc_ramp_std = np.std(hfc_ramp_rate)
 	hfc_ramp_max = np.max(hfc_ramp_rate)
@@ -277,10 +233,10 @@ def cass_single_site(iwind_data, isolar_data, isiteth=3, ikw=0.60, ikf=0.98, ikc
 	hfc_ramp_lower = hfc_ramp_mean - 1.96 * hfc_ramp_std
 	wfc_mean_hourly = np.mean(wfc_10years)
 	wfc_std_hourly = np.std(wfc_10years)
-	wfc_varcoef_hourly = wfc_mean_hourly * 1.0 / wfc_std_hourly
+	wfc_varcoef_hourly = wfc_std_hourly * 1.0 / wfc_mean_hourly
 	sfc_mean_hourly = np.mean(sfc_10years)
 	sfc_std_hourly = np.std(sfc_10years)
-	sfc_varcoef_hourly = sfc_mean_hourly * 1.0 / sfc_std_hourly
+	sfc_varcoef_hourly = sfc_std_hourly * 1.0 / sfc_mean_hourly
 	improving_coef = 1 - hfc_varcoef_hourly / (matching_coef_opt * wfc_varcoef_hourly + \
 		(1 - matching_coef_opt)* sfc_varcoef_hourly)
 	norwfc_10years = preprocessing.scale(wfc_10years[0, :])
@@ -322,9 +278,6 @@ def cass_attr_constr(iwind_data, isolar_data, imode=0, ikw=0.60, ikf=0.98, ikc=-
 	Returns: 
 		the constructed attributes.
 	'''
-	wf_10yearstl = iwind_data.c2style_10year(True)
-	sf_10yearstl = isolar_data.c2style_10year(True)
-	hf_10yearstl = {}
 	site_num = len(iwind_data.site_index)
 	# year_index = range(iwind_data.start_year, iwind_data.end_year + 1)
 	# year_num = len(year_index)
@@ -332,42 +285,8 @@ def cass_attr_constr(iwind_data, isolar_data, imode=0, ikw=0.60, ikf=0.98, ikc=-
 	# interval = np.arange(0, 1.02, 0.02)
 	analy_results = np.zeros((1, site_num), np.float32)
 	for each_siteth in range(1, site_num + 1, 1):
-		(oindices0, oindices1, oindices2, oindices3, oindices4, oindices5, oindices6, oindices7, \
-			oindices8, oindices9, oindices10, oindices11, oindices12, oindices13, oindices14, oindices15) =\ 
-			cass_single_site(iwind_data, isolar_data, each_siteth, ikw, ikf, ikc, igama)
-		if imode == 0:
-			analy_results[0, each_siteth] = oidices0
-		elif imode == 1:
-			analy_results[0, each_siteth] = oidices1
-		elif imode == 2:
-			analy_results[0, each_siteth] = oidices2
-		elif imode == 3:
-			analy_results[0, each_siteth] = oidices3
-		elif imode == 4:
-			analy_results[0, each_siteth] = oidices4
-		elif imode == 5:
-			analy_results[0, each_siteth] = oidices5
-		elif imode == 6:
-			analy_results[0, each_siteth] = oidices6
-		elif imode == 7
-			analy_results[0, each_siteth] = oidices7
-		elif imode == 8:
-			analy_results[0, each_siteth] = oidices8
-		elif imode == 9:
-			analy_results[0, each_siteth] = oidices9
-		elif imode == 10:
-			analy_results[0, each_siteth] = oidices10
-		elif imode == 11:
-			analy_results[0, each_siteth] = oidices11
-		elif imode == 12:
-			analy_results[0, each_siteth] = oidices12
-		elif imode == 13:
-			analy_results[0, each_siteth] = oidices13
-		elif imode == 14:
-			analy_results[0, each_siteth] = oidices14
-		# elif imode == 15:
-		else:
-			analy_results[0, each_siteth] = oidices15
+		oindices = cass_single_site(iwind_data, isolar_data, each_siteth, ikw, ikf, ikc, igama)
+		analy_results[0, each_siteth - 1] = oindices[imode if 0 <= imode <= 14 else 15]
 	return analy_results
 
 
@@ -22,6 +22,38 @@ import init_nasa_wind as mwind
 import init_nasa_solar as msolar
 
 
+def cass_varws_allsites(isource_data, imode=True):
+	'''Assess annual and monthly variation of all sites at once.
+		The sums of each site, each month are reduced over the time axis in one pass, 
+		see init_time_axis.TimeAxis.creduce.
+	Args:
+		isource_data: the source data.
+		imode: True or False; capacity factors, or wind speed or solar irradiation.
+	Returns:
+		fc_sum_yearly: (site_num, year_num) sums of each year.
+		fc_mean_yearly: (site_num,) means of the yearly sums.
+		fc_std_yearly: (site_num,) std of the yearly sums.
+		fc_varcoef_yearly: (site_num,) variable coefficient of the yearly sums.
+		fc_sum_monthly: (site_num, 12, year_num) sums of each month, each year.
+		fc_mean_monthly: (site_num, 12) means of the monthly sums over the years.
+		fc_std_monthly: (site_num, 12) std of the monthly sums over the years.
+		fc_varcoef_monthly: (site_num, 12) variable coefficient of the monthly sums over the years.
+	'''
+	year_num = isource_data.end_year - isource_data.start_year + 1
+	month_sum = isource_data.creduce('year_month', imode, 'sum').reshape(-1, year_num, 12)
+	fc_sum_monthly = month_sum.transpose(0, 2, 1)
+	fc_sum_yearly = np.sum(month_sum, axis=2)
+	fc_mean_yearly = np.mean(fc_sum_yearly, axis=1)
+	fc_std_yearly = np.std(fc_sum_yearly, axis=1)
+	fc_mean_monthly = np.mean(fc_sum_monthly, axis=2)
+	fc_std_monthly = np.std(fc_sum_monthly, axis=2)
+	with np.errstate(divide='ignore', invalid='ignore'):
+		fc_varcoef_yearly = fc_std_yearly / fc_mean_yearly
+		fc_varcoef_monthly = fc_std_monthly / fc_mean_monthly
+	return fc_sum_yearly, fc_mean_yearly, fc_std_yearly, fc_varcoef_yearly, \
+		fc_sum_monthly, fc_mean_monthly, fc_std_monthly, fc_varcoef_monthly
+
+
 def cass_varws_annual(isource_data, isiteth_plotted=[1, 2, 3], plot_flag=False):
 	'''Assess annual variation of selected sites.
 		Output statistical indices and graphs 
@@ -36,20 +68,7 @@ def cass_varws_annual(isource_data, isiteth_plotted=[1, 2, 3], plot_flag=False):
 	year_index = range(isource_data.start_year, isource_data.end_year + 1)
 	year_num = len(year_index)
 	site_num = len(isource_data.site_index)
-	fc_sum_yearly = np.empty((site_num, year_num), np.float32)
-	fc_mean_yearly = np.empty((site_num, 1), np.float32)
-	fc_std_yearly = np.empty((site_num, 1), np.float32)
-	fc_varcoef_yearly = np.empty((site_num, 1), np.float32)
-	for each_siteth in range(1, site_num + 1):
-		for each_yearth in range(0, year_num, 1):
-			fc_sum_yearly[each_siteth - 1, each_yearth] = \
-			np.sum(isource_data.cselect_1site_1year(each_siteth, year_index[each_yearth]), axis=1)
-		fc_mean_yearly[each_siteth - 1, 0] = \
-		np.sum(isource_data.cselect_1site_10year(each_siteth), axis=1) / year_num
-		fc_std_yearly[each_siteth - 1, 0] = \
-		np.std(fc_sum_yearly[each_siteth - 1, :])
-		fc_varcoef_yearly[each_siteth - 1, 0] = \
-		fc_std_yearly[each_siteth - 1, 0] * 1.0 / fc_mean_yearly[each_siteth - 1, 0]
+	(fc_sum_yearly, fc_mean_yearly, fc_std_yearly, fc_varcoef_yearly) = cass_varws_allsites(isource_data)[:4]
 	if plot_flag == True:
 		plt.rcParams['font.family'] = 'Times New Roman'
 		plt.figure(dpi=300)
@@ -85,7 +104,7 @@ def cass_varws_annual(isource_data, isiteth_plotted=[1, 2, 3], plot_flag=False):
 		ositeth_plotted = [each - 1 for each in list(isiteth_plotted)]
 	else:
 		ositeth_plotted = isiteth_plotted - 1
-	return fc_mean_yearly[ositeth_plotted, 0], fc_std_yearly[ositeth_plotted, 0], fc_varcoef_yearly[ositeth_plotted, 0]
+	return fc_mean_yearly[ositeth_plotted], fc_std_yearly[ositeth_plotted], fc_varcoef_yearly[ositeth_plotted]
 
 
 def cass_varws_monthly(isource_data, isiteth_plotted=[1, 2, 3], iyear_plotted=2010, plot_flag=False):
@@ -98,28 +117,11 @@ def cass_varws_monthly(isource_data, isiteth_plotted=[1, 2, 3], iyear_plotted=20
 		plot_flag: True or False. Draw graphs or not.
 	Returns: 
 		the graphs of monthly variation.
+		means, std, and variable coefficient of selected site in month scale, (12,) of each site.
 	'''
-	year_index = range(isource_data.start_year, isource_data.end_year + 1)
-	year_num = len(year_index)
 	site_num = len(isource_data.site_index)
-	month_index = isource_data.month_name
-	fc_mean_monthly = np.empty((site_num, 12), np.float32)
-	fc_sum_monthly = np.empty((site_num, 12, year_num), np.float32)
-	fc_ploted = np.empty((site_num, 12), np.float32)
-	for each_siteth in range(1, site_num + 1):
-		for each_monthth in range(0, 12, 1):
-			for each_year in year_index:
-				fc_mean_monthly[each_siteth - 1, each_monthth] = \
-				fc_mean_monthly[each_siteth - 1, each_monthth] + \
-				np.sum(isource_data.cselect_1site_1month(each_siteth, each_year, month_index[each_monthth]), axis=1)
-				fc_mean_monthly[each_siteth - 1, each_monthth] = \
-				fc_mean_monthly[each_siteth - 1, each_monthth] * 1.0 / year_num
-				fc_sum_monthly[each_siteth - 1, each_monthth, each_year - isource_data.start_year] = \
-				np.sum(isource_data.cselect_1site_1month(each_siteth, each_year, month_index[each_monthth]), axis=1)
-	for each_plotsiteth in isiteth_plotted:
-		for each_monthth in range(0, 12, 1):
-			fc_ploted[each_plotsiteth - 1, each_monthth] = \
-			np.sum(isource_data.cselect_1site_1month(each_plotsiteth, iyear_plotted, month_index[each_monthth]), axis=1)
+	(fc_sum_monthly, fc_mean_monthly, fc_std_monthly, fc_varcoef_monthly) = cass_varws_allsites(isource_data)[4:]
+	fc_ploted = fc_sum_monthly[:, :, iyear_plotted - isource_data.start_year]
 	if plot_flag == True:
 		plt.rcParams['font.family'] = 'Times New Roman'
 		plt.figure(dpi=300)
@@ -151,9 +153,27 @@ def cass_varws_monthly(isource_data, isiteth_plotted=[1, 2, 3], iyear_plotted=20
 		plt.title('The monthly variation')
 		plt.show()
 		# plt.savefig('cPlotW1.png', dpi=300, bbox_inches='tight')
+	ositeth_plotted = [each - 1 for each in list(isiteth_plotted)]
+	return fc_mean_monthly[ositeth_plotted], fc_std_monthly[ositeth_plotted], fc_varcoef_monthly[ositeth_plotted]
 
 
-def cass_varws_hourly(isource_data, isiteth_plotted=[1, 2, 3], imonth_ploted='Apr', plot_flag=False):
+def cass_varws_diurnal(isource_data, iutc_offset=8, ipercentile=(5, 25, 50, 75, 95), imode=True):
+	'''Assess the diurnal variation of all sites, all months in local time.
+		see init_nasa_cube.NasaCube.cdiurnal; built once and kept by the NasaCube of the data.
+	Args:
+		isource_data: the source data.
+		iutc_offset: int; the hours of local time ahead of UTC, 8 for China.
+		ipercentile: the percentiles in [0, 100].
+		imode: True or False; capacity factors, or wind speed or solar irradiation.
+	Returns:
+		fc_mean_diurnal: (site_num, 12, 24) means of each site, each month, each local hour.
+		fc_std_diurnal: (site_num, 12, 24) std.
+		fc_percentile_diurnal: (site_num, 12, 24, percentile_num) percentiles.
+	'''
+	return isource_data.cdiurnal(iutc_offset, ipercentile, imode)
+
+
+def cass_varws_hourly(isource_data, isiteth_plotted=[1, 2, 3], imonth_ploted='Apr', plot_flag=False, iutc_offset=8):
 	'''Assess hourly variation of selected sites, selected month.
 		Output graphs 
 	Args:
@@ -161,21 +181,11 @@ def cass_varws_hourly(isource_data, isiteth_plotted=[1, 2, 3], imonth_ploted='Ap
 		isiteth_plotted: the serial number of selected site.
 		imonth_ploted: the selected month.
 		plot_flag: True or False. Draw graphs or not.
+		iutc_offset: int; the hours of local time ahead of UTC, 8 for China.
 	Returns: 
 		the graphs of monthly variation.
 	'''
-	year_index = range(isource_data.start_year, isource_data.end_year + 1)
-	year_num = len(year_index)
-	site_num = len(isource_data.site_index)
-	fc_mean_hourly = np.zeros((site_num, year_num, 24), np.float32)
-	for each_siteth in range(1, site_num + 1):
-		for each_yearth in range(0, year_num, 1):
-			for each_day in range(2, 29, 1):
-				fc_mean_hourly[each_siteth - 1, each_yearth, :] = \
-				fc_mean_hourly[each_siteth - 1, each_yearth, :] + \
-				np.hstack((isource_data.cselect_1site_1day(each_siteth,year_index[each_yearth], imonth_ploted,each_day-1)[0, 16:24], \
-					isource_data.cselect_1site_1day(each_siteth, year_index[each_yearth], imonth_ploted, each_day)[0, 0:16]))
-	fc_ploted = np.mean(fc_mean_hourly, axis=1) / 27.0
+	fc_ploted = cass_varws_diurnal(isource_data, iutc_offset)[0][:, isource_data.month_name.index(imonth_ploted), :]
 	if plot_flag == True:
 		plt.rcParams['font.family'] = 'Times New Roman'
 		plt.figure(dpi=300)
@@ -262,7 +272,7 @@ def cass_single_site(isource_data, isiteth=3):
 	fc_10years = isource_data.cselect_1site_10year(isiteth)
 	fc_mean_hourly = np.mean(fc_10years)
 	fc_std_hourly = np.std(fc_10years)
-	fc_varcoef_hourly = fc_mean_hourly * 1.0 / fc_std_hourly
+	fc_varcoef_hourly = fc_std_hourly * 1.0 / fc_mean_hourly
 	fc_half_prob = (fc_10years[0, fc_10years[0, :] > 0.5].shape[0] * 1.0)/ (fc_10years.shape[1] * 1.0)
 	fc_ramp_rate = cass_rampws(isource_data, isiteth, False)
 	fc_ramp_mean = np.mean(np.abs(fc_ramp_rate))
@@ -275,6 +285,71 @@ def cass_single_site(isource_data, isiteth=3):
 	fc_half_prob, fc_ramp_rate, fc_ramp_mean, fc_ramp_std, fc_ramp_max, fc_ramp_min, fc_ramp_upper, fc_ramp_lower
 
 
+def cass_single_sites(isource_data, isite_chunk=16, iramp_rate=True):
+	'''Assess all sites at once, see cass_single_site.
+		The (site_num, hour_num) capacity factors are scanned site chunk by site chunk, 
+		see WindData.cselect_range and SolarData.cselect_range.
+	Args:
+		isource_data: the source data.
+		isite_chunk: int; the number of sites assessed at a time.
+		iramp_rate: True or False; keep the ramp rate of each hour or not.
+	Returns: 
+		(site_num,) record array of siteth and the indices of cass_single_site, indexed by siteth - 1;
+		the field fc_ramp_rate is the (hour_num - 1,) ramp rate of each site, only if iramp_rate.
+	'''
+	time_axis = isource_data.ctime_axis()
+	site_num = len(isource_data.site_index)
+	names = ['fc_mean_yearly', 'fc_std_yearly', 'fc_varcoef_yearly', 'fc_mean_hourly', 'fc_std_hourly', 
+		'fc_varcoef_hourly', 'fc_half_prob', 'fc_ramp_mean', 'fc_ramp_std', 'fc_ramp_max', 'fc_ramp_min', 
+		'fc_ramp_upper', 'fc_ramp_lower']
+	dtype = [('siteth', np.int32)] + [(each, np.float64) for each in names]
+	if iramp_rate:
+		dtype.append(('fc_ramp_rate', np.float32, (time_axis.hour_num - 1,)))
+	oresult = np.recarray((site_num,), dtype)
+	oresult.siteth = np.arange(1, site_num + 1)
+	for each_start in range(0, site_num, isite_chunk):
+		each_end = min(each_start + isite_chunk, site_num)
+		sites = slice(each_start, each_end)
+		fc_10years = isource_data.cselect_range(list(range(each_start + 1, each_end + 1)))
+		fc_sum_yearly = time_axis.creduce(fc_10years, 'year', 'sum')
+		oresult.fc_mean_yearly[sites] = np.mean(fc_sum_yearly, axis=1)
+		oresult.fc_std_yearly[sites] = np.std(fc_sum_yearly, axis=1)
+		oresult.fc_mean_hourly[sites] = np.mean(fc_10years, axis=1, dtype=np.float64)
+		oresult.fc_std_hourly[sites] = np.std(fc_10years, axis=1, dtype=np.float64)
+		oresult.fc_half_prob[sites] = np.sum(fc_10years > 0.5, axis=1) * 1.0 / time_axis.hour_num
+		fc_ramp_rate = np.diff(fc_10years, axis=1)
+		if iramp_rate:
+			oresult.fc_ramp_rate[sites] = fc_ramp_rate
+		oresult.fc_ramp_std[sites] = np.std(fc_ramp_rate, axis=1, dtype=np.float64)
+		oresult.fc_ramp_max[sites] = np.max(fc_ramp_rate, axis=1)
+		oresult.fc_ramp_min[sites] = np.min(fc_ramp_rate, axis=1)
+		np.abs(fc_ramp_rate, fc_ramp_rate)
+		oresult.fc_ramp_mean[sites] = np.mean(fc_ramp_rate, axis=1, dtype=np.float64)
+	with np.errstate(divide='ignore', invalid='ignore'):
+		oresult.fc_varcoef_yearly = oresult.fc_std_yearly / oresult.fc_mean_yearly
+		oresult.fc_varcoef_hourly = oresult.fc_std_hourly / oresult.fc_mean_hourly
+	oresult.fc_ramp_upper = oresult.fc_ramp_mean + 1.96 * oresult.fc_ramp_std
+	oresult.fc_ramp_lower = oresult.fc_ramp_mean - 1.96 * oresult.fc_ramp_std
+	return oresult
+
+
+def cass_attr_all(isource_data):
+	'''Construct all attributes of cass_attr_constr at once.
+		The capacity factors are scanned once and the statistics are kept by the data, 
+		see init_nasa_cube.NasaCube.csite_stat.
+	Args:
+		isource_data: the source data.
+	Returns: 
+		(4, site_num) attributes; means in year scale, std in hour scale, variable coefficient in hour scale, 
+		means in hour scale.
+	'''
+	year_num = isource_data.end_year - isource_data.start_year + 1
+	(fc_sum, fc_mean_hourly, fc_std_hourly) = isource_data.csite_stat(True)
+	with np.errstate(divide='ignore', invalid='ignore'):
+		fc_varcoef_hourly = fc_std_hourly / fc_mean_hourly
+	return np.vstack((fc_sum / year_num, fc_std_hourly, fc_varcoef_hourly, fc_mean_hourly)).astype(np.float32)
+
+
 def cass_attr_constr(isource_data, imode=0):
 	'''Construct new attirbutes.
 		Output statistical indices 
@@ -282,36 +357,30 @@ def cass_attr_constr(isource_data, imode=0):
 		isource_data: the source data.
 		imode: 0, 1, 2, 3. means in year scale, std in hour scale, variable coefficient in hour scale, means in hour scale
 	Returns: 
-		the constructed attributes.
+		the constructed attributes, (1, site_num) row imode of cass_attr_all.
 	'''
-	cf_10yearstl = isource_data.c2style_10year(True)
-	year_index = range(isource_data.start_year, isource_data.end_year + 1)
-	year_num = len(year_index)
-	site_num = len(isource_data.site_index)
-	if imode == 0:
-		fc_mean_yearly = np.zeros((1, site_num), np.float32)
-		for each_siteth in range(1, site_num + 1, 1):
-			fc_mean_yearly[0, each_siteth-1] = \
-			np.sum(cf_10yearstl[each_siteth], axis=1) * 1.0 / year_num
-		return fc_mean_yearly
-	elif imode == 1:
-		fc_std_hourly = np.zeros((1, site_num), np.float32)
-		for each_siteth in range(1, site_num + 1, 1):
-			fc_std_hourly[0, each_siteth-1] = \
-			np.std(cf_10yearstl[each_siteth], axis=1) * 1.0
-		return fc_std_hourly
-	elif imode == 2:
-		fc_varcoef_hourly = np.zeros((1, site_num), np.float32)
-		for each_siteth in range(1, site_num + 1, 1):
-			fc_varcoef_hourly[0, each_siteth-1] = \
-			np.std(cf_10yearstl[each_siteth], axis=1) * 1.0 / np.mean(cf_10yearstl[each_siteth], axis=1)
-		return fc_varcoef_hourly
-	else:
-		fc_mean_hourly = np.zeros((1, site_num), np.float32)
-		for each_siteth in range(1, site_num + 1, 1):
-			fc_mean_hourly[0, each_siteth-1] = \
-			np.mean(cf_10yearstl[each_siteth], axis=1)
-		return fc_mean_hourly
+	if imode not in (0, 1, 2):
+		imode = 3
+	return cass_attr_all(isource_data)[imode:imode + 1, :]
+
+
+def cass_attr_turbines(isource_data, imode=0):
+	'''Construct new attirbutes of each WTGs of WindData.cturbines2cf.
+	Args:
+		isource_data: the source data, with the capacity factors of several WTGs.
+		imode: 0, 1, 2, 3. see cass_attr_constr.
+	Returns: 
+		the (turbine_num, site_num) constructed attributes.
+	'''
+	selected = (isource_data.dict_wind_cf, isource_data.dict_wind_cf0, isource_data.turbineth)
+	attr = []
+	try:
+		for each_turbineth in range(1, isource_data.turbine_cf.shape[0] + 1):
+			isource_data.cselect_turbine(each_turbineth)
+			attr.append(cass_attr_constr(isource_data, imode))
+	finally:
+		(isource_data.dict_wind_cf, isource_data.dict_wind_cf0, isource_data.turbineth) = selected
+	return np.vstack(attr)
 
 
 if __name__ == '__main__':
@@ -337,6 +406,7 @@ if __name__ == '__main__':
 	cass_varws_hourly(wind_data, [1,2,3], 'Apr', True)
 	fc_ramp_rate = cass_rampws(wind_data, 3, True)
 	assess_result = cass_single_site(wind_data, 3)
+	assess_results = cass_single_sites(wind_data)
 	attr = cass_attr_constr(wind_data, 0)
 
 
@@ -0,0 +1,82 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 23:02:16 2026
+########################################################################################
+# @ File name: init_calibration.py
+# @ Function: Calibration of the simulated capacity factors.
+# 	Fitting the correction factors of all sites against in-situ measured capacity factors at once,
+# 	per site and per month, by scaling or linear map.
+# @ Author: Yongji Cao, Hengxu Zhang
+# @ Version: 1.0
+# @ Revision date: Oct/18/2026
+# @ Copyright (c) 2016-2026 School of Electrical Engineering, Shandong University, China
+########################################################################################
+"""
+
+
+import numpy as np
+
+
+def cmonth_sum(icube):
+	'''Sum the data of each site, each month.
+	Args:
+		icube: the NasaCube.
+	Returns:
+		osum: (site_num, year_num, 12) sums of the hours of each month.
+		ohour_num: (year_num, 12) numbers of hours of each month.
+	'''
+	time_axis = icube.time_axis
+	osum = icube.creduce('year_month', 'sum').reshape(icube.site_num, time_axis.year_num, 12)
+	ohour_num = time_axis.ccount('year_month').reshape(time_axis.year_num, 12) * 1.0
+	return osum, ohour_num
+
+
+def cfit_factor(icube, iobserved, imode='scale'):
+	'''Fit the correction factors of all sites against in-situ measured capacity factors.
+		All sites and months are solved at once by the closed-form least squares over the years;
+		a site or month without a valid fit, e.g. not measured or all zeros, falls back to gain 1 and offset 0.
+	Args:
+		icube: the NasaCube of the uncorrected capacity factors.
+		iobserved: the measured average capacity factors, NaN if not measured;
+			(site_num, year_num, 12) of each month, or (site_num, year_num) of each year.
+		imode: 'scale' or 'linear'; fit observed = gain * simulated, or observed = gain * simulated + offset.
+	Returns:
+		ogain: (site_num, 12) gain of each site, each month; the same for all months if iobserved is annual.
+		ooffset: (site_num, 12) offset of each site, each month; zeros for 'scale'.
+		ofallback: (site_num, 12) True for the sites and months fallen back to gain 1 and offset 0.
+	'''
+	if imode not in ('scale', 'linear'):
+		raise ValueError('unknown calibration mode: %s' % imode)
+	observed = np.asarray(iobserved, np.float64)
+	(month_sum, hour_num) = cmonth_sum(icube)
+	if observed.shape == month_sum.shape:
+		simulated = month_sum / hour_num
+	elif observed.shape == month_sum.shape[:2]:
+		simulated = np.sum(month_sum, axis=2) / np.sum(hour_num, axis=1)
+	else:
+		raise ValueError('the shape of measured data %s does not match %s or %s' \
+			% (str(observed.shape), str(month_sum.shape), str(month_sum.shape[:2])))
+	weight = np.isfinite(observed)
+	observed = np.where(weight, observed, 0.0)
+	simulated = np.where(weight, simulated, 0.0)
+	count = np.sum(weight, axis=1)
+	with np.errstate(divide='ignore', invalid='ignore'):
+		if imode == 'scale':
+			ogain = np.sum(simulated * observed, axis=1) / np.sum(simulated ** 2, axis=1)
+			ooffset = np.zeros(ogain.shape)
+		else:
+			mean_sim = np.sum(simulated, axis=1) / count
+			mean_obs = np.sum(observed, axis=1) / count
+			dev_sim = np.where(weight, simulated - np.expand_dims(mean_sim, 1), 0.0)
+			dev_obs = np.where(weight, observed - np.expand_dims(mean_obs, 1), 0.0)
+			ogain = np.sum(dev_sim * dev_obs, axis=1) / np.sum(dev_sim ** 2, axis=1)
+			ooffset = mean_obs - ogain * mean_sim
+	ofallback = ~np.isfinite(ogain) | ~np.isfinite(ooffset)
+	ogain[ofallback] = 1.0
+	ooffset[ofallback] = 0.0
+	if ogain.ndim == 1:
+		ogain = np.repeat(ogain[:, np.newaxis], 12, axis=1)
+		ooffset = np.repeat(ooffset[:, np.newaxis], 12, axis=1)
+		ofallback = np.repeat(ofallback[:, np.newaxis], 12, axis=1)
+	return ogain, ooffset, ofallback
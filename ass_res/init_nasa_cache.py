@@ -0,0 +1,100 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 16:05:48 2026
+########################################################################################
+# @ File name: init_nasa_cache.py
+# @ Function: The on-disk cache of imported NASA data.
+# 	Saving and loading the decoded site data of a file sweep, checked against the daily files.
+# @ Author: Yongji Cao, Hengxu Zhang
+# @ Version: 1.0
+# @ Revision date: Oct/18/2026
+# @ Copyright (c) 2016-2026 School of Electrical Engineering, Shandong University, China
+########################################################################################
+"""
+
+
+import os
+import hashlib
+import numpy as np
+
+
+def ccache_file(icache_path, ifile_list, iimport_list):
+	'''Get the cache file of a file sweep.
+		The name is a hash of the data folders, the years, the data names and the site indice.
+	Args:
+		icache_path: str; the folder name of the cache files.
+		ifile_list: list of (year, month, day, file name) in calendar order.
+		iimport_list: list of (data names, list site indice) of each import.
+	Returns:
+		the cache file name.
+	'''
+	folders = sorted(set([os.path.dirname(os.path.abspath(each[3])) for each in ifile_list]))
+	key = repr((folders, ifile_list[0][:3], ifile_list[-1][:3], len(ifile_list), \
+		[(tuple(each[0]), [tuple(each_site) for each_site in each[1]]) for each in iimport_list]))
+	return os.path.join(icache_path, 'nasa_' + hashlib.sha1(key.encode('utf-8')).hexdigest() + '.npz')
+
+
+def cfile_stamp(ifile_list):
+	'''Get the size and modification time of the daily files.
+	Args:
+		ifile_list: list of (year, month, day, file name).
+	Returns:
+		(file_num, 2) array of size and mtime.
+	'''
+	ostamp = np.empty((len(ifile_list), 2), np.float64)
+	for each_fileth, each_file in enumerate(ifile_list):
+		stat = os.stat(each_file[3])
+		ostamp[each_fileth, 0] = stat.st_size
+		ostamp[each_fileth, 1] = stat.st_mtime
+	return ostamp
+
+
+def cload_cache(icache_file, ifile_list, iimport_list):
+	'''Load the decoded data of a file sweep.
+	Args:
+		icache_file: str; the cache file name, see ccache_file.
+		ifile_list: list of (year, month, day, file name).
+		iimport_list: list of (data names, list site indice) of each import.
+	Returns:
+		for each import, one (day_num, site_num, 24) array for each data name;
+		None if there is no cache or any daily file has changed.
+	'''
+	if not os.path.isfile(icache_file):
+		return None
+	try:
+		fid = np.load(icache_file)
+		try:
+			if not np.array_equal(fid['stamp'], cfile_stamp(ifile_list)):
+				return None
+			return [[fid['data_%d_%d' % (each_importth, each_nameth)] \
+				for each_nameth in range(len(each_import[0]))] \
+				for each_importth, each_import in enumerate(iimport_list)]
+		finally:
+			fid.close()
+	except (IOError, OSError, KeyError, ValueError):
+		return None
+
+
+def csave_cache(icache_file, ifile_list, idata):
+	'''Save the decoded data of a file sweep.
+	Args:
+		icache_file: str; the cache file name, see ccache_file.
+		ifile_list: list of (year, month, day, file name).
+		idata: for each import, one (day_num, site_num, 24) array for each data name.
+	Returns:
+		null.
+	'''
+	arrays = {'stamp': cfile_stamp(ifile_list)}
+	for each_importth, each_import in enumerate(idata):
+		for each_nameth, each_data in enumerate(each_import):
+			arrays['data_%d_%d' % (each_importth, each_nameth)] = each_data
+	cache_path = os.path.dirname(icache_file)
+	if cache_path and not os.path.isdir(cache_path):
+		os.makedirs(cache_path)
+	tmp_file = icache_file + '.tmp'
+	with open(tmp_file, 'wb') as fid:
+		np.savez(fid, **arrays)
+	if os.path.exists(icache_file):
+		os.remove(icache_file)
+	os.rename(tmp_file, icache_file)
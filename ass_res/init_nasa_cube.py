@@ -0,0 +1,577 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 14:20:37 2026
+########################################################################################
+# @ File name: init_nasa_cube.py
+# @ Function: The class of dense NASA data.
+# 	Preallocated (site x day x hour) array, accessed like the dict data of WindData and SolarData,
+# 	the scaled view of it, and its memory-mapped archive file.
+# @ Author: Yongji Cao, Hengxu Zhang
+# @ Version: 1.0
+# @ Revision date: Oct/18/2026
+# @ Copyright (c) 2016-2026 School of Electrical Engineering, Shandong University, China
+########################################################################################
+"""
+
+
+import json
+import struct
+import numpy as np
+
+import init_time_axis as mtime
+
+
+archive_magic = b'NASACUBE'
+style_depth = {'10year': 1, '1year': 2, '1month': 3}
+
+
+class NasaCube(object):
+	'''Dense NASA data class.
+		self.data is a float32 (site_num, day_num, 24) array of all days from the start year to the end year,
+		cube[siteth][year][month] is the (month days, 24) view of one site, one month.
+		The styles, climatology and statistics are kept by the object and cleared by cinvalidate, which cfill_day 
+		and cube[siteth][year][month] = value call; call cinvalidate after writing self.data directly, 
+		e.g. through an 'r+' memory-mapped archive, which cannot be intercepted.
+	'''
+	month_name = mtime.month_name
+
+	def __init__(self, isite_num, istart_year, iend_year, idata=None):
+		'''Create an object.
+		Args:
+			isite_num: int; the number of sites.
+			istart_year: int; the start year.
+			iend_year: int; the end year.
+			idata: (site_num, day_num, 24) array; the data, zeros by default.
+		Returns:
+			an instances
+		'''
+		self.site_num = isite_num
+		self.start_year = istart_year
+		self.end_year = iend_year
+		self.time_axis = mtime.ctime_axis(istart_year, iend_year)
+		self.month_offset = self.time_axis.month_offset
+		self.day_num = day_num = self.time_axis.day_num
+		if idata is None:
+			self.data = np.zeros((isite_num, day_num, 24), np.float32)
+		else:
+			if idata.shape != (isite_num, day_num, 24):
+				raise ValueError('the shape of data %s does not match (%d, %d, 24)' \
+					% (str(idata.shape), isite_num, day_num))
+			self.data = idata
+		self.revision = 0
+		self.style_cache = {}
+		self.diurnal_cache = {}
+		self.stat_cache = None
+
+	def cinvalidate(self):
+		'''Clear the styles, climatology and statistics kept by the object, after the data is changed.
+		Args:
+			null.
+		Returns:
+			null.
+		'''
+		self.revision += 1
+		self.style_cache = {}
+		self.diurnal_cache = {}
+		self.stat_cache = None
+
+	def ccheck_cache(self):
+		'''Clear the kept results if the stored data is changed; nothing to check for the NasaCube itself.'''
+		pass
+
+	def cday_index(self, iyear, imonth, iday):
+		'''Get the serial number of a day in self.data, see init_time_axis.TimeAxis.cday_index.'''
+		return self.time_axis.cday_index(iyear, imonth, iday)
+
+	def cfill_day(self, iyear, imonth, iday, iblock):
+		'''Write the data of one day of all sites.
+		Args:
+			iyear: the year.
+			imonth: the month.
+			iday: the day of the month.
+			iblock: (site_num, 24) array; the data of the day.
+		Returns:
+			null.
+		'''
+		self.data[:, self.cday_index(iyear, imonth, iday), :] = iblock
+		self.cinvalidate()
+
+	def cslice(self, isite, iday_s, iday_e):
+		'''Get the data of 1 site in a range of days.
+		Args:
+			isite: the index of site in self.data, siteth - 1; or a slice or an array of them, see csite_index.
+			iday_s: the index of the first day.
+			iday_e: the index after the last day.
+		Returns:
+			(day_num, 24) data, a view of self.data; (site_num, day_num, 24) for a slice or an array of sites.
+		'''
+		return self.data[isite, iday_s:iday_e, :]
+
+	def csite_index(self, isites=None):
+		'''Convert the serial numbers of sites to the index of self.data.
+		Args:
+			isites: list of the serial numbers of sites, None for all sites.
+		Returns:
+			a slice if the sites are evenly spaced in increasing order, otherwise an array.
+		'''
+		if isites is None:
+			return slice(0, self.site_num)
+		index = np.asarray(isites, np.intp).reshape(-1) - 1
+		if np.any(index < 0) or np.any(index >= self.site_num):
+			raise IndexError('the sites are out of 1-%d' % self.site_num)
+		if index.size == 1:
+			return slice(index[0], index[0] + 1)
+		step = np.diff(index)
+		if (index.size > 1) and (step[0] > 0) and np.all(step == step[0]):
+			return slice(index[0], index[-1] + 1, step[0])
+		return index
+
+	def cselect_range(self, isites=None, ihour_s=None, ihour_e=None):
+		'''Select the data of sites in a range of hours.
+			Only the selected days of self.data are touched, e.g. for memory-mapped data.
+		Args:
+			isites: list of the serial numbers of sites, None for all sites.
+			ihour_s: the first hour, a flat hour offset or a time, see init_time_axis.TimeAxis.chour_range; 
+				the first hour of the data by default.
+			ihour_e: the hour after the last hour, a flat hour offset or a time; the end of the data by default.
+		Returns:
+			(site_num, hour_num) data; a view of self.data if self.data is site-major and 
+			the sites are evenly spaced in increasing order.
+		'''
+		(hour_s, hour_e) = self.time_axis.chour_range(ihour_s, ihour_e)
+		day_s = hour_s // 24
+		day_e = max((hour_e + 23) // 24, day_s)
+		days = self.cslice(self.csite_index(isites), day_s, day_e)
+		return days.reshape(days.shape[0], -1)[:, hour_s - day_s * 24:hour_e - day_s * 24]
+
+	def cselect_site(self, isiteth, iyear=None, imonth=None):
+		'''Select the data of 1 site in 10 year, 1 year or 1 month style.
+			Only the selected part of self.data is touched, e.g. for memory-mapped data.
+		Args:
+			isiteth: the serial number of site.
+			iyear: the year, None for 10 year style.
+			imonth: the month, None for 1 year style.
+		Returns:
+			(1, hour_num) data of 1 site, a view if self.data is site-major.
+		'''
+		if iyear is None:
+			return self.cslice(isiteth - 1, 0, self.day_num).reshape(1, -1)
+		if imonth is None:
+			day_s = self.month_offset[(iyear, NasaCube.month_name[0])][0]
+			day_e = self.month_offset[(iyear, NasaCube.month_name[-1])][1]
+		else:
+			(day_s, day_e) = self.month_offset[(iyear, imonth)]
+		return self.cslice(isiteth - 1, day_s, day_e).reshape(1, -1)
+
+	def cstyle(self, istyle):
+		'''Get the data in 1 month, 1 year or 10 year style, see WindData.c2style_1month.
+			Each style is built once and kept by the object; its arrays are views of self.data 
+			if self.data is site-major, so they follow changes of self.data.
+		Args:
+			istyle: '1month', '1year' or '10year'.
+		Returns:
+			dict[siteth][year][month], dict[siteth][year] or dict[siteth] of (1, hour_num) data.
+		'''
+		self.ccheck_cache()
+		if istyle not in self.style_cache:
+			site_index = range(1, self.site_num + 1)
+			year_index = range(self.start_year, self.end_year + 1)
+			if istyle == '1month':
+				dict_data = dict([(each_siteth, dict([(each_year, dict([(each_month, \
+					self.cselect_site(each_siteth, each_year, each_month)) for each_month in NasaCube.month_name])) \
+					for each_year in year_index])) for each_siteth in site_index])
+			elif istyle == '1year':
+				dict_data = dict([(each_siteth, dict([(each_year, self.cselect_site(each_siteth, each_year)) \
+					for each_year in year_index])) for each_siteth in site_index])
+			elif istyle == '10year':
+				dict_data = dict([(each_siteth, self.cselect_site(each_siteth)) for each_siteth in site_index])
+			else:
+				raise ValueError('unknown style: %s' % istyle)
+			self.style_cache[istyle] = dict_data
+		return self.style_cache[istyle]
+
+	def creduce(self, igroup, ifunc='mean', isite_chunk=16):
+		'''Reduce the data of each site by time groups, see init_time_axis.TimeAxis.creduce.
+			self.data is scanned once, site chunk by site chunk.
+		Args:
+			igroup: the group name, see init_time_axis.TimeAxis.
+			ifunc: 'sum' or 'mean'.
+			isite_chunk: int; the number of sites scanned at a time.
+		Returns:
+			(site_num, group_num) float64 sums or means of each site, each group.
+		'''
+		oresult = np.empty((self.site_num, len(self.time_axis.ccount(igroup))))
+		for each_start in range(0, self.site_num, isite_chunk):
+			sites = slice(each_start, min(each_start + isite_chunk, self.site_num))
+			oresult[sites] = self.time_axis.creduce(self.cslice(sites, 0, self.day_num), igroup, ifunc)
+		return oresult
+
+	def cdiurnal(self, iutc_offset=8, ipercentile=(5, 25, 50, 75, 95), isite_chunk=16):
+		'''Get the climatology of each month, each hour of day in local time.
+			All complete local days of each month of all years are used; self.data is scanned once, 
+			site chunk by site chunk. Built once for each UTC offset and percentiles and kept by the object.
+		Args:
+			iutc_offset: int; the hours of local time ahead of UTC, e.g. 8 for UTC+8.
+			ipercentile: the percentiles in [0, 100].
+			isite_chunk: int; the number of sites scanned at a time.
+		Returns:
+			omean: (site_num, 12, 24) means of each site, each month, each local hour.
+			ostd: (site_num, 12, 24) std.
+			opercentile: (site_num, 12, 24, percentile_num) percentiles.
+		'''
+		key = (iutc_offset, tuple(ipercentile))
+		self.ccheck_cache()
+		if key not in self.diurnal_cache:
+			(day_s, day_e, hour_s) = self.time_axis.clocal_day(iutc_offset)
+			day_month = self.time_axis.day_month[day_s:day_e]
+			omean = np.empty((self.site_num, 12, 24))
+			ostd = np.empty((self.site_num, 12, 24))
+			opercentile = np.empty((self.site_num, 12, 24, len(ipercentile)))
+			for each_start in range(0, self.site_num, isite_chunk):
+				sites = slice(each_start, min(each_start + isite_chunk, self.site_num))
+				data = self.cslice(sites, 0, self.day_num)
+				local = data.reshape(data.shape[0], -1)[:, hour_s:hour_s + (day_e - day_s) * 24] \
+					.reshape(data.shape[0], day_e - day_s, 24)
+				for each_monthth in range(0, 12, 1):
+					month_data = local[:, day_month == each_monthth, :]
+					omean[sites, each_monthth, :] = np.mean(month_data, axis=1, dtype=np.float64)
+					ostd[sites, each_monthth, :] = np.std(month_data, axis=1, dtype=np.float64)
+					if len(ipercentile) > 0:
+						opercentile[sites, each_monthth, :, :] = \
+							np.moveaxis(np.percentile(month_data, ipercentile, axis=1), 0, -1)
+			self.diurnal_cache[key] = (omean, ostd, opercentile)
+		return self.diurnal_cache[key]
+
+	def csite_stat(self, isite_chunk=16):
+		'''Get the statistics of all hours of each site.
+			self.data is scanned once, site chunk by site chunk. Built once and kept by the object.
+		Args:
+			isite_chunk: int; the number of sites scanned at a time.
+		Returns:
+			osum: (site_num,) sums of all hours.
+			omean: (site_num,) means of all hours.
+			ostd: (site_num,) std of all hours.
+		'''
+		self.ccheck_cache()
+		if self.stat_cache is None:
+			osum = np.empty(self.site_num)
+			ostd = np.empty(self.site_num)
+			for each_start in range(0, self.site_num, isite_chunk):
+				sites = slice(each_start, min(each_start + isite_chunk, self.site_num))
+				data = self.cslice(sites, 0, self.day_num)
+				osum[sites] = np.sum(data, axis=(1, 2), dtype=np.float64)
+				ostd[sites] = np.std(data, axis=(1, 2), dtype=np.float64)
+			omean = osum / (self.day_num * 24)
+			self.stat_cache = (osum, omean, ostd)
+		return self.stat_cache
+
+	def cappend(self, icube):
+		'''Append the data of the following years.
+		Args:
+			icube: the NasaCube of the same sites, from self.end_year + 1.
+		Returns:
+			the NasaCube of all years; the data is copied once, self is not changed.
+		'''
+		if (icube.site_num != self.site_num) or (icube.start_year != self.end_year + 1):
+			raise ValueError('the data of %d sites from %d cannot be appended to the data of %d sites to %d' \
+				% (icube.site_num, icube.start_year, self.site_num, self.end_year))
+		return NasaCube(self.site_num, self.start_year, icube.end_year, \
+			np.concatenate((self.data, icube.data), axis=1))
+
+	def __len__(self):
+		return self.site_num
+
+	def __contains__(self, isiteth):
+		return 1 <= isiteth <= self.site_num
+
+	def keys(self):
+		return list(range(1, self.site_num + 1))
+
+	def __getitem__(self, isiteth):
+		if isiteth not in self:
+			raise KeyError(isiteth)
+		return CubeSite(self, isiteth)
+
+
+class ScaledCube(NasaCube):
+	'''Dense NASA data scaled on reading, e.g. the corrected capacity factors.
+		The data of the NasaCube is stored once and not changed; cube[siteth][year][month], cselect_site and 
+		cstyle scale only the selected part on each access and keep no scaled copy, creduce, cdiurnal and 
+		csite_stat scale one site chunk at a time. self.data scales all data into a new full-size array 
+		on each access, so use the methods above for large data.
+	'''
+
+	def __init__(self, icube, igain, ioffset=0):
+		'''Create an object.
+		Args:
+			icube: the NasaCube of the stored data.
+			igain: the scale; a scalar, a (site_num,) vector of each site, a (site_num, 12) array of each site, 
+				each month, or an array broadcastable to (site_num, day_num, 1).
+			ioffset: the offset added after scaling, the same shapes as igain; 
+				negative results are set to 0, as for capacity factors.
+		Returns:
+			an instances
+		'''
+		self.cube = icube
+		self.site_num = icube.site_num
+		self.start_year = icube.start_year
+		self.end_year = icube.end_year
+		self.time_axis = icube.time_axis
+		self.month_offset = icube.month_offset
+		self.day_num = icube.day_num
+		self.revision = 0
+		self.cube_revision = icube.revision
+		self.style_cache = {}
+		self.diurnal_cache = {}
+		self.stat_cache = None
+		self.gain = self.cexpand(igain)
+		self.offset = self.cexpand(ioffset)
+
+	def cexpand(self, ifactor):
+		'''Expand the factor of sites or months to the days.
+		Args:
+			ifactor: see igain of __init__.
+		Returns:
+			the scalar, or a (site_num, day_num, 1) float32 array, broadcast if possible.
+		'''
+		if np.ndim(ifactor) == 0:
+			return ifactor
+		factor = np.asarray(ifactor, np.float32)
+		if factor.ndim == 1:
+			factor = factor.reshape(-1, 1, 1)
+		elif factor.shape == (self.site_num, 12):
+			factor = factor[:, self.time_axis.day_month, np.newaxis]
+		return np.broadcast_to(factor, (self.site_num, self.day_num, 1))
+
+	def ccheck_cache(self):
+		'''Clear the kept results if the stored NasaCube is changed after they are built.'''
+		self.cube.ccheck_cache()
+		if self.cube_revision != self.cube.revision:
+			self.cinvalidate()
+			self.cube_revision = self.cube.revision
+
+	@property
+	def data(self):
+		'''The scaled data of all sites, all days; a new (site_num, day_num, 24) array on each access.'''
+		return self.cscale(self.cube.data, self.gain, self.offset)
+
+	def cscale(self, idata, igain, ioffset):
+		'''Scale the stored data.
+		Args:
+			idata: the stored data.
+			igain: the gain of idata.
+			ioffset: the offset of idata.
+		Returns:
+			the scaled data, a new array.
+		'''
+		odata = idata * igain
+		if (np.ndim(ioffset) > 0) or (ioffset != 0):
+			odata += ioffset
+			np.maximum(odata, 0, odata)
+		return odata
+
+	def cslice(self, isite, iday_s, iday_e):
+		'''Get the scaled data of sites in a range of days, see NasaCube.cslice.'''
+		factor = [each if np.ndim(each) == 0 else each[isite, iday_s:iday_e] for each in (self.gain, self.offset)]
+		return self.cscale(self.cube.cslice(isite, iday_s, iday_e), factor[0], factor[1])
+
+	def cstyle(self, istyle):
+		'''Get the scaled data in 1 month, 1 year or 10 year style, see NasaCube.cstyle.
+			Nothing is built or kept; each array is scaled from the stored data on access, see StyleView.
+		Args:
+			istyle: '1month', '1year' or '10year'.
+		Returns:
+			the StyleView, accessed as dict[siteth][year][month], dict[siteth][year] or dict[siteth].
+		'''
+		if istyle not in style_depth:
+			raise ValueError('unknown style: %s' % istyle)
+		return StyleView(self, style_depth[istyle])
+
+	def cfill_day(self, iyear, imonth, iday, iblock):
+		raise TypeError('the scaled data is read-only, fill the stored NasaCube')
+
+
+class StyleView(object):
+	'''The data in 1 month, 1 year or 10 year style selected on access, view[siteth][year][month].
+		Each array is cselect_site of the cube on each access, e.g. scaled by a ScaledCube, and not kept.
+	'''
+
+	def __init__(self, icube, idepth, ikey=()):
+		'''Create an object.
+		Args:
+			icube: the NasaCube or ScaledCube.
+			idepth: int; 1, 2 or 3 for 10 year, 1 year or 1 month style.
+			ikey: tuple; the siteth and year selected by the upper levels.
+		Returns:
+			an instances
+		'''
+		self.cube = icube
+		self.depth = idepth
+		self.key = ikey
+
+	def keys(self):
+		if len(self.key) == 0:
+			return list(range(1, self.cube.site_num + 1))
+		elif len(self.key) == 1:
+			return list(range(self.cube.start_year, self.cube.end_year + 1))
+		return list(NasaCube.month_name)
+
+	def __contains__(self, ikey):
+		return ikey in self.keys()
+
+	def __iter__(self):
+		return iter(self.keys())
+
+	def __len__(self):
+		return len(self.keys())
+
+	def __getitem__(self, ikey):
+		if ikey not in self:
+			raise KeyError(ikey)
+		key = self.key + (ikey,)
+		if len(key) == self.depth:
+			return self.cube.cselect_site(*key)
+		return StyleView(self.cube, self.depth, key)
+
+
+class CubeSite(object):
+	'''One site of the dense NASA data, cube[siteth].'''
+
+	def __init__(self, icube, isiteth):
+		self.cube = icube
+		self.siteth = isiteth
+
+	def __contains__(self, iyear):
+		return self.cube.start_year <= iyear <= self.cube.end_year
+
+	def keys(self):
+		return list(range(self.cube.start_year, self.cube.end_year + 1))
+
+	def __getitem__(self, iyear):
+		if iyear not in self:
+			raise KeyError(iyear)
+		return CubeYear(self.cube, self.siteth, iyear)
+
+
+class CubeYear(object):
+	'''One site, one year of the dense NASA data, cube[siteth][year].'''
+
+	def __init__(self, icube, isiteth, iyear):
+		self.cube = icube
+		self.siteth = isiteth
+		self.year = iyear
+
+	def __contains__(self, imonth):
+		return imonth in NasaCube.month_name
+
+	def keys(self):
+		return list(NasaCube.month_name)
+
+	def __getitem__(self, imonth):
+		(day_s, day_e) = self.cube.month_offset[(self.year, imonth)]
+		return self.cube.cslice(self.siteth - 1, day_s, day_e)
+
+	def __setitem__(self, imonth, ivalue):
+		(day_s, day_e) = self.cube.month_offset[(self.year, imonth)]
+		self.cube.data[self.siteth - 1, day_s:day_e, :] = ivalue
+		self.cube.cinvalidate()
+
+
+def cto_cube(idict_data, isite_num, istart_year, iend_year):
+	'''Convert the dict data of WindData and SolarData to the dense NASA data.
+	Args:
+		idict_data: dict[siteth][year][month] of (day_num, 24) arrays, or a NasaCube.
+		isite_num: int; the number of sites.
+		istart_year: int; the start year.
+		iend_year: int; the end year.
+	Returns:
+		the NasaCube, idict_data itself if it is a NasaCube.
+	'''
+	if isinstance(idict_data, NasaCube):
+		return idict_data
+	ocube = NasaCube(isite_num, istart_year, iend_year)
+	for each_siteth in range(1, isite_num + 1):
+		for each_year in range(istart_year, iend_year + 1):
+			for each_month in NasaCube.month_name:
+				ocube[each_siteth][each_year][each_month] = idict_data[each_siteth][each_year][each_month]
+	return ocube
+
+
+def cappend_years(idata, inew_data, istart_year, iend_year):
+	'''Append the data of the following years to the dict data or the dense NASA data.
+	Args:
+		idata: dict[siteth][year][month] of (day_num, 24) arrays, or a NasaCube.
+		inew_data: the data of the following years, dict data or a NasaCube.
+		istart_year: int; the start year of inew_data.
+		iend_year: int; the end year of inew_data.
+	Returns:
+		the data of all years; a new NasaCube, or idata with the new years added.
+	'''
+	if isinstance(idata, NasaCube):
+		return idata.cappend(cto_cube(inew_data, idata.site_num, istart_year, iend_year))
+	for each_siteth in idata.keys():
+		for each_year in range(istart_year, iend_year + 1):
+			idata[each_siteth][each_year] = dict([(each_month, inew_data[each_siteth][each_year][each_month]) \
+				for each_month in NasaCube.month_name])
+	return idata
+
+
+def csave_archive(icube, ifile_name, ilayout='site', iinfo=None):
+	'''Save the dense NASA data to an archive file for memory mapping.
+		The file is the magic, the header length, a JSON header and the raw little-endian float32 data.
+	Args:
+		icube: the NasaCube.
+		ifile_name: str; the archive file name.
+		ilayout: 'site' or 'time'; site-major (site, day, hour) layout for reading few sites, 
+			or time-major (day, hour, site) layout for reading few days.
+		iinfo: dict; other metadata of the header, e.g. the product, unit and list site indice.
+	Returns:
+		null.
+	'''
+	if ilayout not in ('site', 'time'):
+		raise ValueError('unknown layout: %s' % ilayout)
+	header = {}
+	if iinfo is not None:
+		header.update(iinfo)
+	header.update({'version': 1, 'layout': ilayout, 'dtype': '<f4', 'site_num': icube.site_num, 
+		'day_num': icube.day_num, 'start_year': icube.start_year, 'end_year': icube.end_year})
+	text = json.dumps(header, sort_keys=True).encode('utf-8')
+	head_len = (len(archive_magic) + 4 + len(text) + 63) // 64 * 64
+	with open(ifile_name, 'wb') as fid:
+		fid.write(archive_magic)
+		fid.write(struct.pack('<I', head_len))
+		fid.write(text.ljust(head_len - len(archive_magic) - 4, b' '))
+		if ilayout == 'site':
+			for each_site in range(icube.site_num):
+				np.ascontiguousarray(icube.cslice(each_site, 0, icube.day_num), '<f4').tofile(fid)
+		else:
+			for each_dayth in range(icube.day_num):
+				np.ascontiguousarray(icube.cslice(slice(0, icube.site_num), each_dayth, each_dayth + 1)[:, 0, :].T, \
+					'<f4').tofile(fid)
+
+
+def cload_archive(ifile_name, imode='r'):
+	'''Load the dense NASA data from an archive file by memory mapping.
+		Several processes opening the same file share its pages.
+	Args:
+		ifile_name: str; the archive file name, see csave_archive.
+		imode: 'r', 'r+' or 'c'; the mode of numpy.memmap. Writing the data of 'r+' or 'c' directly 
+			is not seen by the NasaCube, call its cinvalidate afterwards.
+	Returns:
+		ocube: the NasaCube of memory-mapped data.
+		header: dict; the metadata of the archive.
+	'''
+	with open(ifile_name, 'rb') as fid:
+		if fid.read(len(archive_magic)) != archive_magic:
+			raise ValueError('not a NASA archive file: %s' % ifile_name)
+		head_len = struct.unpack('<I', fid.read(4))[0]
+		header = json.loads(fid.read(head_len - len(archive_magic) - 4).decode('utf-8'))
+	if header['layout'] == 'site':
+		data = np.memmap(ifile_name, header['dtype'], imode, head_len, \
+			(header['site_num'], header['day_num'], 24))
+	else:
+		data = np.memmap(ifile_name, header['dtype'], imode, head_len, \
+			(header['day_num'], 24, header['site_num'])).transpose(2, 0, 1)
+	ocube = NasaCube(header['site_num'], header['start_year'], header['end_year'], data)
+	return ocube, header
@@ -0,0 +1,233 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 10:12:05 2026
+########################################################################################
+# @ File name: init_nasa_hdf.py
+# @ Function: Reading of the daily NASA files.
+# 	Serial or process-pool reading of the selected sites from the daily HDF files, 
+# 	several data names and data objects in one sweep, and streaming with background prefetch.
+# @ Author: Yongji Cao, Hengxu Zhang
+# @ Version: 1.0
+# @ Revision date: Oct/18/2026
+# @ Copyright (c) 2016-2026 School of Electrical Engineering, Shandong University, China
+########################################################################################
+"""
+
+
+import threading
+import numpy as np
+from collections import deque
+from multiprocessing import Pool
+from multiprocessing.pool import ThreadPool
+from pyhdf.SD import SD
+
+import init_nasa_cache as mcache
+
+
+hdf_lock = threading.Lock()
+
+
+def csite_array(isite_index):
+	'''Convert the list site indice to index arrays.
+	Args:
+		isite_index: list; the list site indice in NASA file.
+	Returns:
+		the arrays of the first and the second indices.
+	'''
+	site_array = np.array(isite_index, np.intp).reshape(-1, 2)
+	return site_array[:, 0].copy(), site_array[:, 1].copy()
+
+
+def cread_window(ifid, idata_name, isite_arrays, ihyperslab=False):
+	'''Read one data name of a daily NASA file.
+	Args:
+		ifid: the opened NASA file.
+		idata_name: the data name.
+		isite_arrays: list of the index arrays of sites of each import needing the data name.
+		ihyperslab: True or False; read only the bounding window of the sites, or the full data.
+	Returns:
+		odata: the (hour, lat, lon) data read.
+		ofirst: the first row and column of the window.
+		odims: the row and column numbers of the full data, None for the full data.
+	'''
+	sds = ifid.select(idata_name)
+	if not ihyperslab:
+		return sds[:, :, :], (0, 0), None
+	dims = sds.info()[2]
+	rows = np.concatenate([each[0] for each in isite_arrays]) % dims[1]
+	cols = np.concatenate([each[1] for each in isite_arrays]) % dims[2]
+	odata = sds[:, rows.min():rows.max() + 1, cols.min():cols.max() + 1]
+	return odata, (rows.min(), cols.min()), (dims[1], dims[2])
+
+
+def cread_day(iargs):
+	'''Read the selected sites from one daily NASA file.
+		Each data name is selected from the file only once, even if several imports need it,
+		and all sites are gathered at once.
+	Args:
+		iargs: tuple; the file name, the list of (data names, index arrays of sites) of each import, 
+			see csite_array, and the hyperslab flag, see cread_window.
+	Returns:
+		oblocks: list; for each import, one (site_num, 24) array for each data name.
+	'''
+	(fname, iimport_list, ihyperslab) = iargs
+	fid = SD(fname)
+	tmp = {}
+	oblocks = []
+	for (each_names, (each_rows, each_cols)) in iimport_list:
+		oblock = []
+		for each_name in each_names:
+			if each_name not in tmp:
+				tmp[each_name] = cread_window(fid, each_name, \
+					[each[1] for each in iimport_list if each_name in each[0]], ihyperslab)
+			(data, first, dims) = tmp[each_name]
+			if dims is None:
+				oblock.append(data[:, each_rows, each_cols].T)
+			else:
+				oblock.append(data[:, each_rows % dims[0] - first[0], each_cols % dims[1] - first[1]].T)
+		oblocks.append(oblock)
+	fid.end()
+	return oblocks
+
+
+def cread_days(ifile_names, iimport_list, iprocess_num=1, ichunk_size=8, ihyperslab=False):
+	'''Read the selected sites from the daily NASA files.
+		The blocks are yielded in the order of ifile_names, whatever the number of processes.
+	Args:
+		ifile_names: list; the daily file names in calendar order.
+		iimport_list: list of (data names, index arrays of sites) of each import, see csite_array.
+		iprocess_num: int; the number of worker processes, 1 for serial reading.
+		ichunk_size: int; the number of days sent to a worker at a time.
+		ihyperslab: True or False; read only the bounding window of the sites, see cread_window.
+	Returns:
+		a generator of the blocks of each day, see cread_day.
+	'''
+	args = [(fname, iimport_list, ihyperslab) for fname in ifile_names]
+	if iprocess_num <= 1:
+		for each_arg in args:
+			yield cread_day(each_arg)
+	else:
+		pool = Pool(iprocess_num)
+		try:
+			for each_block in pool.imap(cread_day, args, ichunk_size):
+				yield each_block
+		finally:
+			pool.terminate()
+			pool.join()
+
+
+def cimport_sweep(ifile_list, iimport_items, iprocess_num=1, ihyperslab=False, icache_path=None):
+	'''Import several data names into several data objects in one sweep over the daily NASA files.
+		Each daily file is opened once, e.g. the slv_Nx files for both the wind speed of 
+		WindData and the ambient temperature of SolarData.
+	Args:
+		ifile_list: list of (year, month, day, file name) in calendar order, see WindData.cfile_list.
+		iimport_items: list of (data names, list site indice, receiver) of each import, 
+			see WindData.cimport_item; the receiver is called as receiver(year, month, day, block).
+		iprocess_num: int; the number of worker processes, 1 for serial reading.
+		ihyperslab: True or False; read only the bounding window of the sites, see cread_window.
+		icache_path: str; the folder name of the cache files, see init_nasa_cache; None for no cache.
+	Returns:
+		null.
+	'''
+	if icache_path is not None:
+		cache_file = mcache.ccache_file(icache_path, ifile_list, iimport_items)
+		cache_data = mcache.cload_cache(cache_file, ifile_list, iimport_items)
+		if cache_data is not None:
+			for each_dayth, (each_year, each_month, each_day, fname) in enumerate(ifile_list):
+				for each_item, each_data in zip(iimport_items, cache_data):
+					each_item[2](each_year, each_month, each_day, [each[each_dayth] for each in each_data])
+			return
+		cache_data = [[np.empty((len(ifile_list), len(each[1]), 24), np.float32) for each_name in each[0]] \
+			for each in iimport_items]
+	import_list = [(tuple(each[0]), csite_array(each[1])) for each in iimport_items]
+	day_blocks = cread_days([each[3] for each in ifile_list], import_list, iprocess_num, ihyperslab=ihyperslab)
+	for each_dayth, oblocks in enumerate(day_blocks):
+		(each_year, each_month, each_day, fname) = ifile_list[each_dayth]
+		print(fname)
+		for each_itemth, (each_item, each_block) in enumerate(zip(iimport_items, oblocks)):
+			each_item[2](each_year, each_month, each_day, each_block)
+			if icache_path is not None:
+				for each_data, each_name_block in zip(cache_data[each_itemth], each_block):
+					each_data[each_dayth] = each_name_block
+	if icache_path is not None:
+		mcache.csave_cache(cache_file, ifile_list, cache_data)
+
+
+def cprefetch_day(iargs):
+	'''Read the selected sites from one daily NASA file on a background thread.
+		The file is first read through without the lock, fetching it from the (network) disk in parallel, 
+		then decoded under hdf_lock as the HDF4 library is not thread-safe.
+	Args:
+		iargs: tuple; see cread_day.
+	Returns:
+		oblocks: see cread_day.
+	'''
+	with open(iargs[0], 'rb') as fid:
+		while fid.read(1 << 20):
+			pass
+	with hdf_lock:
+		return cread_day(iargs)
+
+
+def cstream_days(ifile_list, iimport_items, iprefetch_num=4, ithread_num=2, ihyperslab=False):
+	'''Stream the selected sites of the daily NASA files in calendar order.
+		At most iprefetch_num upcoming files are read on background threads while the current day is processed, 
+		so the memory is bounded whatever the number of years.
+	Args:
+		ifile_list: list of (year, month, day, file name) in calendar order, see WindData.cfile_list.
+		iimport_items: list of (data names, list site indice) of each import.
+		iprefetch_num: int; the number of days read ahead.
+		ithread_num: int; the number of background threads.
+		ihyperslab: True or False; read only the bounding window of the sites, see cread_window.
+	Returns:
+		a generator of (year, month, day, blocks), see cread_day for the blocks.
+	'''
+	import_list = [(tuple(each[0]), csite_array(each[1])) for each in iimport_items]
+	pool = ThreadPool(ithread_num)
+	pending = deque()
+	try:
+		for each_file in ifile_list:
+			pending.append((each_file, pool.apply_async(cprefetch_day, ((each_file[3], import_list, ihyperslab),))))
+			if len(pending) > iprefetch_num:
+				(done_file, result) = pending.popleft()
+				yield done_file[:3] + (result.get(),)
+		while pending:
+			(done_file, result) = pending.popleft()
+			yield done_file[:3] + (result.get(),)
+	finally:
+		pool.terminate()
+		pool.join()
+
+
+def cstream_months(ifile_list, iimport_items, iprefetch_num=4, ithread_num=2, ihyperslab=False):
+	'''Stream the selected sites of the daily NASA files month by month in calendar order.
+	Args:
+		see cstream_days.
+	Returns:
+		a generator of (year, month, blocks); for each import, one (site_num, day_num, 24) array for each data name.
+	'''
+	month_key = None
+	day_blocks = []
+	for (each_year, each_month, each_day, oblocks) in \
+		cstream_days(ifile_list, iimport_items, iprefetch_num, ithread_num, ihyperslab):
+		if (month_key != (each_year, each_month)) and day_blocks:
+			yield month_key + (cstack_days(day_blocks),)
+			day_blocks = []
+		month_key = (each_year, each_month)
+		day_blocks.append(oblocks)
+	if day_blocks:
+		yield month_key + (cstack_days(day_blocks),)
+
+
+def cstack_days(iday_blocks):
+	'''Stack the blocks of several days.
+	Args:
+		iday_blocks: list of the blocks of each day, see cread_day.
+	Returns:
+		for each import, one (site_num, day_num, 24) array for each data name.
+	'''
+	return [[np.stack([each_day[each_importth][each_nameth] for each_day in iday_blocks], axis=1) \
+		for each_nameth in range(len(iday_blocks[0][each_importth]))] \
+		for each_importth in range(len(iday_blocks[0]))]
@@ -0,0 +1,102 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 19:41:12 2026
+########################################################################################
+# @ File name: init_nasa_manifest.py
+# @ Function: The class of the manifest of NASA files.
+# 	Scanning a data folder once and listing the daily files in calendar order, checked for gaps.
+# @ Author: Yongji Cao, Hengxu Zhang
+# @ Version: 1.0
+# @ Revision date: Oct/18/2026
+# @ Copyright (c) 2016-2026 School of Electrical Engineering, Shandong University, China
+########################################################################################
+"""
+
+
+import os
+import re
+import datetime
+
+import init_nasa_cube as mcube
+
+
+prefix_pattern = r'(MERRA\d+)\.prod\.assim\.(tavg1_2d_[a-z]+_Nx)\.'
+fname_pattern = re.compile(r'^' + prefix_pattern + r'(\d{4})(\d{2})(\d{2})\.SUB\.hdf$')
+
+
+def cparse_prefix(iprefix):
+	'''Parse the middle name of NASA files, e.g. WindData.fnamesa.
+	Args:
+		iprefix: str; the middle name.
+	Returns:
+		the product stream and the collection, e.g. ('MERRA301', 'tavg1_2d_slv_Nx').
+	'''
+	match = re.search(prefix_pattern, iprefix)
+	if match is None:
+		raise ValueError('not a middle name of NASA files: %s' % iprefix)
+	return match.groups()
+
+
+class NasaManifest(object):
+	'''Manifest of the daily NASA files of a data folder.
+		The same manifest can be used for wind, solar and temperature imports of the folder.
+	'''
+
+	def __init__(self, ifile_path, isubstitute=False):
+		'''Scan the data folder.
+		Args:
+			ifile_path: str; the folder name of NASA file.
+			isubstitute: True or False; use the file of another product stream of the same day if the file of 
+				the expected stream is missing, each substitution is printed; a missing file by default.
+		Returns:
+			an instances
+		'''
+		self.file_path = ifile_path
+		self.substitute = isubstitute
+		self.files = {}
+		for each_name in sorted(os.listdir(ifile_path)):
+			match = fname_pattern.match(each_name)
+			if match is None:
+				continue
+			(stream, collection, year, month, day) = match.groups()
+			self.files.setdefault((collection, int(year), int(month), int(day)), {})[stream] = \
+			ifile_path + '/' + each_name
+
+	def cfile_list(self, istart_year, iend_year, iprefix_rule):
+		'''List the daily NASA files in calendar order.
+			Missing days, or days of other product streams only unless self.substitute, are reported 
+			before any file is read.
+		Args:
+			istart_year: int; the start year.
+			iend_year: int; the end year.
+			iprefix_rule: the function giving the middle name of the files of (year, month), e.g. WindData.cfname_prefix;
+				its collection selects the files, its product stream selects the file of a day.
+		Returns:
+			ofile_list: list of (year, month, day, file name).
+		'''
+		ofile_list = []
+		missing = []
+		first_day = datetime.date(istart_year, 1, 1).toordinal()
+		last_day = datetime.date(iend_year, 12, 31).toordinal()
+		for each_ordinal in range(first_day, last_day + 1):
+			each_date = datetime.date.fromordinal(each_ordinal)
+			each_month = mcube.NasaCube.month_name[each_date.month - 1]
+			(stream, collection) = cparse_prefix(iprefix_rule(each_date.year, each_month))
+			streams = self.files.get((collection, each_date.year, each_date.month, each_date.day), {})
+			if stream in streams:
+				fname = streams[stream]
+			elif streams and self.substitute:
+				fname = streams[max(streams.keys())]
+				print('%s of %s is missing, substituted by %s' % (stream, each_date.isoformat(), fname))
+			elif streams:
+				missing.append('%s (%s only)' % (each_date.isoformat(), ', '.join(sorted(streams.keys()))))
+				continue
+			else:
+				missing.append(each_date.isoformat())
+				continue
+			ofile_list.append((each_date.year, each_month, each_date.day, fname))
+		if missing:
+			raise IOError('%d daily files of %s are missing in %s: %s%s' % (len(missing), collection, \
+				self.file_path, ', '.join(missing[:10]), ', ...' if len(missing) > 10 else ''))
+		return ofile_list
@@ -15,22 +15,20 @@ Created on Thu Jun 08 21:53:47 2017
 
 
 import numpy as np
-from pyhdf.SD import SD
+
+import init_nasa_hdf as mhdf
+import init_nasa_cube as mcube
+import init_time_axis as mtime
+import init_nasa_manifest as mmanifest
+import init_calibration as mcal
+import init_pv_model as mpv
+import init_solar_position as mposition
 
 
 class SolarData(object):
 	'''NASA solar irradiation data class'''
 	version = '1.0'
-	month_name = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
-		'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
-	leap_year = {'Jan': (31, 101, 131, True), 'Feb': (29, 201, 229, True), 'Mar': (31, 301, 331, True), 
-	'Apr': (30, 401, 430, True), 'May': (31, 501, 531, True), 'Jun': (30, 601, 630, True), 
-	'Jul': (31, 701, 731, True), 'Aug': (31, 801, 831, True), 'Sep': (30, 901, 930, True), 
-	'Oct': (31, 1001, 1031, False), 'Nov':(30, 1101, 1130, False), 'Dec':(31, 1201, 1231, False)}
-	nonleap_year = {'Jan':(31, 101, 131, True), 'Feb':(28, 201, 228, True), 'Mar':(31, 301, 331, True), 
-	'Apr': (30, 401, 430, True), 'May': (31, 501, 531, True), 'Jun': (30, 601, 630, True), 'Jul': (31, 701, 731, True), 
-	'Aug': (31, 801, 831, True), 'Sep': (30, 901, 930, True), 'Oct': (31, 1001, 1031, False), 
-	'Nov': (30, 1101, 1130, False), 'Dec': (31, 1201, 1231, False)}
+	month_name = mtime.month_name
 	#fnamesa and fnamsb are the middle names of sloar irrdiation.
 	fnamesa = '/MERRA301.prod.assim.tavg1_2d_rad_Nx.'
 	fnamesb = '/MERRA300.prod.assim.tavg1_2d_rad_Nx.'
@@ -39,14 +37,18 @@ class SolarData(object):
 	fnameta = '/MERRA301.prod.assim.tavg1_2d_slv_Nx.'
 	fnametb = '/MERRA300.prod.assim.tavg1_2d_slv_Nx.'
 	spl_month2010 = ('Jun', 'Jul', 'Aug')
+	product_unit = {'solar': 'W/m2', 'poa': 'W/m2', 'solar_cf': 'p.u.', 'solar_cf0': 'p.u.', 'temperature': 'K'}
 
-	def __init__(self, ifile_path, isite_index, istart_year, iend_year):
+	def __init__(self, ifile_path, isite_index, istart_year, iend_year, ifile_patht=None, isite_indext=None):
 		'''Create an object. 
 		Args:
 			ifile_name: str; the folder name of NASA file.
 			isite_index: list; the list site indice in NASA file.
 			istart_year: int; the start year.
 			iend_year: inlt; the end year.
+			ifile_patht: str; the folder name of NASA file of ambient temperature (slv_Nx files).
+			isite_indext: list; the list site indice in NASA file of ambient temperature, 
+				isite_index by default.
 		Returns:
 			an instances
 		'''
@@ -54,176 +56,288 @@ class SolarData(object):
 		self.site_index = isite_index
 		self.start_year = istart_year
 		self.end_year = iend_year
+		self.file_patht = ifile_patht
+		if isite_indext is None:
+			self.site_indext = isite_index
+		else:
+			self.site_indext = isite_indext
 		self.dict_solar = {}
 		self.dict_solar_cf = {}
-		self.dict_wind_cf0 = {}
+		self.dict_solar_cf0 = {}
 		self.dict_temperature = {}
+		self.dict_poa = {}
+		self.poa_param = None
+		self.dict_field = {}
 		self.alpha = 1
+		self.offset = 0
+		self.cal_fallback = None
+		self.data_name = ('SWGNT',)
+		self.data_namet = ('TS',)
+		self.cf_model = None
+		self.module_cf = None
+		self.module_param = None
+		self.moduleth = None
 
-	def cimport_data(self, idata_name=('SWGNT',)):
+	def cfname_prefix(self, iyear, imonth, itemperature=False):
+		'''Get the middle name of the NASA files of a month.
+		Args:
+			iyear: the year.
+			imonth: the month.
+			itemperature: True or False; the slv_Nx files of ambient temperature or 
+				the rad_Nx files of solar irradiation.
+		Returns:
+			the middle name.
+		'''
+		if itemperature:
+			if ((iyear == 2010) and (imonth in SolarData.spl_month2010)):
+				return SolarData.fnameta
+			return SolarData.fnametb
+		if ((iyear < 2010) or ((iyear == 2010) and (imonth in SolarData.spl_month2010))):
+			return SolarData.fnamesa
+		return SolarData.fnamesb
+
+	def cfile_list(self, itemperature=False, imanifest=None):
+		'''List the daily NASA files in calendar order.
+			A missing file raises IOError before any file is read.
+		Args:
+			itemperature: True or False; the slv_Nx files of ambient temperature or 
+				the rad_Nx files of solar irradiation.
+			imanifest: the NasaManifest of the folder, may be shared with other imports, e.g. 
+				WindData.cfile_list for the slv_Nx files; the folder is scanned by default.
+		Returns:
+			ofile_list: list of (year, month, day, file name).
+		'''
+		if itemperature:
+			if imanifest is None:
+				imanifest = mmanifest.NasaManifest(self.file_patht)
+			return imanifest.cfile_list(self.start_year, self.end_year, \
+				lambda iyear, imonth: self.cfname_prefix(iyear, imonth, True))
+		if imanifest is None:
+			imanifest = mmanifest.NasaManifest(self.file_path)
+		return imanifest.cfile_list(self.start_year, self.end_year, self.cfname_prefix)
+
+	def cinit_cube(self, isite_num=None):
+		'''Create the preallocated data of all sites, years and months.
+		Args:
+			isite_num: the number of sites, len(self.site_index) by default.
+		Returns:
+			a NasaCube, dict[siteth][year][month] of (day_num, 24) views.
+		'''
+		if isite_num is None:
+			isite_num = len(self.site_index)
+		return mcube.NasaCube(isite_num, self.start_year, self.end_year)
+
+	def cimport_item(self, idata_name=('SWGNT',), iextra_name=()):
+		'''Prepare the import of the rad_Nx files, see init_nasa_hdf.cimport_sweep.
+		Args:
+			idata_name: the data name of solar irradiation.
+			iextra_name: other data names, imported to self.dict_field.
+		Returns: 
+			the data names, the list site indice and the receiver of each day.
+		'''
+		self.data_name = tuple(idata_name[:1])
+		self.dict_solar = self.cinit_cube()
+		for each_name in iextra_name:
+			self.dict_field[each_name] = self.cinit_cube()
+		def creceive(iyear, imonth, iday, iblock):
+			self.dict_solar.cfill_day(iyear, imonth, iday, iblock[0])
+			for each_name, each_data in zip(iextra_name, iblock[1:]):
+				self.dict_field[each_name].cfill_day(iyear, imonth, iday, each_data)
+		return tuple(idata_name[:1]) + tuple(iextra_name), self.site_index, creceive
+
+	def cimport_itemt(self, idata_name=('TS',)):
+		'''Prepare the import of ambient temperature from the slv_Nx files, see init_nasa_hdf.cimport_sweep.
+			The slv_Nx files may be shared with the wind speed in one sweep, see WindData.cimport_data.
+		Args:
+			idata_name: the data name of ambient temperature.
+		Returns: 
+			the data names, the list site indice and the receiver of each day.
+		'''
+		self.data_namet = tuple(idata_name[:1])
+		self.dict_temperature = self.cinit_cube(len(self.site_indext))
+		def creceive(iyear, imonth, iday, iblock):
+			self.dict_temperature.cfill_day(iyear, imonth, iday, iblock[0])
+		return tuple(idata_name[:1]), self.site_indext, creceive
+
+	def cimport_data(self, idata_name=('SWGNT',), iprocess_num=1, iextra_name=(), ihyperslab=False, icache_path=None):
 		'''Import ten-year dsolar irradiation ata. 
 		Args:
 			idata_name: the data name.
+			iprocess_num: the number of processes reading the daily files, 1 for serial reading.
+			iextra_name: other data names in the same files, imported to self.dict_field.
+			ihyperslab: True or False; read only the bounding window of the sites from each file.
+			icache_path: str; the folder name of the cache of decoded data, None for no cache.
 		Returns: 
 			self.dict_solar: imported data.
 		'''
-		year_index = range(self.start_year, self.end_year + 1)
-		site_num = len(self.site_index)
-		zero = str(0)
-		for each_siteth in range(1, site_num + 1):
-			self.dict_solar[each_siteth] = {}
-			for each_year in year_index:
-				self.dict_solar[each_siteth][each_year] = {}
-				for each_month in SolarData.month_name:
-					self.dict_solar[each_siteth][each_year][each_month] = np.empty((0,24), np.float32)
-		for each_year in year_index:
-			if ((each_year % 400 == 0) or ((each_year % 4 == 0) and (each_year % 100 != 0))):
-				year_feature = SolarData.leap_year
-			else:
-				year_feature = SolarData.nonleap_year
-			for each_month in SolarData.month_name:
-				if ((each_year < 2010) or ((each_year == 2010) and (each_month in SolarData.spl_month2010))):
-					fnames = self.file_path + SolarData.fnamesa
-				else:
-					fnames = self.file_path + SolarData.fnamesb
-				day_s = year_feature[each_month][1]
-				day_e = year_feature[each_month][2]
-				if year_feature[each_month][3]:
-					for each_day in range(day_s, day_e + 1):
-						fname = fnames + str(each_year) + zero + str(each_day) + SolarData.fnamee
-						print fname
-						fid = SD(fname)
-						tmpirrad = fid.select(idata_name[0])[:, :, :]
-						fid.end()
-						for each_siteth in range(1, site_num + 1):
-							tmpirrad_site = tmpirrad[:, self.site_index[each_siteth - 1][0], \
-							self.site_index[each_siteth - 1][1]].reshape(1, -1)
-							self.dict_solar[each_siteth][each_year][each_month] = \
-							np.vstack((self.dict_solar[each_siteth][each_year][each_month], tmpirrad_site))
-				else:
-					for each_day in range(day_s, day_e + 1):
-						fname = fnames + str(each_year) + str(each_day) + SolarData.fnamee
-						print fname
-						fid = SD(fname)
-						tmpirrad = fid.select(idata_name[0])[:, :, :]
-						fid.end()
-						for each_siteth in range(1, site_num + 1):
-							tmpirrad_site = tmpirrad[:, self.site_index[each_siteth - 1][0], \
-							self.site_index[each_siteth - 1][1]].reshape(1, -1)
-							self.dict_solar[each_siteth][each_year][each_month] = \
-							np.vstack((self.dict_solar[each_siteth][each_year][each_month], tmpirrad_site))
+		mhdf.cimport_sweep(self.cfile_list(), [self.cimport_item(idata_name, iextra_name)], \
+			iprocess_num, ihyperslab, icache_path)
 		return self.dict_solar
 
-	def cimport_datat(self, idata_name=('TS',)):
+	def cimport_datat(self, idata_name=('TS',), iprocess_num=1, ihyperslab=False, icache_path=None):
 		'''Import ten-year ambient temperature data. 
 		Args:
 			idata_name: the data name.
+			iprocess_num: the number of processes reading the daily files, 1 for serial reading.
+			ihyperslab: True or False; read only the bounding window of the sites from each file.
+			icache_path: str; the folder name of the cache of decoded data, None for no cache.
 		Returns: 
-			self.dict_solar: imported data.
+			self.dict_temperature: imported data.
 		'''
-		year_index = range(self.start_year, self.end_year + 1)
-		site_num = len(self.site_indext)
-		zero = str(0)
-		for each_siteth in range(1, site_num + 1):
-			self.dict_temperature[each_siteth] = {}
-			for each_year in year_index:
-				self.dict_temperature[each_siteth][each_year] = {}
-				for each_month in SolarData.month_name:
-					self.dict_temperature[each_siteth][each_year][each_month] = np.empty((0,24), np.float32)
-		for each_year in year_index:
-			if ((each_year % 400 == 0) or ((each_year % 4 == 0) and (each_year % 100 != 0))):
-				year_feature = SolarData.leap_year
-			else:
-				year_feature = SolarData.nonleap_year
-			for each_month in SolarData.month_name:
-				if ((each_year == 2010) and (each_month in SolarData.spl_month2010)):
-					fnames = self.file_patht + SolarData.fnameta
-				else:
-					fnames = self.file_patht + SolarData.fnametb
-				day_s = year_feature[each_month][1]
-				day_e = year_feature[each_month][2]
-				if year_feature[each_month][3]:
-					for each_day in range(day_s, day_e + 1):
-						fname = fnames + str(each_year) + zero + str(each_day) + SolarData.fnamee
-						print fname
-						fid = SD(fname)
-						tmpirrad = fid.select(idata_name[0])[:, :, :]
-						fid.end()
-						for each_siteth in range(1, site_num + 1):
-							tmpirrad_site = tmpirrad[:, self.site_indext[each_siteth - 1][0], \
-							self.site_indext[each_siteth - 1][1]].reshape(1, -1)
-							self.dict_temperature[each_siteth][each_year][each_month] = \
-							np.vstack((self.dict_temperature[each_siteth][each_year][each_month], tmpirrad_site))
-						# print(tmpirrad_site)
-				else:
-					for each_day in range(day_s, day_e + 1):
-						fname = fnames + str(each_year) + str(each_day) + SolarData.fnamee
-						print fname
-						fid = SD(fname)
-						tmpirrad = fid.select(idata_name[0])[:, :, :]
-						fid.end()
-						for each_siteth in range(1, site_num + 1):
-							tmpirrad_site = tmpirrad[:, self.site_indext[each_siteth - 1][0], \
-							self.site_indext[each_siteth - 1][1]].reshape(1, -1)
-							self.dict_temperature[each_siteth][each_year][each_month] = \
-							np.vstack((self.dict_temperature[each_siteth][each_year][each_month], tmpirrad_site))
-						# print(tmpirrad_site)
+		mhdf.cimport_sweep(self.cfile_list(True), [self.cimport_itemt(idata_name)], \
+			iprocess_num, ihyperslab, icache_path)
 		return self.dict_temperature
 
-	def csolar2cf_model1(self, irated_powr=255.0, iarea_m2=1.6368, ieffi_ratio=0.1248):
+	def cstream_data(self, imonthly=False, iprefetch_num=4, ithread_num=2, ihyperslab=False, itemperature=False):
+		'''Stream the solar irradiation or ambient temperature in calendar order, in bounded memory.
+			The upcoming daily files are read on background threads, see init_nasa_hdf.cstream_days.
+		Args:
+			imonthly: True or False; yield the data per month or per day.
+			iprefetch_num: the number of days read ahead.
+			ithread_num: the number of background threads.
+			ihyperslab: True or False; read only the bounding window of the sites from each file.
+			itemperature: True or False; ambient temperature or solar irradiation.
+		Returns: 
+			a generator of (year, month, day, (site_num, 24) data) per day, 
+			or (year, month, (site_num, day_num, 24) data) per month.
+		'''
+		if itemperature:
+			items = [(self.data_namet, self.site_indext)]
+		else:
+			items = [(self.data_name, self.site_index)]
+		if imonthly:
+			for (each_year, each_month, oblocks) in \
+				mhdf.cstream_months(self.cfile_list(itemperature), items, iprefetch_num, ithread_num, ihyperslab):
+				yield each_year, each_month, oblocks[0][0]
+		else:
+			for (each_year, each_month, each_day, oblocks) in \
+				mhdf.cstream_days(self.cfile_list(itemperature), items, iprefetch_num, ithread_num, ihyperslab):
+				yield each_year, each_month, each_day, oblocks[0][0]
+
+	def csolar2cf_model1(self, irated_powr=255.0, iarea_m2=1.6368, ieffi_ratio=0.1248, iclip=False, ipoa=False):
 		'''Converter solar irradiation to capacity factors.
-			PV Model1: Ff = (idata * iarea_m2 * ieffi_ratio) / ieffi_ratio
+			PV Model1: Ff = (idata * iarea_m2 * ieffi_ratio) / irated_powr
 		Args:
-			idata: the source solar irradiation.
 			irated_powr: the rated power.
 			iarea_m2: the area of a PV module.
 			ieffi_ratio: the efficiency.
+			iclip: True or False; clip the capacity factors to [0, 1].
+			ipoa: True or False; use the plane-of-array irradiation of cpoa_irradiance, or the horizontal one.
 		Returns:
 			capacity factors
 		'''
-		year_index = range(self.start_year, self.end_year + 1)
-		site_num = len(self.site_index)
-		for each_siteth in range(1, site_num + 1):
-			self.dict_solar_cf[each_siteth] = {}
-			for each_year in year_index:
-				self.dict_solar_cf[each_siteth][each_year] = {}
-				for each_month in SolarData.month_name:
-					self.dict_solar_cf[each_siteth][each_year][each_month] = \
-					self.dict_solar[each_siteth][each_year][each_month] * ieffi_ratio * iarea_m2 / irated_powr
-		return self.dict_solar_cf
+		return self.cpv2cf(mpv.PvModel.cfrom_model1(irated_powr, iarea_m2, ieffi_ratio), iclip, ipoa)
 
-	def csolar2cf_model2(self, iHSTC=1000.0, iC1=0.93, iC2=-0.005, iTSTC=25.0, iTfTETC=47.0, iTaTETC=20.0, iHTETC=800.0):
+	def csolar2cf_model2(self, iHSTC=1000.0, iC1=0.93, iC2=-0.005, iTSTC=25.0, iTfTETC=47.0, iTaTETC=20.0, iHTETC=800.0, 
+		iclip=False, ipoa=False):
 		'''Converter solar irradiation to capacity factors.
 		PV Model2: Ff = (idataf / iHSTC) * iC1 * (1 + iC2(Tf - iTSTC))
 							Tf = idatat + idataf * (iTfTETC - iTaTETC) / iHTETC
 		Args:
-			idata: the source solar irradiation and ambient temperature.
 			iHSTC: the solar irradiation at standard test condition.
 			iC1: the derating coefficient.
 			iC2: the power temperature coefficient.
 			iTSTC: is the temperature at standard test condition.
 			iTfTETC: the solar irradiation at temperature estimation test condition.
 			iTaTETC: the ambient temperature at temperature estimation test condition.
+			iclip: True or False; clip the capacity factors to [0, 1].
+			ipoa: True or False; use the plane-of-array irradiation of cpoa_irradiance, or the horizontal one.
 		Returns:
 			capacity factors
 		'''
-		year_index = range(self.start_year, self.end_year + 1)
-		site_num = len(self.site_index)
-		for each_siteth in range(1, site_num + 1):
-			self.dict_solar_cf[each_siteth] = {}
-			for each_year in year_index:
-				self.dict_solar_cf[each_siteth][each_year] = {}
-				for each_month in SolarData.month_name:
-#					print each_month
-					self.dict_solar_cf[each_siteth][each_year][each_month] = \
-					self.dict_solar[each_siteth][each_year][each_month] / iHSTC * iC1 * \
-					(1 + iC2 * (self.dict_temperature[each_siteth][each_year][each_month] 
-					- 273.15 - iTSTC + self.dict_solar[each_siteth][each_year][each_month] 
-					* (iTfTETC - iTaTETC) / iHTETC))
+		return self.cpv2cf(mpv.PvModel.cfrom_model2(iHSTC, iC1, iC2, iTSTC, iTfTETC, iTaTETC, iHTETC), iclip, ipoa)
+
+	def cpoa_irradiance(self, ilat, ilon, itilt=None, iazimuth=None, itracking=False, imax_angle=60.0, ialbedo=0.2):
+		'''Converter the horizontal solar irradiation to the plane-of-array irradiation of PV modules.
+			see init_solar_position.cpoa; self.dict_solar should be the global horizontal irradiation, e.g. SWGDN.
+		Args:
+			ilat: (site_num,) latitude of each site in degree, north positive.
+			ilon: (site_num,) longitude of each site in degree, east positive.
+			itilt: the tilt of fixed modules in degree; the latitude by default.
+			iazimuth: the azimuth of fixed modules, or of the axis of tracking modules, in degree clockwise from north; 
+				facing the equator by default.
+			itracking: True or False; single-axis tracking modules on a horizontal axis, or fixed modules.
+			imax_angle: the max rotation angle of tracking modules in degree.
+			ialbedo: the ground albedo.
+		Returns:
+			self.dict_poa: plane-of-array irradiation, a NasaCube
+		'''
+		solar = mcube.cto_cube(self.dict_solar, len(self.site_index), self.start_year, self.end_year)
+		self.dict_poa = mcube.NasaCube(solar.site_num, self.start_year, self.end_year, \
+			mposition.cpoa(solar.data, ilat, ilon, self.start_year, self.end_year, itilt, iazimuth, itracking, 
+			imax_angle, ialbedo))
+		self.poa_param = (ilat, ilon, itilt, iazimuth, itracking, imax_angle, ialbedo)
+		return self.dict_poa
+
+	def cpv_input(self, ipv_models, ipoa=False):
+		'''Get the dense solar irradiation and, for PV model2, ambient temperature.
+		Args:
+			ipv_models: list of PvModel.
+			ipoa: True or False; the plane-of-array irradiation, or the horizontal one.
+		Returns:
+			the NasaCube of solar irradiation, and the one of ambient temperature or None.
+		'''
+		solar = mcube.cto_cube(self.dict_poa if ipoa else self.dict_solar, len(self.site_index), \
+			self.start_year, self.end_year)
+		if all([each.model == 1 for each in ipv_models]):
+			return solar, None
+		temperature = mcube.cto_cube(self.dict_temperature, len(self.site_indext), self.start_year, self.end_year)
+		if temperature.site_num != solar.site_num:
+			raise ValueError('the ambient temperature of %d sites does not match the solar irradiation of %d sites' \
+				% (temperature.site_num, solar.site_num))
+		return solar, temperature
+
+	def cpv2cf(self, ipv_model, iclip=False, ipoa=False):
+		'''Converter solar irradiation to capacity factors of all sites and years at once, see init_pv_model.
+		Args:
+			ipv_model: the PvModel.
+			iclip: True or False; clip the capacity factors to [0, 1].
+			ipoa: True or False; use the plane-of-array irradiation of cpoa_irradiance, or the horizontal one.
+		Returns:
+			self.dict_solar_cf: capacity factors, a NasaCube
+		'''
+		(solar, temperature) = self.cpv_input([ipv_model], ipoa)
+		self.dict_solar_cf = mcube.NasaCube(solar.site_num, self.start_year, self.end_year, \
+			ipv_model.csolar2cf(solar.data, None if temperature is None else temperature.data, None, iclip))
+		self.dict_solar_cf0 = {}
+		self.cf_model = (ipv_model.model, ipv_model.param + (iclip, ipoa))
+		self.moduleth = None
+		return self.dict_solar_cf
+
+	def cmodules2cf(self, ipv_models, iclip=False, ipoa=False):
+		'''Converter solar irradiation to capacity factors of several PV modules at once.
+		Args:
+			ipv_models: list of PvModel of each PV module, e.g. of different technologies.
+			iclip: True or False; clip the capacity factors to [0, 1].
+			ipoa: True or False; use the plane-of-array irradiation of cpoa_irradiance, or the horizontal one.
+		Returns:
+			self.module_cf: float32 (module_num, site_num, day_num, 24) capacity factors.
+		'''
+		(solar, temperature) = self.cpv_input(ipv_models, ipoa)
+		self.module_cf = np.empty((len(ipv_models),) + solar.data.shape, np.float32)
+		for each_moduleth, each_model in enumerate(ipv_models):
+			each_model.csolar2cf(solar.data, None if temperature is None else temperature.data, \
+				self.module_cf[each_moduleth], iclip)
+		self.module_param = (list(ipv_models), iclip, ipoa)
+		return self.module_cf
+
+	def cselect_module(self, imoduleth):
+		'''Select the capacity factors of one PV module as self.dict_solar_cf, e.g. for cass_attr_constr.
+		Args:
+			imoduleth: the serial number of PV module in cmodules2cf.
+		Returns:
+			self.dict_solar_cf: capacity factors of the PV module, a NasaCube view of self.module_cf.
+		'''
+		self.dict_solar_cf = mcube.NasaCube(len(self.site_index), self.start_year, self.end_year, \
+			self.module_cf[imoduleth - 1])
+		self.dict_solar_cf0 = {}
+		self.moduleth = imoduleth
 		return self.dict_solar_cf
 
 	def c2style_1month(self, imode=True):
 		'''Converter NASA data to 1 month style.
+			The arrays are views of the data, built once, or scaled on each access for the corrected data, 
+			see init_nasa_cube.NasaCube.cstyle.
 		Args:
 			imode: True or False; wind speed or capacity factors.
 		Returns:
@@ -233,20 +347,12 @@ class SolarData(object):
 			dict_data = self.dict_solar_cf
 		else:
 			dict_data = self.dict_solar
-		dict_data_1month = {}
-		year_index = range(self.start_year, self.end_year + 1)
-		site_num = len(self.site_index)
-		for each_siteth in range(1, site_num + 1):
-			dict_data_1month[each_siteth] = {}
-			for each_year in year_index:
-				dict_data_1month[each_siteth][each_year] = {}
-				for each_month in SolarData.month_name:
-					dict_data_1month[each_siteth][each_year][each_month] = \
-					dict_data[each_siteth][each_year][each_month].reshape(1, -1)
-		return dict_data_1month
+		return mcube.cto_cube(dict_data, len(self.site_index), self.start_year, self.end_year).cstyle('1month')
 
 	def c2style_1year(self, imode=True):
 		'''Converter NASA data to 1 year style.
+			The arrays are views of the data, built once, or scaled on each access for the corrected data, 
+			see init_nasa_cube.NasaCube.cstyle.
 		Args:
 			imode: True or False; wind speed or capacity factors.
 		Returns:
@@ -256,35 +362,22 @@ class SolarData(object):
 			dict_data = self.dict_solar_cf
 		else:
 			dict_data = self.dict_solar
-		dict_data_1year = {}
-		year_index = range(self.start_year, self.end_year + 1)
-		site_num = len(self.site_index)
-		for each_siteth in range(1, site_num + 1):
-			dict_data_1year[each_siteth] = {};
-			for each_year in year_index:
-				dict_data_1year[each_siteth][each_year] = np.empty((1, 0), np.float32)
-				for each_month in SolarData.month_name:
-					tmp = dict_data[each_siteth][each_year][each_month].reshape(1, -1)
-					dict_data_1year[each_siteth][each_year] = np.hstack((dict_data_1year[each_siteth][each_year], tmp))
-		return dict_data_1year
+		return mcube.cto_cube(dict_data, len(self.site_index), self.start_year, self.end_year).cstyle('1year')
 
 	def c2style_10year(self, imode=True):
 		'''Converter NASA data to 10 years style.
+			The arrays are views of the data, built once, or scaled on each access for the corrected data, 
+			see init_nasa_cube.NasaCube.cstyle.
 		Args:
 			imode: True or False; wind speed or capacity factors.
 		Returns:
 			dict_data_10year: data in 10 year style.
 		'''
-		dict_data_1year = self.c2style_1year(imode)
-		dict_data_10year = {}
-		year_index = range(self.start_year, self.end_year + 1)
-		site_num = len(self.site_index)
-		for each_siteth in range(1, site_num + 1):
-			dict_data_10year[each_siteth] = np.empty((1, 0), np.float32)
-			for each_year in year_index:
-				dict_data_10year[each_siteth] = \
-				np.hstack((dict_data_10year[each_siteth], dict_data_1year[each_siteth][each_year]))
-		return dict_data_10year
+		if imode == True:
+			dict_data = self.dict_solar_cf
+		else:
+			dict_data = self.dict_solar
+		return mcube.cto_cube(dict_data, len(self.site_index), self.start_year, self.end_year).cstyle('10year')
 
 	def cselect_1site_1day(self, isiteth, iyear, imonth, iday, imode=True):
 		'''select data of 1 site, 1 day.
@@ -313,6 +406,12 @@ class SolarData(object):
 		Returns:
 			data of 1 site, 1 month.
 		'''
+		if imode == True:
+			dict_data = self.dict_solar_cf
+		else:
+			dict_data = self.dict_solar
+		if isinstance(dict_data, mcube.NasaCube):
+			return dict_data.cselect_site(isiteth, iyear, imonth)
 		return self.c2style_1month(imode)[isiteth][iyear][imonth]
 
 	def cselect_1site_1year(self, isiteth, iyear, imode=True):
@@ -324,6 +423,12 @@ class SolarData(object):
 		Returns:
 			data of 1 site, 1 year.
 		'''
+		if imode == True:
+			dict_data = self.dict_solar_cf
+		else:
+			dict_data = self.dict_solar
+		if isinstance(dict_data, mcube.NasaCube):
+			return dict_data.cselect_site(isiteth, iyear)
 		return self.c2style_1year(imode)[isiteth][iyear]
 
 	def cselect_1site_10year(self, isiteth, imode=True):
@@ -334,44 +439,244 @@ class SolarData(object):
 		Returns:
 			data of 1 site, 10 year.
 		'''
+		if imode == True:
+			dict_data = self.dict_solar_cf
+		else:
+			dict_data = self.dict_solar
+		if isinstance(dict_data, mcube.NasaCube):
+			return dict_data.cselect_site(isiteth)
 		return self.c2style_10year(imode)[isiteth]
 
+	def cselect_range(self, isites=None, itime_s=None, itime_e=None, iproduct='solar_cf'):
+		'''Select data of sites in a range of hours, see init_nasa_cube.NasaCube.cselect_range.
+		Args:
+			isites: list of the serial numbers of sites, None for all sites.
+			itime_s: the first hour; a time as datetime.datetime or '2012-03-15T06', or a flat hour offset, 
+				see init_time_axis.TimeAxis.chour_offset; the first hour of the data by default.
+			itime_e: the hour after the last hour; the end of the data by default.
+			iproduct: 'solar', 'poa', 'solar_cf', 'solar_cf0' or 'temperature', see cexport_archive.
+		Returns:
+			(site_num, hour_num) data; a view of the data if the data is a site-major NasaCube and 
+			the sites are evenly spaced in increasing order.
+		'''
+		site_num = len(self.site_indext) if iproduct == 'temperature' else len(self.site_index)
+		cube = mcube.cto_cube(getattr(self, 'dict_' + iproduct), site_num, self.start_year, self.end_year)
+		return cube.cselect_range(isites, itime_s, itime_e)
+
+	def ctime_axis(self):
+		'''Get the time axis of the data, see init_time_axis.TimeAxis.
+		Args:
+			null.
+		Returns:
+			the TimeAxis from self.start_year to self.end_year, shared by the data of the same years.
+		'''
+		return mtime.ctime_axis(self.start_year, self.end_year)
+
+	def creduce(self, igroup, imode=True, ifunc='mean'):
+		'''Reduce the data of all sites by time groups, see init_time_axis.TimeAxis.creduce.
+		Args:
+			igroup: 'year', 'year_month', 'day', 'month', 'day_of_year', 'hour' or 'season'.
+			imode: True or False; solar irradiation or capacity factors.
+			ifunc: 'sum' or 'mean'.
+		Returns:
+			(site_num, group_num) float64 sums or means of each site, each group.
+		'''
+		if imode == True:
+			dict_data = self.dict_solar_cf
+		else:
+			dict_data = self.dict_solar
+		cube = mcube.cto_cube(dict_data, len(self.site_index), self.start_year, self.end_year)
+		return cube.creduce(igroup, ifunc)
+
+	def cdiurnal(self, iutc_offset=8, ipercentile=(5, 25, 50, 75, 95), imode=True):
+		'''Get the climatology of each site, each month, each hour of day in local time, 
+			see init_nasa_cube.NasaCube.cdiurnal.
+		Args:
+			iutc_offset: int; the hours of local time ahead of UTC, 8 for China.
+			ipercentile: the percentiles in [0, 100].
+			imode: True or False; solar irradiation or capacity factors.
+		Returns:
+			(site_num, 12, 24) means, std, and (site_num, 12, 24, percentile_num) percentiles.
+		'''
+		if imode == True:
+			dict_data = self.dict_solar_cf
+		else:
+			dict_data = self.dict_solar
+		cube = mcube.cto_cube(dict_data, len(self.site_index), self.start_year, self.end_year)
+		return cube.cdiurnal(iutc_offset, ipercentile)
+
+	def csite_stat(self, imode=True):
+		'''Get the statistics of all hours of each site, see init_nasa_cube.NasaCube.csite_stat.
+		Args:
+			imode: True or False; solar irradiation or capacity factors.
+		Returns:
+			(site_num,) sums, means and std of all hours.
+		'''
+		if imode == True:
+			dict_data = self.dict_solar_cf
+		else:
+			dict_data = self.dict_solar
+		cube = mcube.cto_cube(dict_data, len(self.site_index), self.start_year, self.end_year)
+		return cube.csite_stat()
+
+	def cexport_archive(self, ifile_name, iproduct='solar_cf', ilayout='site'):
+		'''Export data to an archive file for memory mapping, see init_nasa_cube.csave_archive.
+		Args:
+			ifile_name: str; the archive file name.
+			iproduct: 'solar', 'poa', 'solar_cf', 'solar_cf0' or 'temperature'; solar irradiation, plane-of-array 
+				irradiation, capacity factors, uncorrected capacity factors or ambient temperature.
+			ilayout: 'site' or 'time'; site-major or time-major layout.
+		Returns:
+			null.
+		'''
+		site_num = len(self.site_indext) if iproduct == 'temperature' else len(self.site_index)
+		cube = mcube.cto_cube(getattr(self, 'dict_' + iproduct), site_num, self.start_year, self.end_year)
+		site_index = self.site_indext if iproduct == 'temperature' else self.site_index
+		mcube.csave_archive(cube, ifile_name, ilayout, {'product': iproduct, 
+			'unit': SolarData.product_unit[iproduct], 'site_index': [list(each) for each in site_index]})
+
+	def cimport_archive(self, ifile_name, iproduct=None, imode='r'):
+		'''Import data from an archive file by memory mapping, see init_nasa_cube.cload_archive.
+		Args:
+			ifile_name: str; the archive file name.
+			iproduct: the product, see cexport_archive; the product of the archive by default.
+			imode: 'r', 'r+' or 'c'; the mode of numpy.memmap.
+		Returns:
+			the imported data.
+		'''
+		(cube, header) = mcube.cload_archive(ifile_name, imode)
+		if iproduct is None:
+			iproduct = header['product']
+		site_num = len(self.site_indext) if iproduct == 'temperature' else len(self.site_index)
+		if (cube.site_num, cube.start_year, cube.end_year) != (site_num, self.start_year, self.end_year):
+			raise ValueError('the archive of %d sites, %d-%d does not match the data of %d sites, %d-%d' \
+				% (cube.site_num, cube.start_year, cube.end_year, site_num, self.start_year, self.end_year))
+		site_index = [list(each) for each in (self.site_indext if iproduct == 'temperature' else self.site_index)]
+		if header.get('site_index', site_index) != site_index:
+			raise ValueError('the archive of the list site indice %s does not match the data of %s' \
+				% (header['site_index'], site_index))
+		unit = SolarData.product_unit[iproduct]
+		if header.get('unit', unit) != unit:
+			raise ValueError('the archive of %s in %s does not match %s in %s' \
+				% (header.get('product'), header['unit'], iproduct, unit))
+		setattr(self, 'dict_' + iproduct, cube)
+		return cube
+
+	def cuncorrected_cf(self):
+		'''Get the uncorrected capacity factors.
+		Args:
+		Returns:
+			the NasaCube of the uncorrected capacity factors.
+		'''
+		if len(self.dict_solar_cf0) > 0:
+			dict_data = self.dict_solar_cf0
+		else:
+			dict_data = self.dict_solar_cf
+		return mcube.cto_cube(dict_data, len(self.site_index), self.start_year, self.end_year)
+
 	def ccal_corrcoef(self, irelmean=0.1183):
 		'''Calculate the correction factors.
 		Args:
 			irelmean: the in-situ measured capacity factors, 
-				the annual average capacity factor of the study region.
+				the annual average capacity factor of the study region, or the vector of each site.
 		Returns:
-			alpha: the calculated correction factor for the study region.
-		'''
-		dict_data_10year = self.c2style_10year(True)
-		ur = irelmean
-		N = len(self.site_indext)
-		us = 0
-		for each_siteth in range(1, N+1, 1):
-			us += np.mean(dict_data_10year[each_siteth], axis=1)
-		corfactors = ur * N * 1.0 / us
-		self.alpha = corfactors[0,]
-		return alpha[0,]
-
-	def ccorrect_cf(self):
-		'''Correct the simulated capacity factors in the study region.
+			alpha: the calculated correction factor for the study region, or the vector of each site.
+		'''
+		us = np.mean(self.cuncorrected_cf().data, axis=(1, 2), dtype=np.float64)
+		if np.ndim(irelmean) == 0:
+			self.alpha = irelmean * len(us) * 1.0 / np.sum(us)
+		else:
+			self.alpha = (np.asarray(irelmean, np.float64) / us).astype(np.float32)
+		self.offset = 0
+		return self.alpha
+
+	def ccalibrate(self, iobserved, imode='scale'):
+		'''Calibrate the capacity factors of each site, each month against in-situ measured capacity factors.
+			All sites are fitted at once, see init_calibration.cfit_factor, and corrected on reading, see ccorrect_cf.
+			The sites and months without a valid fit, e.g. not measured, are left uncorrected (gain 1, offset 0) 
+			and marked True in the (site_num, 12) self.cal_fallback; check it after calibrating.
 		Args:
+			iobserved: the measured average capacity factors, NaN if not measured;
+				(site_num, year_num, 12) of each month, or (site_num, year_num) of each year.
+			imode: 'scale' or 'linear'; fit a gain, or a gain and an offset.
 		Returns:
 			dict_solar_cf0: the uncorrected capacity factors
 			dict_solar_cf: the corrected capacity factors
 		'''
-		year_index = range(self.start_year, self.end_year + 1)
-		site_num = len(self.site_index)
-		for each_siteth in range(1, site_num + 1):
-			self.dict_solar_cf0[each_siteth]={}
-			for each_year in year_index:
-				self.dict_solar_cf0[each_siteth][each_year]={}
-				for each_month in SolarData.month_name:
-					self.dict_solar_cf0[each_siteth][each_year][each_month] = self.dict_solar_cf[each_siteth][each_year][each_month]
-					self.dict_solar_cf[each_siteth][each_year][each_month] = self.dict_solar_cf[each_siteth][each_year][each_month] * self.alpha
+		(gain, offset, self.cal_fallback) = mcal.cfit_factor(self.cuncorrected_cf(), iobserved, imode)
+		return self.ccorrect_cf(gain, offset)
+
+	def ccorrect_cf(self, ialpha=None, ioffset=None):
+		'''Correct the simulated capacity factors in the study region.
+			The correction is applied on reading, the capacity factors are not copied, 
+			so correcting again, e.g. by another alpha of ccal_corrcoef, costs nothing.
+		Args:
+			ialpha: the correction factor, a scalar, the vector of each site or the (site_num, 12) array of 
+				each site, each month; self.alpha by default.
+			ioffset: the offset added after correction, the same shapes as ialpha; self.offset by default.
+		Returns:
+			dict_solar_cf0: the uncorrected capacity factors
+			dict_solar_cf: the corrected capacity factors, a ScaledCube of dict_solar_cf0
+		'''
+		if ialpha is not None:
+			self.alpha = ialpha
+		if ioffset is not None:
+			self.offset = ioffset
+		self.dict_solar_cf0 = self.cuncorrected_cf()
+		self.dict_solar_cf = mcube.ScaledCube(self.dict_solar_cf0, self.alpha, self.offset)
 		return self.dict_solar_cf0, self.dict_solar_cf
 
+	def cappend_year(self, iend_year=None, iprocess_num=1, ihyperslab=False, icache_path=None):
+		'''Append the following years without importing the former years again.
+			The ambient temperature, the (corrected) capacity factors and the capacity factors of several 
+			PV modules calculated before are extended with the same PV model, parameters and correction factor.
+		Args:
+			iend_year: the new end year, self.end_year + 1 by default.
+			iprocess_num: the number of processes reading the daily files, 1 for serial reading.
+			ihyperslab: True or False; read only the bounding window of the sites from each file.
+			icache_path: str; the folder name of the cache of decoded data, None for no cache.
+		Returns: 
+			self.dict_solar: imported data of all years.
+		'''
+		if iend_year is None:
+			iend_year = self.end_year + 1
+		new_data = SolarData(self.file_path, self.site_index, self.end_year + 1, iend_year, \
+			self.file_patht, self.site_indext)
+		if len(self.dict_solar) > 0:
+			new_data.cimport_data(self.data_name, iprocess_num, tuple(self.dict_field.keys()), ihyperslab, icache_path)
+		if len(self.dict_temperature) > 0:
+			new_data.cimport_datat(self.data_namet, iprocess_num, ihyperslab, icache_path)
+		if self.poa_param is not None:
+			new_data.cpoa_irradiance(*self.poa_param)
+		if self.module_param is not None:
+			new_data.cmodules2cf(*self.module_param)
+		if self.moduleth is not None:
+			new_data.cselect_module(self.moduleth)
+		elif len(self.dict_solar_cf) > 0:
+			getattr(new_data, 'csolar2cf_model%d' % self.cf_model[0])(*self.cf_model[1])
+		scaled = isinstance(self.dict_solar_cf, mcube.ScaledCube)
+		if scaled:
+			new_data.alpha = self.alpha
+			new_data.offset = self.offset
+			new_data.ccorrect_cf()
+		for each_name in ('dict_solar', 'dict_temperature', 'dict_poa', 'dict_solar_cf', 'dict_solar_cf0'):
+			if (each_name == 'dict_solar_cf') and scaled:
+				continue
+			if len(getattr(self, each_name)) > 0:
+				setattr(self, each_name, mcube.cappend_years(getattr(self, each_name), \
+					getattr(new_data, each_name), new_data.start_year, iend_year))
+		for each_name in self.dict_field.keys():
+			self.dict_field[each_name] = mcube.cappend_years(self.dict_field[each_name], \
+				new_data.dict_field[each_name], new_data.start_year, iend_year)
+		if self.module_param is not None:
+			self.module_cf = np.concatenate((self.module_cf, new_data.module_cf), axis=2)
+		self.end_year = iend_year
+		if scaled:
+			self.ccorrect_cf()
+		elif self.moduleth is not None:
+			self.cselect_module(self.moduleth)
+		return self.dict_solar
+
 
 
 if __name__ == '__main__':
@@ -383,10 +688,13 @@ if __name__ == '__main__':
 	start_year = 2006
 	end_year = 2006
 
-	solar_data = SolarData(file_name, file_namet, irrad_site_index, irrad_site_indext, start_year, end_year)
+	solar_data = SolarData(file_name, irrad_site_index, start_year, end_year, file_namet, irrad_site_indext)
 	solar_irrad_data = solar_data.cimport_data()
 	solar_capacity_factor = solar_data.csolar2cf_model1()
 	# solar_temperature_data = solar_data.cimport_datat()
+	# import init_nasa_wind as mwind
+	# wind_data = mwind.WindData(file_namet, irrad_site_indext, start_year, end_year)
+	# wind_speed_ref = wind_data.cimport_data(isolar_data=solar_data)
 	# solar_capacity_factor = solar_data.csolar2cf_model2()
 	PVcorrcoef = solar_data.ccal_corrcoef(0.1183)
 	(solar_capacity_factor0, solar_capacity_factor) = solar_data.ccorrect_cf()
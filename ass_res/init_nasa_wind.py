@@ -14,27 +14,26 @@ Created on Thu Jun 08 10:54:23 2017
 """
 
 
+import os
 import numpy as np 
-from pyhdf.SD import SD
+
+import init_nasa_hdf as mhdf
+import init_nasa_cube as mcube
+import init_time_axis as mtime
+import init_nasa_manifest as mmanifest
+import init_calibration as mcal
+import init_power_curve as mpc
 
 
 class WindData(object):
 	'''NASA wind speed data class'''
 	version = '1.0'
-	month_name = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
-		'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
-	leap_year = {'Jan': (31, 101, 131, True), 'Feb': (29, 201, 229, True), 'Mar': (31, 301, 331, True), 
-	'Apr': (30, 401, 430, True), 'May': (31, 501, 531, True), 'Jun': (30, 601, 630, True), 
-	'Jul': (31, 701, 731, True), 'Aug': (31, 801, 831, True), 'Sep': (30, 901, 930, True), 
-	'Oct': (31, 1001, 1031, False), 'Nov': (30, 1101, 1130, False), 'Dec': (31, 1201, 1231, False)}
-	nonleap_year = {'Jan': (31,101,131,True), 'Feb': (28,201,228,True), 'Mar': (31, 301, 331, True), 
-	'Apr': (30, 401, 430, True), 'May': (31, 501, 531, True), 'Jun': (30, 601, 630, True), 'Jul': (31, 701, 731, True), 
-	'Aug': (31, 801, 831, True), 'Sep': (30, 901, 930, True), 'Oct': (31, 1001, 1031, False), 
-	'Nov': (30, 1101, 1130, False), 'Dec': (31, 1201, 1231, False)}
+	month_name = mtime.month_name
 	fnamesa = '/MERRA301.prod.assim.tavg1_2d_slv_Nx.'
 	fnamesb = '/MERRA300.prod.assim.tavg1_2d_slv_Nx.'
 	fnamee = '.SUB.hdf'
 	spl_month2010 = ('Jun', 'Jul', 'Aug')
+	product_unit = {'ref_wind': 'm/s', 'hw_wind': 'm/s', 'wind_cf': 'p.u.', 'wind_cf0': 'p.u.'}
 
 	def __init__(self, ifile_name, isite_index, istart_year, iend_year):
 		"""Create an object. 
@@ -55,7 +54,17 @@ class WindData(object):
 		self.dict_hw_wind = {}
 		self.dict_wind_cf = {}
 		self.dict_wind_cf0 = {}
+		self.dict_field = {}
 		self.alpha = 1
+		self.offset = 0
+		self.cal_fallback = None
+		self.data_name = ('V50M', 'U50M')
+		self.hw_param = None
+		self.cf_param = None
+		self.turbine_cf = None
+		self.turbine_param = None
+		self.turbineth = None
+		self.fuse_param = None
 
 	def cuv2speed(self, u, v):
 		'''Converter u and v to the wind speed. 
@@ -67,68 +76,107 @@ class WindData(object):
 		'''
 		return (u ** 2 + v ** 2) ** 0.5
 
-	def cimport_data(self, idata_name=('V50M', 'U50M')):
+	def cfname_prefix(self, iyear, imonth):
+		'''Get the middle name of the NASA files of a month.
+		Args:
+			iyear: the year.
+			imonth: the month.
+		Returns:
+			the middle name.
+		'''
+		if ((iyear == 2010) and (imonth in WindData.spl_month2010)):
+			return WindData.fnamesa
+		return WindData.fnamesb
+
+	def cfile_list(self, imanifest=None):
+		'''List the daily NASA files in calendar order.
+			A missing file raises IOError before any file is read.
+		Args:
+			imanifest: the NasaManifest of self.file_name, may be shared with other imports, or allow 
+				other product streams, see NasaManifest; the folder is scanned by default.
+		Returns:
+			ofile_list: list of (year, month, day, file name).
+		'''
+		if imanifest is None:
+			imanifest = mmanifest.NasaManifest(self.file_name)
+		return imanifest.cfile_list(self.start_year, self.end_year, self.cfname_prefix)
+
+	def cinit_cube(self):
+		'''Create the preallocated data of all sites, years and months.
+		Args:
+		Returns:
+			a NasaCube, dict[siteth][year][month] of (day_num, 24) views.
+		'''
+		return mcube.NasaCube(len(self.site_index), self.start_year, self.end_year)
+
+	def cimport_item(self, idata_name=('V50M', 'U50M'), iextra_name=()):
+		'''Prepare the import of the slv_Nx files, see init_nasa_hdf.cimport_sweep.
+		Args:
+			idata_name: the data name of V and U.
+			iextra_name: other data names, imported to self.dict_field.
+		Returns: 
+			the data names, the list site indice and the receiver of each day.
+		'''
+		self.data_name = tuple(idata_name[:2])
+		self.dict_ref_wind = self.cinit_cube()
+		for each_name in iextra_name:
+			self.dict_field[each_name] = self.cinit_cube()
+		def creceive(iyear, imonth, iday, iblock):
+			self.dict_ref_wind.cfill_day(iyear, imonth, iday, self.cuv2speed(iblock[0], iblock[1]))
+			for each_name, each_data in zip(iextra_name, iblock[2:]):
+				self.dict_field[each_name].cfill_day(iyear, imonth, iday, each_data)
+		return tuple(idata_name[:2]) + tuple(iextra_name), self.site_index, creceive
+
+	def cimport_data(self, idata_name=('V50M', 'U50M'), iprocess_num=1, iextra_name=(), ihyperslab=False, icache_path=None, 
+		isolar_data=None):
 		'''Import ten-year data. 
 		Args:
 			idata_name: the data name.
+			iprocess_num: the number of processes reading the daily files, 1 for serial reading.
+			iextra_name: other data names in the same files, imported to self.dict_field.
+			ihyperslab: True or False; read only the bounding window of the sites from each file.
+			icache_path: str; the folder name of the cache of decoded data, None for no cache.
+			isolar_data: a SolarData whose ambient temperature is imported in the same sweep over 
+				the slv_Nx files, see SolarData.cimport_datat; its folder and years must be the same.
 		Returns: 
 			self.dict_ref_wind: imported data.
 		'''
-		year_index = range(self.start_year, self.end_year + 1)
-		site_num = len(self.site_index)
-		zero = str(0)
-		for each_siteth in range(1, site_num + 1):
-			self.dict_ref_wind[each_siteth] = {}
-			for each_year in year_index:
-				self.dict_ref_wind[each_siteth][each_year] = {}
-				for each_month in WindData.month_name:
-					self.dict_ref_wind[each_siteth][each_year][each_month] = np.empty((0,24), np.float32)
-		for each_year in year_index:
-			if ((each_year % 400 == 0) or ((each_year % 4 == 0) and (each_year % 100 != 0))):
-				year_feature = WindData.leap_year
-			else:
-				year_feature = WindData.nonleap_year
-			for each_month in WindData.month_name:
-				if ((each_year == 2010) and (each_month in WindData.spl_month2010)):
-					fnames = self.file_name + WindData.fnamesa
-				else:
-					fnames = self.file_name + WindData.fnamesb 
-				day_s = year_feature[each_month][1]
-				day_e = year_feature[each_month][2]
-				if year_feature[each_month][3]:
-					for each_day in range(day_s, day_e + 1):
-						fname = fnames + str(each_year) + zero + str(each_day) + WindData.fnamee
-						print fname
-						fid = SD(fname)
-						tmpv = fid.select(idata_name[0])[:, :, :]
-						tmpu = fid.select(idata_name[1])[:, :, :]
-						fid.end()
-						for each_siteth in range(1, site_num + 1):
-							tmpv_site = tmpv[:, self.site_index[each_siteth - 1][0], \
-							self.site_index[each_siteth - 1][1]].reshape(1, -1)
-							tmpu_site = tmpu[:, self.site_index[each_siteth - 1][0], \
-							self.site_index[each_siteth - 1][1]].reshape(1, -1)
-							tmpwind_site = self.cuv2speed(tmpv_site, tmpu_site)
-							self.dict_ref_wind[each_siteth][each_year][each_month] = \
-							np.vstack((self.dict_ref_wind[each_siteth][each_year][each_month], tmpwind_site))
-				else:
-					for each_day in range(day_s, day_e + 1):
-						fname = fnames + str(each_year) + str(each_day) + WindData.fnamee
-						print fname
-						fid = SD(fname)
-						tmpv = fid.select(idata_name[0])[:, :, :]
-						tmpu = fid.select(idata_name[1])[:, :, :]
-						fid.end()
-						for each_siteth in range(1, site_num + 1):
-							tmpv_site = tmpv[:, self.site_index[each_siteth - 1][0], \
-							self.site_index[each_siteth-1][1]].reshape(1, -1)
-							tmpu_site = tmpu[:, self.site_index[each_siteth - 1][0], \
-							self.site_index[each_siteth-1][1]].reshape(1, -1)
-							tmpwind_site = self.cuv2speed(tmpv_site,tmpu_site)
-							self.dict_ref_wind[each_siteth][each_year][each_month] = \
-							np.vstack((self.dict_ref_wind[each_siteth][each_year][each_month], tmpwind_site))
+		if isolar_data is not None:
+			if (isolar_data.file_patht is None) or \
+				(os.path.normpath(isolar_data.file_patht) != os.path.normpath(self.file_name)):
+				raise ValueError('the ambient temperature folder %s does not match the wind speed folder %s' \
+					% (isolar_data.file_patht, self.file_name))
+			if (isolar_data.start_year, isolar_data.end_year) != (self.start_year, self.end_year):
+				raise ValueError('the ambient temperature of %d-%d does not match the wind speed of %d-%d' \
+					% (isolar_data.start_year, isolar_data.end_year, self.start_year, self.end_year))
+		import_items = [self.cimport_item(idata_name, iextra_name)]
+		if isolar_data is not None:
+			import_items.append(isolar_data.cimport_itemt(isolar_data.data_namet))
+		mhdf.cimport_sweep(self.cfile_list(), import_items, iprocess_num, ihyperslab, icache_path)
 		return self.dict_ref_wind
 
+	def cstream_data(self, imonthly=False, iprefetch_num=4, ithread_num=2, ihyperslab=False):
+		'''Stream the wind speed at reference height in calendar order, in bounded memory.
+			The upcoming daily files are read on background threads, see init_nasa_hdf.cstream_days.
+		Args:
+			imonthly: True or False; yield the data per month or per day.
+			iprefetch_num: the number of days read ahead.
+			ithread_num: the number of background threads.
+			ihyperslab: True or False; read only the bounding window of the sites from each file.
+		Returns: 
+			a generator of (year, month, day, (site_num, 24) wind speed) per day, 
+			or (year, month, (site_num, day_num, 24) wind speed) per month.
+		'''
+		items = [(self.data_name, self.site_index)]
+		if imonthly:
+			for (each_year, each_month, oblocks) in \
+				mhdf.cstream_months(self.cfile_list(), items, iprefetch_num, ithread_num, ihyperslab):
+				yield each_year, each_month, self.cuv2speed(oblocks[0][0], oblocks[0][1])
+		else:
+			for (each_year, each_month, each_day, oblocks) in \
+				mhdf.cstream_days(self.cfile_list(), items, iprefetch_num, ithread_num, ihyperslab):
+				yield each_year, each_month, each_day, self.cuv2speed(oblocks[0][0], oblocks[0][1])
+
 	def cref2hw(self, ihref=50.0, ihw=65.0, ialpha=0.35):
 		'''Converter the speed at reference height to the one at WTGs height. 
 		Args:
@@ -136,17 +184,13 @@ class WindData(object):
 			ihref: the WTGs height.
 			ialpha: the exponent coefficient
 		Returns:
-			self.dict_hw_wind: wind speed at WTGs height
+			self.dict_hw_wind: wind speed at WTGs height, a NasaCube
 		'''
-		year_index = range(self.start_year, self.end_year+1)
-		site_num = len(self.site_index)
-		for each_siteth in range(1, site_num + 1):
-			self.dict_hw_wind[each_siteth] = {}
-			for each_year in year_index:
-				self.dict_hw_wind[each_siteth][each_year] = {}
-				for each_month in WindData.month_name:
-					self.dict_hw_wind[each_siteth][each_year][each_month] = \
-					self.dict_ref_wind[each_siteth][each_year][each_month] * (ihw / ihref) ** ialpha
+		ref_wind = mcube.cto_cube(self.dict_ref_wind, len(self.site_index), self.start_year, self.end_year)
+		self.dict_hw_wind = mcube.NasaCube(ref_wind.site_num, self.start_year, self.end_year, \
+			ref_wind.data * (ihw / ihref) ** ialpha)
+		self.hw_param = (ihref, ihw, ialpha)
+		self.fuse_param = None
 		return self.dict_hw_wind
 
 	def cuv2cf(self, idata, ispeed_in, ispeed_out, ispeed_rate, inita):
@@ -169,31 +213,132 @@ class WindData(object):
 			lambda idata: (idata - ispeed_in) / (ispeed_rate - ispeed_in) * inita, 
 			1 * inita])
 
-	def cwind2cf(self, ispeed_in=3.0, ispeed_out=25.0, ispeed_rate=13.5, inita=0.95):
+	def cwind2cf(self, ispeed_in=3.0, ispeed_out=25.0, ispeed_rate=13.5, inita=0.95, ipower_curve=None):
 		'''Converter NASA wind speed to capacity factors.
+			The wind speed of all sites and years is converted at once, see init_power_curve.
 		Args:
-			idata: the source wind speed.
 			ispeed_in: cut-in speed.
 			ispeed_out: cut-out speed.
 			ispeed_rate: rate speed.
 			inita: the efficiency.
+			ipower_curve: PowerCurve, e.g. a tabulated curve of the manufacturer; 
+				None for the curve of ispeed_in, ispeed_out, ispeed_rate and inita.
 		Returns:
-			self.dict_wind_cf: capacity factors
+			self.dict_wind_cf: capacity factors, a NasaCube
 		'''
-		year_index = range(self.start_year, self.end_year+1)
-		site_num = len(self.site_index)
-		for each_siteth in range(1, site_num + 1):
-			self.dict_wind_cf[each_siteth]={}
-			for each_year in year_index:
-				self.dict_wind_cf[each_siteth][each_year]={}
-				for each_month in WindData.month_name:
-					self.dict_wind_cf[each_siteth][each_year][each_month] = \
-					self.cuv2cf(self.dict_hw_wind[each_siteth][each_year][each_month], \
-						ispeed_in, ispeed_out, ispeed_rate, inita)
+		if ipower_curve is None:
+			power_curve = mpc.PowerCurve.cfrom_param(ispeed_in, ispeed_out, ispeed_rate, inita)
+		else:
+			power_curve = ipower_curve
+		hw_wind = mcube.cto_cube(self.dict_hw_wind, len(self.site_index), self.start_year, self.end_year)
+		self.dict_wind_cf = mcube.NasaCube(hw_wind.site_num, self.start_year, self.end_year, \
+			power_curve.cspeed2cf(hw_wind.data))
+		self.dict_wind_cf0 = {}
+		self.cf_param = (ispeed_in, ispeed_out, ispeed_rate, inita, ipower_curve)
+		self.fuse_param = None
+		self.turbineth = None
+		return self.dict_wind_cf
+
+	def cref2cf(self, ihref=50.0, ihw=65.0, ialpha=0.35, ispeed_in=3.0, ispeed_out=25.0, ispeed_rate=13.5, 
+		inita=0.95, ipower_curve=None, icorrect=False, ikeep=('ref',)):
+		'''Converter the speed at reference height to capacity factors in one pass.
+			The same as cref2hw, cwind2cf and ccorrect_cf, but site by site into preallocated arrays, 
+			keeping only the arrays asked for; without 'ref', the speed at reference height is overwritten, 
+			so the peak memory is about one copy of the data, two if icorrect.
+		Args:
+			ihref, ihw, ialpha: see cref2hw.
+			ispeed_in, ispeed_out, ispeed_rate, inita, ipower_curve: see cwind2cf.
+			icorrect: True or False; correct the capacity factors by self.alpha and self.offset, see ccorrect_cf; 
+				stored corrected, not applied on reading; the uncorrected capacity factors are always kept 
+				in self.dict_wind_cf0, so that ccorrect_cf and ccal_corrcoef start from them.
+			ikeep: the other arrays kept, of 'ref' (self.dict_ref_wind) and 'hw' (self.dict_hw_wind); 
+				the others are emptied.
+		Returns:
+			self.dict_wind_cf: (corrected) capacity factors, a NasaCube
+		'''
+		if ipower_curve is None:
+			power_curve = mpc.PowerCurve.cfrom_param(ispeed_in, ispeed_out, ispeed_rate, inita)
+		else:
+			power_curve = ipower_curve
+		ref_wind = mcube.cto_cube(self.dict_ref_wind, len(self.site_index), self.start_year, self.end_year)
+		spare = None
+		if ('ref' not in ikeep) and ref_wind.data.flags.writeable and ref_wind.data.flags.c_contiguous:
+			spare = ref_wind.data
+		out = {}
+		for each_name in ('hw', 'cf0', 'cf'):
+			if (each_name == 'cf') or ((each_name == 'hw') and ('hw' in ikeep)) or ((each_name == 'cf0') and icorrect):
+				if spare is None:
+					out[each_name] = np.empty(ref_wind.data.shape, np.float32)
+				else:
+					out[each_name] = spare
+					spare = None
+		scale = (ihw / ihref) ** ialpha
+		if icorrect:
+			correct = mcube.ScaledCube(mcube.NasaCube(ref_wind.site_num, self.start_year, self.end_year, \
+				out.get('cf0', out['cf'])), self.alpha, self.offset)
+		for each_site in range(ref_wind.site_num):
+			if 'hw' in out:
+				speed = np.multiply(ref_wind.data[each_site], scale, out['hw'][each_site])
+			else:
+				speed = np.multiply(ref_wind.data[each_site], scale, out['cf'][each_site])
+			if 'cf0' in out:
+				power_curve.cspeed2cf(speed, out['cf0'][each_site])
+			else:
+				power_curve.cspeed2cf(speed, out['cf'][each_site])
+			if icorrect:
+				out['cf'][each_site] = correct.cslice(each_site, 0, ref_wind.day_num)
+		self.dict_ref_wind = ref_wind if ('ref' in ikeep) else {}
+		for (each_name, each_attr) in (('hw', 'dict_hw_wind'), ('cf0', 'dict_wind_cf0'), ('cf', 'dict_wind_cf')):
+			if each_name in out:
+				setattr(self, each_attr, mcube.NasaCube(ref_wind.site_num, self.start_year, self.end_year, out[each_name]))
+			else:
+				setattr(self, each_attr, {})
+		self.hw_param = (ihref, ihw, ialpha)
+		self.cf_param = (ispeed_in, ispeed_out, ispeed_rate, inita, ipower_curve)
+		self.fuse_param = (ihref, ihw, ialpha, ispeed_in, ispeed_out, ispeed_rate, inita, ipower_curve, icorrect, ikeep)
+		self.turbineth = None
+		return self.dict_wind_cf
+
+	def cturbines2cf(self, iturbines, ihref=50.0):
+		'''Converter NASA wind speed to capacity factors of several WTGs at once.
+			The speed at reference height is scaled to each WTGs height by broadcasting, 
+			and converted by the power curve of each WTGs in place, without importing again.
+		Args:
+			iturbines: list of (WTGs height, exponent coefficient, PowerCurve) of each WTGs;
+				the PowerCurve may be None for the default curve of cwind2cf.
+			ihref: the reference height.
+		Returns:
+			self.turbine_cf: float32 (turbine_num, site_num, day_num, 24) capacity factors.
+		'''
+		ref_wind = mcube.cto_cube(self.dict_ref_wind, len(self.site_index), self.start_year, self.end_year)
+		scale = np.array([(each[0] / ihref) ** each[1] for each in iturbines], np.float32)
+		self.turbine_cf = np.empty((len(iturbines),) + ref_wind.data.shape, np.float32)
+		np.multiply(ref_wind.data[np.newaxis], scale[:, np.newaxis, np.newaxis, np.newaxis], self.turbine_cf)
+		for each_turbineth, each_turbine in enumerate(iturbines):
+			power_curve = each_turbine[2]
+			if power_curve is None:
+				power_curve = mpc.PowerCurve.cfrom_param()
+			power_curve.cspeed2cf(self.turbine_cf[each_turbineth], self.turbine_cf[each_turbineth])
+		self.turbine_param = (list(iturbines), ihref)
+		return self.turbine_cf
+
+	def cselect_turbine(self, iturbineth):
+		'''Select the capacity factors of one WTGs as self.dict_wind_cf, e.g. for cass_attr_constr.
+		Args:
+			iturbineth: the serial number of WTGs in cturbines2cf.
+		Returns:
+			self.dict_wind_cf: capacity factors of the WTGs, a NasaCube view of self.turbine_cf.
+		'''
+		self.dict_wind_cf = mcube.NasaCube(len(self.site_index), self.start_year, self.end_year, \
+			self.turbine_cf[iturbineth - 1])
+		self.dict_wind_cf0 = {}
+		self.turbineth = iturbineth
 		return self.dict_wind_cf
 
 	def c2style_1month(self, imode=True):
 		'''Converter NASA data to 1 month style.
+			The arrays are views of the data, built once, or scaled on each access for the corrected data, 
+			see init_nasa_cube.NasaCube.cstyle.
 		Args:
 			imode: True or False; wind speed or capacity factors.
 		Returns:
@@ -203,20 +348,12 @@ class WindData(object):
 			dict_data = self.dict_wind_cf
 		else:
 			dict_data = self.dict_hw_wind
-		dict_data_1month = {}
-		year_index = range(self.start_year, self.end_year + 1)
-		site_num = len(self.site_index)
-		for each_siteth in range(1, site_num + 1):
-			dict_data_1month[each_siteth] = {}
-			for each_year in year_index:
-				dict_data_1month[each_siteth][each_year] = {}
-				for each_month in WindData.month_name:
-					dict_data_1month[each_siteth][each_year][each_month] = \
-					dict_data[each_siteth][each_year][each_month].reshape(1, -1)
-		return dict_data_1month
+		return mcube.cto_cube(dict_data, len(self.site_index), self.start_year, self.end_year).cstyle('1month')
 
 	def c2style_1year(self, imode=True):
 		'''Converter NASA data to 1 year style.
+			The arrays are views of the data, built once, or scaled on each access for the corrected data, 
+			see init_nasa_cube.NasaCube.cstyle.
 		Args:
 			imode: True or False; wind speed or capacity factors.
 		Returns:
@@ -226,35 +363,22 @@ class WindData(object):
 			dict_data = self.dict_wind_cf
 		else:
 			dict_data = self.dict_hw_wind
-		dict_data_1year = {}
-		year_index = range(self.start_year, self.end_year + 1)
-		site_num = len(self.site_index)
-		for each_siteth in range(1, site_num + 1):
-			dict_data_1year[each_siteth] = {};
-			for each_year in year_index:
-				dict_data_1year[each_siteth][each_year] = np.empty((1, 0), np.float32)
-				for each_month in WindData.month_name:
-					tmp = dict_data[each_siteth][each_year][each_month].reshape(1, -1)
-					dict_data_1year[each_siteth][each_year] = np.hstack((dict_data_1year[each_siteth][each_year], tmp))
-		return dict_data_1year
+		return mcube.cto_cube(dict_data, len(self.site_index), self.start_year, self.end_year).cstyle('1year')
 
 	def c2style_10year(self, imode=True):
 		'''Converter NASA data to 10 years style.
+			The arrays are views of the data, built once, or scaled on each access for the corrected data, 
+			see init_nasa_cube.NasaCube.cstyle.
 		Args:
 			imode: True or False; wind speed or capacity factors.
 		Returns:
 			dict_data_10year: data in 10 year style.
 		'''
-		dict_data_1year = self.c2style_1year(imode)
-		dict_data_10year = {}
-		year_index = range(self.start_year, self.end_year + 1)
-		site_num = len(self.site_index)
-		for each_siteth in range(1, site_num + 1):
-			dict_data_10year[each_siteth] = np.empty((1, 0), np.float32)
-			for each_year in year_index:
-				dict_data_10year[each_siteth] = \
-				np.hstack((dict_data_10year[each_siteth], dict_data_1year[each_siteth][each_year]))
-		return dict_data_10year
+		if imode == True:
+			dict_data = self.dict_wind_cf
+		else:
+			dict_data = self.dict_hw_wind
+		return mcube.cto_cube(dict_data, len(self.site_index), self.start_year, self.end_year).cstyle('10year')
 
 	def cselect_1site_1day(self, isiteth, iyear, imonth, iday, imode=True):
 		'''select data of 1 site, 1 day.
@@ -283,6 +407,12 @@ class WindData(object):
 		Returns:
 			data of 1 site, 1 month.
 		'''
+		if imode == True:
+			dict_data = self.dict_wind_cf
+		else:
+			dict_data = self.dict_hw_wind
+		if isinstance(dict_data, mcube.NasaCube):
+			return dict_data.cselect_site(isiteth, iyear, imonth)
 		return self.c2style_1month(imode)[isiteth][iyear][imonth]
 
 	def cselect_1site_1year(self, isiteth, iyear, imode=True):
@@ -294,6 +424,12 @@ class WindData(object):
 		Returns:
 			data of 1 site, 1 year.
 		'''
+		if imode == True:
+			dict_data = self.dict_wind_cf
+		else:
+			dict_data = self.dict_hw_wind
+		if isinstance(dict_data, mcube.NasaCube):
+			return dict_data.cselect_site(isiteth, iyear)
 		return self.c2style_1year(imode)[isiteth][iyear]
 
 	def cselect_1site_10year(self, isiteth, imode=True):
@@ -304,45 +440,239 @@ class WindData(object):
 		Returns:
 			data of 1 site, 10 year.
 		'''
+		if imode == True:
+			dict_data = self.dict_wind_cf
+		else:
+			dict_data = self.dict_hw_wind
+		if isinstance(dict_data, mcube.NasaCube):
+			return dict_data.cselect_site(isiteth)
 		return self.c2style_10year(imode)[isiteth]
 
+	def cselect_range(self, isites=None, itime_s=None, itime_e=None, iproduct='wind_cf'):
+		'''Select data of sites in a range of hours, see init_nasa_cube.NasaCube.cselect_range.
+		Args:
+			isites: list of the serial numbers of sites, None for all sites.
+			itime_s: the first hour; a time as datetime.datetime or '2012-03-15T06', or a flat hour offset, 
+				see init_time_axis.TimeAxis.chour_offset; the first hour of the data by default.
+			itime_e: the hour after the last hour; the end of the data by default.
+			iproduct: 'ref_wind', 'hw_wind', 'wind_cf' or 'wind_cf0', see cexport_archive.
+		Returns:
+			(site_num, hour_num) data; a view of the data if the data is a site-major NasaCube and 
+			the sites are evenly spaced in increasing order.
+		'''
+		cube = mcube.cto_cube(getattr(self, 'dict_' + iproduct), len(self.site_index), self.start_year, self.end_year)
+		return cube.cselect_range(isites, itime_s, itime_e)
+
+	def ctime_axis(self):
+		'''Get the time axis of the data, see init_time_axis.TimeAxis.
+		Args:
+			null.
+		Returns:
+			the TimeAxis from self.start_year to self.end_year, shared by the data of the same years.
+		'''
+		return mtime.ctime_axis(self.start_year, self.end_year)
+
+	def creduce(self, igroup, imode=True, ifunc='mean'):
+		'''Reduce the data of all sites by time groups, see init_time_axis.TimeAxis.creduce.
+		Args:
+			igroup: 'year', 'year_month', 'day', 'month', 'day_of_year', 'hour' or 'season'.
+			imode: True or False; wind speed or capacity factors.
+			ifunc: 'sum' or 'mean'.
+		Returns:
+			(site_num, group_num) float64 sums or means of each site, each group.
+		'''
+		if imode == True:
+			dict_data = self.dict_wind_cf
+		else:
+			dict_data = self.dict_hw_wind
+		cube = mcube.cto_cube(dict_data, len(self.site_index), self.start_year, self.end_year)
+		return cube.creduce(igroup, ifunc)
+
+	def cdiurnal(self, iutc_offset=8, ipercentile=(5, 25, 50, 75, 95), imode=True):
+		'''Get the climatology of each site, each month, each hour of day in local time, 
+			see init_nasa_cube.NasaCube.cdiurnal.
+		Args:
+			iutc_offset: int; the hours of local time ahead of UTC, 8 for China.
+			ipercentile: the percentiles in [0, 100].
+			imode: True or False; wind speed or capacity factors.
+		Returns:
+			(site_num, 12, 24) means, std, and (site_num, 12, 24, percentile_num) percentiles.
+		'''
+		if imode == True:
+			dict_data = self.dict_wind_cf
+		else:
+			dict_data = self.dict_hw_wind
+		cube = mcube.cto_cube(dict_data, len(self.site_index), self.start_year, self.end_year)
+		return cube.cdiurnal(iutc_offset, ipercentile)
+
+	def csite_stat(self, imode=True):
+		'''Get the statistics of all hours of each site, see init_nasa_cube.NasaCube.csite_stat.
+		Args:
+			imode: True or False; wind speed or capacity factors.
+		Returns:
+			(site_num,) sums, means and std of all hours.
+		'''
+		if imode == True:
+			dict_data = self.dict_wind_cf
+		else:
+			dict_data = self.dict_hw_wind
+		cube = mcube.cto_cube(dict_data, len(self.site_index), self.start_year, self.end_year)
+		return cube.csite_stat()
+
+	def cexport_archive(self, ifile_name, iproduct='wind_cf', ilayout='site'):
+		'''Export data to an archive file for memory mapping, see init_nasa_cube.csave_archive.
+		Args:
+			ifile_name: str; the archive file name.
+			iproduct: 'ref_wind', 'hw_wind', 'wind_cf' or 'wind_cf0'; wind speed at reference height, 
+				at WTGs height, capacity factors or uncorrected capacity factors.
+			ilayout: 'site' or 'time'; site-major or time-major layout.
+		Returns:
+			null.
+		'''
+		cube = mcube.cto_cube(getattr(self, 'dict_' + iproduct), len(self.site_index), self.start_year, self.end_year)
+		mcube.csave_archive(cube, ifile_name, ilayout, {'product': iproduct, 
+			'unit': WindData.product_unit[iproduct], 'site_index': [list(each) for each in self.site_index]})
+
+	def cimport_archive(self, ifile_name, iproduct=None, imode='r'):
+		'''Import data from an archive file by memory mapping, see init_nasa_cube.cload_archive.
+		Args:
+			ifile_name: str; the archive file name.
+			iproduct: the product, see cexport_archive; the product of the archive by default.
+			imode: 'r', 'r+' or 'c'; the mode of numpy.memmap.
+		Returns:
+			the imported data.
+		'''
+		(cube, header) = mcube.cload_archive(ifile_name, imode)
+		if iproduct is None:
+			iproduct = header['product']
+		site_num = len(self.site_index)
+		if (cube.site_num, cube.start_year, cube.end_year) != (site_num, self.start_year, self.end_year):
+			raise ValueError('the archive of %d sites, %d-%d does not match the data of %d sites, %d-%d' \
+				% (cube.site_num, cube.start_year, cube.end_year, site_num, self.start_year, self.end_year))
+		site_index = [list(each) for each in self.site_index]
+		if header.get('site_index', site_index) != site_index:
+			raise ValueError('the archive of the list site indice %s does not match the data of %s' \
+				% (header['site_index'], site_index))
+		unit = WindData.product_unit[iproduct]
+		if header.get('unit', unit) != unit:
+			raise ValueError('the archive of %s in %s does not match %s in %s' \
+				% (header.get('product'), header['unit'], iproduct, unit))
+		setattr(self, 'dict_' + iproduct, cube)
+		return cube
+
+	def cuncorrected_cf(self):
+		'''Get the uncorrected capacity factors.
+		Args:
+		Returns:
+			the NasaCube of the uncorrected capacity factors.
+		'''
+		if len(self.dict_wind_cf0) > 0:
+			dict_data = self.dict_wind_cf0
+		else:
+			dict_data = self.dict_wind_cf
+		return mcube.cto_cube(dict_data, len(self.site_index), self.start_year, self.end_year)
+
 	def ccal_corrcoef(self, irelmean=0.2100):
 		'''Calculate the correction factors.
 		Args:
 			irelmean: the in-situ measured capacity factors, 
-				the annual average capacity factor of the study region.
+				the annual average capacity factor of the study region, or the vector of each site.
 		Returns:
-			alpha: the calculated correction factor for the study region.
-		'''
-		dict_data_10year = self.cdata2AllYearStyle(True)
-		ur = irelmean
-		N = len(self.ipoint_idex)
-		us = 0
-		for each_siteth in range(1, N+1, 1):
-			us += np.mean(dict_data_10year[each_siteth], axis=1)
-			corfactors = ur * N * 1.0 / us
-			self.alpha = corfactors[0,]
+			alpha: the calculated correction factor for the study region, or the vector of each site.
+		'''
+		us = np.mean(self.cuncorrected_cf().data, axis=(1, 2), dtype=np.float64)
+		if np.ndim(irelmean) == 0:
+			self.alpha = irelmean * len(us) * 1.0 / np.sum(us)
+		else:
+			self.alpha = (np.asarray(irelmean, np.float64) / us).astype(np.float32)
+		self.offset = 0
 		return self.alpha
 
-	def ccorrect_cf(self):
-		'''Correct the simulated capacity factors in the study region.
+	def ccalibrate(self, iobserved, imode='scale'):
+		'''Calibrate the capacity factors of each site, each month against in-situ measured capacity factors.
+			All sites are fitted at once, see init_calibration.cfit_factor, and corrected on reading, see ccorrect_cf.
+			The sites and months without a valid fit, e.g. not measured, are left uncorrected (gain 1, offset 0) 
+			and marked True in the (site_num, 12) self.cal_fallback; check it after calibrating.
 		Args:
+			iobserved: the measured average capacity factors, NaN if not measured;
+				(site_num, year_num, 12) of each month, or (site_num, year_num) of each year.
+			imode: 'scale' or 'linear'; fit a gain, or a gain and an offset.
 		Returns:
 			dict_wind_cf0: the uncorrected capacity factors
 			dict_wind_cf: the corrected capacity factors
 		'''
-		year_index = range(self.start_year, self.end_year + 1)
-		site_num = len(self.site_index)
-		for each_siteth in range(1, site_num + 1):
-			self.dict_wind_cf0[each_siteth]={}
-			for each_year in year_index:
-				self.dict_wind_cf0[each_siteth][each_year]={}
-				for each_month in WindData.month_name:
-					self.dict_wind_cf0[each_siteth][each_year][each_month] = self.dict_wind_cf[each_siteth][each_year][each_month]
-					self.dict_wind_cf[each_siteth][each_year][each_month] = self.dict_wind_cf[each_siteth][each_year][each_month] * self.alpha
-		return dict_wind_cf0, dict_wind_cf
+		(gain, offset, self.cal_fallback) = mcal.cfit_factor(self.cuncorrected_cf(), iobserved, imode)
+		return self.ccorrect_cf(gain, offset)
 
-	def
+	def ccorrect_cf(self, ialpha=None, ioffset=None):
+		'''Correct the simulated capacity factors in the study region.
+			The correction is applied on reading, the capacity factors are not copied, 
+			so correcting again, e.g. by another alpha of ccal_corrcoef, costs nothing.
+		Args:
+			ialpha: the correction factor, a scalar, the vector of each site or the (site_num, 12) array of 
+				each site, each month; self.alpha by default.
+			ioffset: the offset added after correction, the same shapes as ialpha; self.offset by default.
+		Returns:
+			dict_wind_cf0: the uncorrected capacity factors
+			dict_wind_cf: the corrected capacity factors, a ScaledCube of dict_wind_cf0
+		'''
+		if ialpha is not None:
+			self.alpha = ialpha
+		if ioffset is not None:
+			self.offset = ioffset
+		self.dict_wind_cf0 = self.cuncorrected_cf()
+		self.dict_wind_cf = mcube.ScaledCube(self.dict_wind_cf0, self.alpha, self.offset)
+		return self.dict_wind_cf0, self.dict_wind_cf
+
+	def cappend_year(self, iend_year=None, iprocess_num=1, ihyperslab=False, icache_path=None):
+		'''Append the following years without importing the former years again.
+			The wind speed at WTGs height, the (corrected) capacity factors and the capacity factors 
+			of several WTGs calculated before are extended with the same parameters and correction factor.
+		Args:
+			iend_year: the new end year, self.end_year + 1 by default.
+			iprocess_num: the number of processes reading the daily files, 1 for serial reading.
+			ihyperslab: True or False; read only the bounding window of the sites from each file.
+			icache_path: str; the folder name of the cache of decoded data, None for no cache.
+		Returns: 
+			self.dict_ref_wind: imported data of all years.
+		'''
+		if iend_year is None:
+			iend_year = self.end_year + 1
+		new_data = WindData(self.file_name, self.site_index, self.end_year + 1, iend_year)
+		new_data.cimport_data(self.data_name, iprocess_num, tuple(self.dict_field.keys()), ihyperslab, icache_path)
+		new_data.alpha = self.alpha
+		new_data.offset = self.offset
+		if self.turbine_param is not None:
+			new_data.cturbines2cf(*self.turbine_param)
+		if self.fuse_param is not None:
+			new_data.cref2cf(*self.fuse_param)
+		else:
+			if len(self.dict_hw_wind) > 0:
+				new_data.cref2hw(*self.hw_param)
+			if self.turbineth is not None:
+				new_data.cselect_turbine(self.turbineth)
+			elif len(self.dict_wind_cf) > 0:
+				new_data.cwind2cf(*self.cf_param)
+		scaled = isinstance(self.dict_wind_cf, mcube.ScaledCube)
+		if scaled:
+			new_data.ccorrect_cf()
+		for each_name in ('dict_ref_wind', 'dict_hw_wind', 'dict_wind_cf', 'dict_wind_cf0'):
+			if (each_name == 'dict_wind_cf') and scaled:
+				continue
+			if len(getattr(self, each_name)) > 0:
+				setattr(self, each_name, mcube.cappend_years(getattr(self, each_name), \
+					getattr(new_data, each_name), new_data.start_year, iend_year))
+		for each_name in self.dict_field.keys():
+			self.dict_field[each_name] = mcube.cappend_years(self.dict_field[each_name], \
+				new_data.dict_field[each_name], new_data.start_year, iend_year)
+		if self.turbine_param is not None:
+			self.turbine_cf = np.concatenate((self.turbine_cf, new_data.turbine_cf), axis=2)
+		self.end_year = iend_year
+		if scaled:
+			self.ccorrect_cf()
+		elif self.turbineth is not None:
+			self.cselect_turbine(self.turbineth)
+		return self.dict_ref_wind
 
 
 
@@ -355,6 +685,9 @@ if __name__ == '__main__':
 
 	wind_data = WindData(file_name, wind_site_index, start_year, end_year)
 	wind_speed_ref = wind_data.cimport_data()
+	# import init_nasa_solar as msolar
+	# solar_data = msolar.SolarData('sd_solar_data', wind_site_index, start_year, end_year, file_name)
+	# wind_speed_ref = wind_data.cimport_data(isolar_data=solar_data)
 	wind_speed_hw = wind_data.cref2hw()
 	wind_capacity_factor = wind_data.cwind2cf()
 	WTGcorrcoef = wind_data.ccal_corrcoef(0.2100)
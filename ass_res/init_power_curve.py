@@ -0,0 +1,104 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 21:08:44 2026
+########################################################################################
+# @ File name: init_power_curve.py
+# @ Function: The class of power curves of WTGs.
+# 	Converting the whole wind speed array to capacity factors, in float32 and in place.
+# @ Author: Yongji Cao, Hengxu Zhang
+# @ Version: 1.0
+# @ Revision date: Oct/18/2026
+# @ Copyright (c) 2016-2026 School of Electrical Engineering, Shandong University, China
+########################################################################################
+"""
+
+
+import numpy as np
+
+
+class PowerCurve(object):
+	'''Power curve of WTGs class.
+		Either the cut-in, rated and cut-out speeds of WindData.cuv2cf,
+		or a tabulated curve of the manufacturer, linearly interpolated.
+	'''
+	chunk_size = 1 << 20
+
+	def __init__(self, ispeed, icf, inita=1.0):
+		'''Create a tabulated power curve.
+		Args:
+			ispeed: the increasing wind speeds of the table.
+			icf: the capacity factors (power / rated power) at ispeed;
+				0 below the first speed and above the last speed (cut-out).
+			inita: the efficiency.
+		Returns:
+			an instances
+		'''
+		self.speed = np.asarray(ispeed, np.float64)
+		self.cf = np.asarray(icf, np.float64) * inita
+		if (self.speed.ndim != 1) or (self.speed.shape != self.cf.shape):
+			raise ValueError('the speeds and capacity factors of a power curve must be 1-D of the same length')
+		if np.any(np.diff(self.speed) <= 0):
+			raise ValueError('the speeds of a power curve must be increasing')
+		self.param = None
+
+	@classmethod
+	def cfrom_param(cls, ispeed_in=3.0, ispeed_out=25.0, ispeed_rate=13.5, inita=0.95):
+		'''Create the power curve of the cut-in, rated and cut-out speeds, see WindData.cuv2cf.
+		Args:
+			ispeed_in: cut-in speed.
+			ispeed_out: cut-out speed.
+			ispeed_rate: rate speed.
+			inita: the efficiency.
+		Returns:
+			an instances
+		'''
+		ocurve = cls([ispeed_in, ispeed_rate, ispeed_out, np.nextafter(ispeed_out, np.inf)],
+			[0.0, inita, inita, 0.0])
+		ocurve.param = (ispeed_in, ispeed_out, ispeed_rate, inita)
+		return ocurve
+
+	def cspeed2cf_chunk(self, ispeed, ocf):
+		'''Convert a 1-D chunk of wind speed to capacity factors.
+			NaN speeds give 0 as the piecewise WindData.cuv2cf.
+		Args:
+			ispeed: the wind speed.
+			ocf: the float32 array to write in, may be ispeed itself.
+		Returns:
+			null.
+		'''
+		if self.param is None:
+			nan_mask = np.isnan(ispeed)
+			ocf[:] = np.interp(ispeed, self.speed, self.cf, 0.0, 0.0)
+			np.copyto(ocf, 0, where=nan_mask)
+			return
+		(ispeed_in, ispeed_out, ispeed_rate, inita) = self.param
+		with np.errstate(invalid='ignore'):
+			zero_mask = ~np.logical_and(ispeed >= ispeed_in, ispeed <= ispeed_out)
+			rate_mask = ispeed > ispeed_rate
+		np.subtract(ispeed, ispeed_in, ocf)
+		ocf /= (ispeed_rate - ispeed_in)
+		ocf *= inita
+		np.copyto(ocf, inita, where=rate_mask)
+		np.copyto(ocf, 0, where=zero_mask)
+
+	def cspeed2cf(self, idata, iout=None):
+		'''Convert wind speed to capacity factors.
+			The array is converted chunk by chunk, with no full-size temporaries.
+		Args:
+			idata: float32 array; the wind speed at WTGs height.
+			iout: float32 array of the same shape to write in, may be idata itself; a new array by default.
+		Returns:
+			iout: capacity factors.
+		'''
+		if iout is None:
+			iout = np.empty(idata.shape, np.float32)
+		if not (iout.flags.c_contiguous and idata.flags.c_contiguous):
+			iout[...] = self.cspeed2cf(np.ascontiguousarray(idata))
+			return iout
+		flat_speed = idata.reshape(-1)
+		flat_cf = iout.reshape(-1)
+		for each_start in range(0, flat_speed.size, PowerCurve.chunk_size):
+			each_end = each_start + PowerCurve.chunk_size
+			self.cspeed2cf_chunk(flat_speed[each_start:each_end], flat_cf[each_start:each_end])
+		return iout
@@ -0,0 +1,112 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 23:47:31 2026
+########################################################################################
+# @ File name: init_pv_model.py
+# @ Function: The class of PV models.
+# 	Converting the whole solar irradiation and ambient temperature arrays to capacity factors,
+# 	in float32 and in place.
+# @ Author: Yongji Cao, Hengxu Zhang
+# @ Version: 1.0
+# @ Revision date: Oct/18/2026
+# @ Copyright (c) 2016-2026 School of Electrical Engineering, Shandong University, China
+########################################################################################
+"""
+
+
+import numpy as np
+
+
+class PvModel(object):
+	'''PV model class.
+		PV Model1: Ff = (idata * iarea_m2 * ieffi_ratio) / irated_powr
+		PV Model2: Ff = (idataf / iHSTC) * iC1 * (1 + iC2(Tf - iTSTC))
+					Tf = idatat + idataf * (iTfTETC - iTaTETC) / iHTETC
+		see SolarData.csolar2cf_model1 and SolarData.csolar2cf_model2.
+	'''
+	chunk_size = 1 << 20
+
+	def __init__(self, imodel, iparam):
+		'''Create an object.
+		Args:
+			imodel: 1 or 2; the PV model.
+			iparam: the parameters of SolarData.csolar2cf_model1 or SolarData.csolar2cf_model2, in order.
+		Returns:
+			an instances
+		'''
+		if imodel not in (1, 2):
+			raise ValueError('unknown PV model: %s' % str(imodel))
+		self.model = imodel
+		self.param = tuple(iparam)
+
+	@classmethod
+	def cfrom_model1(cls, irated_powr=255.0, iarea_m2=1.6368, ieffi_ratio=0.1248):
+		'''Create the PV model1, see SolarData.csolar2cf_model1.'''
+		return cls(1, (irated_powr, iarea_m2, ieffi_ratio))
+
+	@classmethod
+	def cfrom_model2(cls, iHSTC=1000.0, iC1=0.93, iC2=-0.005, iTSTC=25.0, iTfTETC=47.0, iTaTETC=20.0, iHTETC=800.0):
+		'''Create the PV model2, see SolarData.csolar2cf_model2.'''
+		return cls(2, (iHSTC, iC1, iC2, iTSTC, iTfTETC, iTaTETC, iHTETC))
+
+	def csolar2cf_chunk(self, isolar, itemperature, ocf, itmp):
+		'''Convert a 1-D chunk of solar irradiation to capacity factors.
+		Args:
+			isolar: the solar irradiation.
+			itemperature: the ambient temperature in K, only for model2.
+			ocf: the float32 array to write in, not isolar or itemperature for model2.
+			itmp: a float32 array of the same size, used as a temporary.
+		Returns:
+			null.
+		'''
+		if self.model == 1:
+			(irated_powr, iarea_m2, ieffi_ratio) = self.param
+			np.multiply(isolar, ieffi_ratio, ocf)
+			ocf *= iarea_m2
+			ocf /= irated_powr
+			return
+		(iHSTC, iC1, iC2, iTSTC, iTfTETC, iTaTETC, iHTETC) = self.param
+		np.multiply(isolar, (iTfTETC - iTaTETC), itmp)
+		itmp /= iHTETC
+		np.subtract(itemperature, 273.15, ocf)
+		ocf -= iTSTC
+		ocf += itmp
+		ocf *= iC2
+		ocf += 1
+		np.divide(isolar, iHSTC, itmp)
+		itmp *= iC1
+		ocf *= itmp
+
+	def csolar2cf(self, isolar, itemperature=None, iout=None, iclip=False):
+		'''Convert solar irradiation to capacity factors.
+			The arrays are converted chunk by chunk, with no full-size temporaries.
+		Args:
+			isolar: float32 array; the solar irradiation.
+			itemperature: float32 array of the same shape; the ambient temperature in K, only for model2.
+			iout: float32 array of the same shape to write in, may be isolar itself for model1;
+				a new array by default.
+			iclip: True or False; clip the capacity factors to [0, 1].
+		Returns:
+			iout: capacity factors.
+		'''
+		if iout is None:
+			iout = np.empty(isolar.shape, np.float32)
+		arrays = [isolar, iout] if self.model == 1 else [isolar, itemperature, iout]
+		if not all([each.flags.c_contiguous for each in arrays]):
+			iout[...] = self.csolar2cf(np.ascontiguousarray(isolar), \
+				None if itemperature is None else np.ascontiguousarray(itemperature), None, iclip)
+			return iout
+		flat_solar = isolar.reshape(-1)
+		flat_temperature = None if self.model == 1 else itemperature.reshape(-1)
+		flat_cf = iout.reshape(-1)
+		tmp = np.empty(min(PvModel.chunk_size, flat_solar.size), np.float32)
+		for each_start in range(0, flat_solar.size, PvModel.chunk_size):
+			each_end = each_start + PvModel.chunk_size
+			chunk_cf = flat_cf[each_start:each_end]
+			self.csolar2cf_chunk(flat_solar[each_start:each_end], \
+				None if flat_temperature is None else flat_temperature[each_start:each_end], \
+				chunk_cf, tmp[:chunk_cf.size])
+			if iclip:
+				np.clip(chunk_cf, 0, 1, chunk_cf)
+		return iout
@@ -0,0 +1,164 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 23:56:09 2026
+########################################################################################
+# @ File name: init_solar_position.py
+# @ Function: Solar position and plane-of-array irradiation.
+# 	Solar zenith and azimuth of all sites and hours, Erbs decomposition of the horizontal irradiation,
+# 	and isotropic transposition to fixed-tilt or single-axis tracking PV modules.
+# @ Author: Yongji Cao, Hengxu Zhang
+# @ Version: 1.0
+# @ Revision date: Oct/18/2026
+# @ Copyright (c) 2016-2026 School of Electrical Engineering, Shandong University, China
+########################################################################################
+"""
+
+
+import datetime
+import numpy as np
+
+
+solar_constant = 1367.0
+
+
+def cday_param(istart_year, iend_year):
+	'''Calculate the declination, equation of time and extraterrestrial irradiation of each day (Spencer, 1971).
+	Args:
+		istart_year: int; the start year.
+		iend_year: int; the end year.
+	Returns:
+		odeclination: (day_num,) declination in rad.
+		oequation: (day_num,) equation of time in minutes.
+		oextra: (day_num,) extraterrestrial irradiation on a normal surface in W/m2.
+	'''
+	first_day = datetime.date(istart_year, 1, 1).toordinal()
+	last_day = datetime.date(iend_year, 12, 31).toordinal()
+	dates = [datetime.date.fromordinal(each) for each in range(first_day, last_day + 1)]
+	day_th = np.array([each.timetuple().tm_yday for each in dates], np.float64)
+	year_days = np.array([366.0 if each.replace(month=12, day=31).timetuple().tm_yday == 366 else 365.0 \
+		for each in dates])
+	gama = 2 * np.pi * (day_th - 1) / year_days
+	odeclination = 0.006918 - 0.399912 * np.cos(gama) + 0.070257 * np.sin(gama) \
+		- 0.006758 * np.cos(2 * gama) + 0.000907 * np.sin(2 * gama) \
+		- 0.002697 * np.cos(3 * gama) + 0.00148 * np.sin(3 * gama)
+	oequation = 229.18 * (0.000075 + 0.001868 * np.cos(gama) - 0.032077 * np.sin(gama) \
+		- 0.014615 * np.cos(2 * gama) - 0.040849 * np.sin(2 * gama))
+	oextra = solar_constant * (1.000110 + 0.034221 * np.cos(gama) + 0.001280 * np.sin(gama) \
+		+ 0.000719 * np.cos(2 * gama) + 0.000077 * np.sin(2 * gama))
+	return odeclination, oequation, oextra
+
+
+def csun_vector(ilat, ilon, iday_param):
+	'''Calculate the unit vector to the sun of each site, each hour.
+		The hours are UTC hourly averages of NASA files, evaluated at the middle of each hour.
+	Args:
+		ilat: (site_num,) latitude in degree, north positive.
+		ilon: (site_num,) longitude in degree, east positive.
+		iday_param: the output of cday_param.
+	Returns:
+		(site_num, day_num, 24) east, north and up components.
+	'''
+	(declination, equation, extra) = iday_param
+	lat = np.radians(np.asarray(ilat, np.float64)).reshape(-1, 1, 1)
+	lon = np.asarray(ilon, np.float64).reshape(-1, 1, 1)
+	solar_time = np.arange(24).reshape(1, 1, -1) + 0.5 + lon / 15.0 + equation.reshape(1, -1, 1) / 60.0
+	hour_angle = np.radians((solar_time - 12.0) * 15.0)
+	declination = declination.reshape(1, -1, 1)
+	oeast = -np.cos(declination) * np.sin(hour_angle)
+	onorth = np.sin(declination) * np.cos(lat) - np.cos(declination) * np.sin(lat) * np.cos(hour_angle)
+	oup = np.sin(declination) * np.sin(lat) + np.cos(declination) * np.cos(lat) * np.cos(hour_angle)
+	return oeast, onorth, oup
+
+
+def csolar_position(ilat, ilon, istart_year, iend_year):
+	'''Calculate the solar zenith and azimuth of each site, each hour.
+	Args:
+		ilat: (site_num,) latitude in degree, north positive.
+		ilon: (site_num,) longitude in degree, east positive.
+		istart_year: int; the start year.
+		iend_year: int; the end year.
+	Returns:
+		ozenith: float32 (site_num, day_num, 24) zenith in degree.
+		oazimuth: float32 (site_num, day_num, 24) azimuth in degree, clockwise from north.
+	'''
+	(east, north, up) = csun_vector(ilat, ilon, cday_param(istart_year, iend_year))
+	ozenith = np.degrees(np.arccos(np.clip(up, -1.0, 1.0))).astype(np.float32)
+	oazimuth = (np.degrees(np.arctan2(east, north)) % 360.0).astype(np.float32)
+	return ozenith, oazimuth
+
+
+def cerbs(ighi, icos_zenith, iextra):
+	'''Decompose the global horizontal irradiation into beam and diffuse parts (Erbs, 1982).
+	Args:
+		ighi: global horizontal irradiation in W/m2.
+		icos_zenith: cosine of the solar zenith.
+		iextra: extraterrestrial irradiation on a normal surface in W/m2.
+	Returns:
+		odni: direct normal irradiation.
+		odhi: diffuse horizontal irradiation.
+	'''
+	day_mask = icos_zenith > 0.065
+	cos_zenith = np.where(day_mask, icos_zenith, 1.0)
+	kt = np.clip(ighi / (iextra * cos_zenith), 0.0, 1.0)
+	fraction = np.where(kt <= 0.22, 1.0 - 0.09 * kt,
+		np.where(kt <= 0.80, 0.9511 - 0.1604 * kt + 4.388 * kt ** 2 - 16.638 * kt ** 3 + 12.336 * kt ** 4, 0.165))
+	fraction = np.where(day_mask, fraction, 1.0)
+	odhi = ighi * fraction
+	odni = (ighi - odhi) / cos_zenith
+	return odni, odhi
+
+
+def cpoa(ighi, ilat, ilon, istart_year, iend_year, itilt=None, iazimuth=None, itracking=False,
+	imax_angle=60.0, ialbedo=0.2, isite_chunk=8):
+	'''Calculate the plane-of-array irradiation of PV modules of each site, each hour.
+		Erbs decomposition and isotropic sky transposition, site chunk by site chunk.
+	Args:
+		ighi: (site_num, day_num, 24) global horizontal irradiation in W/m2, e.g. SWGDN of rad_Nx files.
+		ilat: (site_num,) latitude in degree, north positive.
+		ilon: (site_num,) longitude in degree, east positive.
+		istart_year: int; the start year.
+		iend_year: int; the end year.
+		itilt: the tilt of fixed modules in degree, a scalar or (site_num,); the latitude by default.
+		iazimuth: the azimuth of fixed modules, or of the axis of tracking modules, in degree clockwise from north, 
+			a scalar or (site_num,); facing the equator by default.
+		itracking: True or False; single-axis tracking modules on a horizontal axis, or fixed modules.
+		imax_angle: the max rotation angle of tracking modules in degree.
+		ialbedo: the ground albedo.
+		isite_chunk: int; the number of sites calculated at a time.
+	Returns:
+		opoa: float32 (site_num, day_num, 24) plane-of-array irradiation in W/m2.
+	'''
+	site_num = ighi.shape[0]
+	lat = np.asarray(ilat, np.float64).reshape(-1)
+	lon = np.asarray(ilon, np.float64).reshape(-1)
+	if itilt is None:
+		tilt = np.radians(np.abs(lat))
+	else:
+		tilt = np.radians(np.broadcast_to(np.asarray(itilt, np.float64), (site_num,)))
+	if iazimuth is None:
+		azimuth = np.where(lat >= 0, np.pi, 0.0)
+	else:
+		azimuth = np.radians(np.broadcast_to(np.asarray(iazimuth, np.float64), (site_num,)))
+	day_param = cday_param(istart_year, iend_year)
+	extra = day_param[2].reshape(1, -1, 1)
+	opoa = np.empty(ighi.shape, np.float32)
+	for each_start in range(0, site_num, isite_chunk):
+		sites = slice(each_start, min(each_start + isite_chunk, site_num))
+		(east, north, up) = csun_vector(lat[sites], lon[sites], day_param)
+		ghi = np.asarray(ighi[sites], np.float64)
+		(dni, dhi) = cerbs(ghi, up, extra)
+		each_azimuth = azimuth[sites].reshape(-1, 1, 1)
+		if itracking:
+			across = east * np.cos(each_azimuth) - north * np.sin(each_azimuth)
+			rotation = np.clip(np.arctan2(across, np.maximum(up, 0.0)), -np.radians(imax_angle), np.radians(imax_angle))
+			cos_incidence = np.sin(rotation) * across + np.cos(rotation) * up
+			cos_tilt = np.cos(rotation)
+		else:
+			each_tilt = tilt[sites].reshape(-1, 1, 1)
+			cos_incidence = np.sin(each_tilt) * (np.sin(each_azimuth) * east + np.cos(each_azimuth) * north) \
+				+ np.cos(each_tilt) * up
+			cos_tilt = np.cos(each_tilt)
+		poa = dni * np.maximum(cos_incidence, 0.0) + dhi * (1 + cos_tilt) / 2 + ghi * ialbedo * (1 - cos_tilt) / 2
+		opoa[sites] = np.where(up > 0, poa, 0.0)
+	return opoa
@@ -0,0 +1,295 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 23:59:31 2026
+########################################################################################
+# @ File name: init_time_axis.py
+# @ Function: The class of the time axis of NASA data.
+# 	Calendar of the hours from the start year to the end year, shared by WindData, SolarData and NasaCube,
+# 	mapping time to flat hour offsets, and group indice for grouped reductions.
+# @ Author: Yongji Cao, Hengxu Zhang
+# @ Version: 1.0
+# @ Revision date: Oct/18/2026
+# @ Copyright (c) 2016-2026 School of Electrical Engineering, Shandong University, China
+########################################################################################
+"""
+
+
+import numpy as np
+
+
+month_name = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+	'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+leap_days = (31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+nonleap_days = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+season_name = ('Spring', 'Summer', 'Autumn', 'Winter')
+month_season = (3, 3, 0, 0, 0, 1, 1, 1, 2, 2, 2, 3)
+axis_cache = {}
+
+
+def cis_leap(iyear):
+	'''Check a leap year.
+	Args:
+		iyear: the year.
+	Returns:
+		True or False.
+	'''
+	return (iyear % 400 == 0) or ((iyear % 4 == 0) and (iyear % 100 != 0))
+
+
+def ctime_axis(istart_year, iend_year):
+	'''Get the TimeAxis of a year range, built once and shared.
+	Args:
+		istart_year: int; the start year.
+		iend_year: int; the end year.
+	Returns:
+		the TimeAxis.
+	'''
+	if (istart_year, iend_year) not in axis_cache:
+		axis_cache[(istart_year, iend_year)] = TimeAxis(istart_year, iend_year)
+	return axis_cache[(istart_year, iend_year)]
+
+
+class TimeAxis(object):
+	'''Time axis class.
+		The hours of all days from the start year to the end year, in the (day_num, 24) layout of NASA data;
+		the flat hour offset is dayth * 24 + hour, UTC as NASA files.
+		Groups: 'year', 'year_month' (each month of each year), 'day' (each day), 'month' (each month of all years),
+		'day_of_year' (the 366 calendar dates of all years, Feb 29 is the group 59 and empty in non-leap years so that
+		the same date has the same group), 'hour' (hour of day of all days) and 'season' (spring, summer, autumn and
+		winter of all years, winter is Dec, Jan and Feb of the same year).
+	'''
+	group_name = ('year', 'year_month', 'day', 'month', 'day_of_year', 'hour', 'season')
+	contiguous_group = ('year', 'year_month', 'day')
+
+	def __init__(self, istart_year, iend_year):
+		'''Create an object.
+		Args:
+			istart_year: int; the start year.
+			iend_year: int; the end year.
+		Returns:
+			an instances
+		'''
+		if iend_year < istart_year:
+			raise ValueError('the end year %d is before the start year %d' % (iend_year, istart_year))
+		self.start_year = istart_year
+		self.end_year = iend_year
+		self.year_index = list(range(istart_year, iend_year + 1))
+		self.year_num = len(self.year_index)
+		self.month_offset = {}
+		month_days = []
+		for each_year in self.year_index:
+			if cis_leap(each_year):
+				month_days.extend(leap_days)
+			else:
+				month_days.extend(nonleap_days)
+		self.month_start = np.concatenate(([0], np.cumsum(month_days)[:-1])).astype(np.intp)
+		self.day_num = int(np.sum(month_days))
+		self.hour_num = self.day_num * 24
+		for each_yearth in range(self.year_num):
+			for each_monthth in range(0, 12, 1):
+				each_th = each_yearth * 12 + each_monthth
+				self.month_offset[(self.year_index[each_yearth], month_name[each_monthth])] = \
+				(int(self.month_start[each_th]), int(self.month_start[each_th] + month_days[each_th]))
+		self.year_start = self.month_start[::12]
+		self.day_year_month = np.repeat(np.arange(self.year_num * 12), month_days)
+		self.day_month = self.day_year_month % 12
+		self.day_year = self.day_year_month // 12
+		self.day_of_year = np.arange(self.day_num) - self.year_start[self.day_year]
+		nonleap = ~np.array([cis_leap(each_year) for each_year in self.year_index])[self.day_year]
+		self.day_of_year[nonleap & (self.day_of_year >= 59)] += 1
+		self.origin = np.datetime64('%04d-01-01T00' % istart_year, 'h')
+		self.group_cache = {}
+
+	def cmonth_th(self, imonth):
+		'''Get the serial number of a month.
+		Args:
+			imonth: the month, a name as month_name or 1 to 12.
+		Returns:
+			0 to 11.
+		'''
+		if imonth in month_name:
+			return month_name.index(imonth)
+		if not 1 <= imonth <= 12:
+			raise ValueError('unknown month: %s' % str(imonth))
+		return imonth - 1
+
+	def cday_index(self, iyear, imonth, iday):
+		'''Get the serial number of a day.
+		Args:
+			iyear: the year.
+			imonth: the month, a name as month_name or 1 to 12.
+			iday: the day of the month.
+		Returns:
+			the index of the day axis.
+		'''
+		return self.month_offset[(iyear, month_name[self.cmonth_th(imonth)])][0] + iday - 1
+
+	def cto_hour(self, itime):
+		'''Map time to the flat hour offset, not checked.
+		Args:
+			itime: see chour_offset.
+		Returns:
+			int64 array; dayth * 24 + hour.
+		'''
+		time = np.asarray(itime)
+		if np.issubdtype(time.dtype, np.integer):
+			return time.astype(np.int64)
+		return (np.asarray(time, 'datetime64[h]') - self.origin).astype(np.int64)
+
+	def chour_offset(self, itime):
+		'''Map time to the flat hour offset.
+		Args:
+			itime: datetime.datetime, datetime.date, numpy.datetime64, a string as '2008-02-29T13',
+				or an array of them; UTC, truncated to the hour. An int is the flat hour offset itself.
+		Returns:
+			int, or an array of int64; dayth * 24 + hour.
+		'''
+		ohour = self.cto_hour(itime)
+		if np.any(ohour < 0) or np.any(ohour >= self.hour_num):
+			raise IndexError('the time is out of %d-%d' % (self.start_year, self.end_year))
+		if ohour.ndim == 0:
+			return int(ohour)
+		return ohour
+
+	def chour_range(self, itime_s=None, itime_e=None):
+		'''Map a range of time to flat hour offsets.
+		Args:
+			itime_s: the first hour, see chour_offset; the first hour of the axis by default.
+			itime_e: the hour after the last hour, see chour_offset; the end of the axis by default.
+		Returns:
+			ohour_s: int; the first flat hour offset.
+			ohour_e: int; the flat hour offset after the last hour.
+		'''
+		ohour_s = 0 if itime_s is None else int(self.cto_hour(itime_s))
+		ohour_e = self.hour_num if itime_e is None else int(self.cto_hour(itime_e))
+		if not 0 <= ohour_s <= ohour_e <= self.hour_num:
+			raise IndexError('the hours %d-%d are out of 0-%d of %d-%d' \
+				% (ohour_s, ohour_e, self.hour_num, self.start_year, self.end_year))
+		return ohour_s, ohour_e
+
+	def ctime(self, ihour):
+		'''Map the flat hour offset to time.
+		Args:
+			ihour: int or an array of int; the flat hour offset.
+		Returns:
+			numpy.datetime64 in hours, or an array of them.
+		'''
+		return self.origin + np.asarray(ihour, np.int64)
+
+	def clocal_day(self, iutc_offset):
+		'''Get the complete days in local time.
+			The local day dayth has the calendar date of the day dayth of the axis.
+		Args:
+			iutc_offset: int; the hours of local time ahead of UTC, e.g. 8 for UTC+8.
+		Returns:
+			oday_s: int; the first complete local day.
+			oday_e: int; the day after the last complete local day.
+			ohour_s: int; the flat hour offset of the first hour of local day oday_s.
+		'''
+		if (int(iutc_offset) != iutc_offset) or not (-24 < iutc_offset < 24):
+			raise ValueError('the UTC offset %s is not whole hours within a day' % str(iutc_offset))
+		iutc_offset = int(iutc_offset)
+		oday_s = -(-iutc_offset // 24)
+		oday_e = (self.hour_num + iutc_offset) // 24
+		return oday_s, oday_e, oday_s * 24 - iutc_offset
+
+	def cday_group(self, igroup):
+		'''Get the group of each day.
+		Args:
+			igroup: the group name, see TimeAxis; not 'hour'.
+		Returns:
+			oindex: (day_num,) group index of each day.
+			ogroup_num: int; the number of groups.
+		'''
+		if igroup == 'year':
+			return self.day_year, self.year_num
+		elif igroup == 'year_month':
+			return self.day_year_month, self.year_num * 12
+		elif igroup == 'day':
+			return np.arange(self.day_num), self.day_num
+		elif igroup == 'month':
+			return self.day_month, 12
+		elif igroup == 'day_of_year':
+			return self.day_of_year, 366
+		elif igroup == 'season':
+			return np.asarray(month_season)[self.day_month], 4
+		raise ValueError('unknown group: %s' % igroup)
+
+	def cgroup(self, igroup):
+		'''Get the group of each hour, built once.
+		Args:
+			igroup: the group name, see TimeAxis.
+		Returns:
+			oindex: (hour_num,) group index of each flat hour offset.
+			ogroup_num: int; the number of groups.
+		'''
+		if igroup not in self.group_cache:
+			if igroup == 'hour':
+				self.group_cache[igroup] = (np.tile(np.arange(24), self.day_num), 24)
+			else:
+				(day_index, group_num) = self.cday_group(igroup)
+				self.group_cache[igroup] = (np.repeat(day_index, 24), group_num)
+		return self.group_cache[igroup]
+
+	def cgroup_start(self, igroup):
+		'''Get the first hour of each group, for numpy.add.reduceat over the hours.
+		Args:
+			igroup: 'year', 'year_month' or 'day'.
+		Returns:
+			(group_num,) flat hour offsets.
+		'''
+		if igroup == 'year':
+			return self.year_start * 24
+		elif igroup == 'year_month':
+			return self.month_start * 24
+		elif igroup == 'day':
+			return np.arange(0, self.hour_num, 24)
+		raise ValueError('the group %s is not contiguous' % igroup)
+
+	def ccount(self, igroup):
+		'''Count the hours of each group.
+		Args:
+			igroup: the group name, see TimeAxis.
+		Returns:
+			(group_num,) numbers of hours.
+		'''
+		if igroup == 'hour':
+			return np.full(24, self.day_num, np.int64)
+		(day_index, group_num) = self.cday_group(igroup)
+		return np.bincount(day_index, minlength=group_num) * 24
+
+	def creduce(self, idata, igroup, ifunc='mean'):
+		'''Reduce the data of each group.
+			The contiguous groups are reduced by numpy.add.reduceat, the others by numpy.bincount of the days.
+		Args:
+			idata: (..., day_num, 24) or (..., hour_num) data, e.g. NasaCube.data.
+			igroup: the group name, see TimeAxis.
+			ifunc: 'sum' or 'mean'.
+		Returns:
+			(..., group_num) float64 sums or means of each group.
+		'''
+		if ifunc not in ('sum', 'mean'):
+			raise ValueError('unknown reduction: %s' % ifunc)
+		data = np.asarray(idata)
+		if data.shape[-1] == self.hour_num:
+			data = data.reshape(data.shape[:-1] + (self.day_num, 24))
+		if data.shape[-2:] != (self.day_num, 24):
+			raise ValueError('the shape of data %s does not match (%d, 24) or (%d,)' \
+				% (str(data.shape), self.day_num, self.hour_num))
+		if igroup == 'hour':
+			osum = np.sum(data, axis=-2, dtype=np.float64)
+		else:
+			day_sum = np.sum(data, axis=-1, dtype=np.float64)
+			if igroup in TimeAxis.contiguous_group:
+				osum = np.add.reduceat(day_sum, self.cgroup_start(igroup) // 24, axis=-1)
+			else:
+				(day_index, group_num) = self.cday_group(igroup)
+				lead = day_sum.reshape(-1, self.day_num)
+				flat_index = (np.arange(lead.shape[0]).reshape(-1, 1) * group_num + day_index).reshape(-1)
+				osum = np.bincount(flat_index, lead.reshape(-1), lead.shape[0] * group_num) \
+					.reshape(day_sum.shape[:-1] + (group_num,))
+		if ifunc == 'sum':
+			return osum
+		with np.errstate(divide='ignore', invalid='ignore'):
+			return osum / self.ccount(igroup)
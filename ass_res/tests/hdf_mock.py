@@ -0,0 +1,124 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 20:14:09 2026
+########################################################################################
+# @ File name: hdf_mock.py
+# @ Function: A mock of pyhdf.SD for the tests.
+# 	The daily NASA files are written as npz files of the same names and data names,
+# 	and read by the mock SD, so the tests run without the HDF4 library.
+# @ Author: Yongji Cao, Hengxu Zhang
+# @ Version: 1.0
+# @ Revision date: Oct/18/2026
+# @ Copyright (c) 2016-2026 School of Electrical Engineering, Shandong University, China
+########################################################################################
+"""
+
+
+import os
+import sys
+import types
+import datetime
+import numpy as np
+
+
+class SDS(object):
+	'''One data object of a mock NASA file.'''
+	read_num = 0
+
+	def __init__(self, idata):
+		self.data = idata
+
+	def info(self):
+		return 'sds', self.data.ndim, list(self.data.shape), 5, 0
+
+	def __getitem__(self, ikey):
+		odata = self.data[ikey]
+		SDS.read_num += odata.size
+		return odata
+
+
+class SD(object):
+	'''A mock NASA file, see pyhdf.SD.SD.'''
+	open_num = 0
+
+	def __init__(self, ifile_name):
+		SD.open_num += 1
+		self.fid = np.load(ifile_name)
+
+	def datasets(self):
+		return dict([(each, None) for each in self.fid.files])
+
+	def select(self, idata_name):
+		return SDS(self.fid[idata_name])
+
+	def end(self):
+		self.fid.close()
+
+
+def cinstall():
+	'''Install the mock as pyhdf.SD if pyhdf is not installed.'''
+	try:
+		import pyhdf.SD
+	except ImportError:
+		pyhdf = types.ModuleType('pyhdf')
+		pyhdf.SD = types.ModuleType('pyhdf.SD')
+		pyhdf.SD.SD = SD
+		sys.modules['pyhdf'] = pyhdf
+		sys.modules['pyhdf.SD'] = pyhdf.SD
+
+
+def cwrite_days(ifile_path, istart_year, iend_year, ishape=(24, 6, 8)):
+	'''Write the mock daily slv_Nx and rad_Nx files, named as WindData and SolarData list them.
+	Args:
+		ifile_path: str; the folder name.
+		istart_year: int; the start year.
+		iend_year: int; the end year.
+		ishape: the (hour, lat, lon) shape of each data name.
+	Returns:
+		ofile_list: list of (date, slv_Nx file name, rad_Nx file name) in calendar order.
+	'''
+	rng = np.random.RandomState(0)
+	ofile_list = []
+	day = datetime.date(istart_year, 1, 1)
+	while day.year <= iend_year:
+		special = (day.year == 2010) and (6 <= day.month <= 8)
+		slv = os.path.join(ifile_path, '%s.prod.assim.tavg1_2d_slv_Nx.%s.SUB.hdf' % \
+			('MERRA301' if special else 'MERRA300', day.strftime('%Y%m%d')))
+		rad = os.path.join(ifile_path, '%s.prod.assim.tavg1_2d_rad_Nx.%s.SUB.hdf' % \
+			('MERRA301' if (day.year < 2010) or special else 'MERRA300', day.strftime('%Y%m%d')))
+		with open(slv, 'wb') as fid:
+			np.savez(fid, U50M=(rng.randn(*ishape) * 6).astype(np.float32), \
+				V50M=(rng.randn(*ishape) * 6).astype(np.float32), TS=(rng.randn(*ishape) * 10 + 285).astype(np.float32))
+		with open(rad, 'wb') as fid:
+			np.savez(fid, SWGNT=(rng.rand(*ishape) * 900).astype(np.float32), \
+				SWGDN=(rng.rand(*ishape) * 1000).astype(np.float32))
+		ofile_list.append((day, slv, rad))
+		day += datetime.timedelta(1)
+	return ofile_list
+
+
+def cread_sites(ifile_name, idata_name, isite_index):
+	'''Read the sites of a mock daily file directly.
+	Args:
+		ifile_name: str; the file name.
+		idata_name: the data name.
+		isite_index: list; the list site indice.
+	Returns:
+		(site_num, 24) array.
+	'''
+	fid = np.load(ifile_name)
+	data = fid[idata_name]
+	fid.close()
+	return np.vstack([data[:, each[0], each[1]] for each in isite_index])
+
+
+def cquiet(ifunc, *iargs, **ikwargs):
+	'''Call ifunc without printing, e.g. the file names printed on importing.'''
+	stdout = sys.stdout
+	sys.stdout = open(os.devnull, 'w')
+	try:
+		return ifunc(*iargs, **ikwargs)
+	finally:
+		sys.stdout.close()
+		sys.stdout = stdout
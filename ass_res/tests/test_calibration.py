@@ -0,0 +1,78 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 17:04:26 2026
+########################################################################################
+# @ File name: test_calibration.py
+# @ Function: Tests of init_calibration.
+# 	The fitted factors of known gains and offsets, and the sites and months fallen back.
+# @ Author: Yongji Cao, Hengxu Zhang
+# @ Version: 1.0
+# @ Revision date: Oct/18/2026
+# @ Copyright (c) 2016-2026 School of Electrical Engineering, Shandong University, China
+########################################################################################
+"""
+
+
+import os
+import sys
+import unittest
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import init_nasa_cube as mcube
+import init_calibration as mcal
+
+
+class CalibrationTest(unittest.TestCase):
+
+	def setUp(self):
+		rng = np.random.RandomState(0)
+		self.cube = mcube.NasaCube(3, 2007, 2009, rng.rand(3, 1096, 24).astype(np.float32))
+		self.simulated = np.empty((3, 3, 12))
+		for each_yearth, each_year in enumerate(range(2007, 2010)):
+			for each_monthth, each_month in enumerate(mcube.NasaCube.month_name):
+				self.simulated[:, each_yearth, each_monthth] = \
+					[np.mean(self.cube[each_siteth][each_year][each_month], dtype=np.float64) for each_siteth in (1, 2, 3)]
+
+	def test_month_sum(self):
+		'''The sums and hours of each month against the months of the cube.'''
+		(month_sum, hour_num) = mcal.cmonth_sum(self.cube)
+		self.assertEqual((hour_num[0, 1], hour_num[1, 1]), (28 * 24, 29 * 24))
+		self.assertTrue(np.allclose(month_sum / hour_num, self.simulated))
+
+	def test_scale(self):
+		'''The gain of each site, each month.'''
+		gain = np.linspace(0.5, 1.5, 36).reshape(3, 12)
+		(ogain, ooffset, ofallback) = mcal.cfit_factor(self.cube, self.simulated * gain[:, np.newaxis, :])
+		self.assertTrue(np.allclose(ogain, gain))
+		self.assertTrue(np.all(ooffset == 0))
+		self.assertFalse(np.any(ofallback))
+
+	def test_linear(self):
+		'''The gain and offset of each site from annual means.'''
+		annual = np.sum(mcal.cmonth_sum(self.cube)[0], axis=2) / (np.array([365, 366, 365]) * 24.0)
+		observed = annual * np.array([[1.2], [0.8], [1.0]]) + np.array([[0.05], [-0.02], [0.0]])
+		(ogain, ooffset, ofallback) = mcal.cfit_factor(self.cube, observed, 'linear')
+		self.assertEqual(ogain.shape, (3, 12))
+		self.assertTrue(np.allclose(ogain, [[1.2], [0.8], [1.0]]))
+		self.assertTrue(np.allclose(ooffset, [[0.05], [-0.02], [0.0]]))
+		self.assertFalse(np.any(ofallback))
+		self.assertRaises(ValueError, mcal.cfit_factor, self.cube, observed, 'square')
+		self.assertRaises(ValueError, mcal.cfit_factor, self.cube, observed[:, :2])
+
+	def test_fallback(self):
+		'''The sites and months without measured data fall back to gain 1 and offset 0.'''
+		observed = self.simulated * 2
+		observed[1, :, 4] = np.nan
+		observed[2] = np.nan
+		observed[0, 0, 0] = np.nan
+		(ogain, ooffset, ofallback) = mcal.cfit_factor(self.cube, observed, 'linear')
+		self.assertEqual(np.sum(ofallback), 13)
+		self.assertTrue(ofallback[1, 4] and np.all(ofallback[2]))
+		self.assertTrue(np.all(ogain[ofallback] == 1) and np.all(ooffset[ofallback] == 0))
+		self.assertTrue(np.allclose(ogain[~ofallback], 2) and np.allclose(ooffset[~ofallback], 0))
+
+
+if __name__ == '__main__':
+	unittest.main()
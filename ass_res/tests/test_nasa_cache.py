@@ -0,0 +1,90 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 16:38:05 2026
+########################################################################################
+# @ File name: test_nasa_cache.py
+# @ Function: Tests of init_nasa_cache.
+# 	The cache files of decoded sweeps, hit, missed and invalidated by changed daily files.
+# @ Author: Yongji Cao, Hengxu Zhang
+# @ Version: 1.0
+# @ Revision date: Oct/18/2026
+# @ Copyright (c) 2016-2026 School of Electrical Engineering, Shandong University, China
+########################################################################################
+"""
+
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import init_nasa_cache as mcache
+
+
+class NasaCacheTest(unittest.TestCase):
+
+	def setUp(self):
+		self.temp_path = tempfile.mkdtemp()
+		self.file_list = []
+		for each_day in range(1, 4):
+			fname = os.path.join(self.temp_path, 'MERRA300.prod.assim.tavg1_2d_slv_Nx.200701%02d.SUB.hdf' % each_day)
+			with open(fname, 'wb') as fid:
+				fid.write(b'day %d' % each_day)
+			self.file_list.append((2007, 'Jan', each_day, fname))
+		self.import_list = [(('V50M', 'U50M'), [[0, 1], [2, 3]]), (('TS',), [[0, 1]])]
+		rng = np.random.RandomState(0)
+		self.data = [[rng.rand(3, 2, 24).astype(np.float32) for each in range(2)], [rng.rand(3, 2, 24)]]
+		self.cache_file = mcache.ccache_file(os.path.join(self.temp_path, 'cache'), self.file_list, self.import_list)
+
+	def tearDown(self):
+		shutil.rmtree(self.temp_path)
+
+	def test_file_name(self):
+		'''The cache file name depends on the files and the imports.'''
+		self.assertEqual(self.cache_file, \
+			mcache.ccache_file(os.path.join(self.temp_path, 'cache'), list(self.file_list), self.import_list))
+		self.assertNotEqual(self.cache_file, \
+			mcache.ccache_file(os.path.join(self.temp_path, 'cache'), self.file_list[:2], self.import_list))
+		self.assertNotEqual(self.cache_file, mcache.ccache_file(os.path.join(self.temp_path, 'cache'), \
+			self.file_list, [(('V50M', 'U50M'), [[0, 1], [2, 4]]), (('TS',), [[0, 1]])]))
+
+	def test_hit(self):
+		'''The saved sweep is loaded.'''
+		self.assertTrue(mcache.cload_cache(self.cache_file, self.file_list, self.import_list) is None)
+		mcache.csave_cache(self.cache_file, self.file_list, self.data)
+		self.assertFalse(os.path.exists(self.cache_file + '.tmp'))
+		data = mcache.cload_cache(self.cache_file, self.file_list, self.import_list)
+		self.assertEqual([len(each) for each in data], [2, 1])
+		for each_import, each_expected in zip(data, self.data):
+			for each_data, each_expected_data in zip(each_import, each_expected):
+				self.assertTrue(np.array_equal(each_data, each_expected_data))
+				self.assertEqual(each_data.dtype, each_expected_data.dtype)
+
+	def test_invalidate(self):
+		'''A changed daily file misses the cache.'''
+		mcache.csave_cache(self.cache_file, self.file_list, self.data)
+		stat = os.stat(self.file_list[1][3])
+		os.utime(self.file_list[1][3], (stat.st_atime, stat.st_mtime + 10))
+		self.assertTrue(mcache.cload_cache(self.cache_file, self.file_list, self.import_list) is None)
+		mcache.csave_cache(self.cache_file, self.file_list, self.data)
+		self.assertFalse(mcache.cload_cache(self.cache_file, self.file_list, self.import_list) is None)
+		with open(self.file_list[2][3], 'ab') as fid:
+			fid.write(b'more')
+		self.assertTrue(mcache.cload_cache(self.cache_file, self.file_list, self.import_list) is None)
+
+	def test_broken(self):
+		'''A broken cache file or another import misses the cache.'''
+		mcache.csave_cache(self.cache_file, self.file_list, self.data)
+		self.assertTrue(mcache.cload_cache(self.cache_file, self.file_list, \
+			self.import_list + [(('T2M',), [[0, 1]])]) is None)
+		with open(self.cache_file, 'wb') as fid:
+			fid.write(b'broken')
+		self.assertTrue(mcache.cload_cache(self.cache_file, self.file_list, self.import_list) is None)
+
+
+if __name__ == '__main__':
+	unittest.main()
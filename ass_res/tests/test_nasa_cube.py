@@ -0,0 +1,209 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 16:21:47 2026
+########################################################################################
+# @ File name: test_nasa_cube.py
+# @ Function: Tests of init_nasa_cube.
+# 	The dense data against the dict data of WindData and SolarData, the kept results, 
+# 	the scaled view and the archive file.
+# @ Author: Yongji Cao, Hengxu Zhang
+# @ Version: 1.0
+# @ Revision date: Oct/18/2026
+# @ Copyright (c) 2016-2026 School of Electrical Engineering, Shandong University, China
+########################################################################################
+"""
+
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import init_nasa_cube as mcube
+
+
+def cdict_data(isite_num, istart_year, iend_year, iseed=0):
+	'''Create random dict data as WindData.dict_wind_cf before the dense data.
+	Args:
+		isite_num: int; the number of sites.
+		istart_year: int; the start year.
+		iend_year: int; the end year.
+		iseed: int; the random seed.
+	Returns:
+		dict[siteth][year][month] of float32 (month days, 24) arrays.
+	'''
+	rng = np.random.RandomState(iseed)
+	month_offset = mcube.NasaCube(0, istart_year, iend_year).month_offset
+	odata = {}
+	for each_siteth in range(1, isite_num + 1):
+		odata[each_siteth] = {}
+		for each_year in range(istart_year, iend_year + 1):
+			odata[each_siteth][each_year] = {}
+			for each_month in mcube.NasaCube.month_name:
+				(day_s, day_e) = month_offset[(each_year, each_month)]
+				odata[each_siteth][each_year][each_month] = rng.rand(day_e - day_s, 24).astype(np.float32)
+	return odata
+
+
+class NasaCubeTest(unittest.TestCase):
+
+	def setUp(self):
+		self.dict_data = cdict_data(3, 2007, 2008)
+		self.cube = mcube.cto_cube(self.dict_data, 3, 2007, 2008)
+		self.temp_path = tempfile.mkdtemp()
+
+	def tearDown(self):
+		shutil.rmtree(self.temp_path)
+
+	def test_dict_round_trip(self):
+		'''The dense data holds the dict data.'''
+		self.assertEqual(self.cube.data.shape, (3, 731, 24))
+		self.assertEqual(self.cube.keys(), [1, 2, 3])
+		for each_siteth in self.dict_data:
+			for each_year in self.dict_data[each_siteth]:
+				for each_month in self.dict_data[each_siteth][each_year]:
+					self.assertTrue(np.array_equal(self.cube[each_siteth][each_year][each_month], \
+						self.dict_data[each_siteth][each_year][each_month]))
+		self.assertTrue(mcube.cto_cube(self.cube, 3, 2007, 2008) is self.cube)
+
+	def test_fill_day(self):
+		'''The data of one day of all sites written in place.'''
+		block = np.arange(72, dtype=np.float32).reshape(3, 24)
+		self.cube.cfill_day(2008, 'Mar', 1, block)
+		self.assertTrue(np.array_equal(self.cube[3][2008]['Mar'][0], block[2]))
+		self.assertTrue(np.array_equal(self.cube[3][2008]['Feb'][-1], self.dict_data[3][2008]['Feb'][-1]))
+		self.assertEqual(self.cube.cday_index(2008, 'Mar', 1), 365 + 31 + 29)
+		self.assertRaises(ValueError, mcube.NasaCube, 3, 2007, 2008, np.zeros((3, 730, 24), np.float32))
+
+	def test_style(self):
+		'''The styles as the dict styles of the months concatenated.'''
+		for each_siteth in self.dict_data:
+			years = []
+			for each_year in (2007, 2008):
+				months = [self.dict_data[each_siteth][each_year][each].reshape(1, -1) for each in mcube.NasaCube.month_name]
+				self.assertTrue(np.array_equal(self.cube.cstyle('1month')[each_siteth][each_year]['Feb'], months[1]))
+				self.assertTrue(np.array_equal(self.cube.cstyle('1year')[each_siteth][each_year], np.hstack(months)))
+				years.extend(months)
+			self.assertTrue(np.array_equal(self.cube.cstyle('10year')[each_siteth], np.hstack(years)))
+		self.assertTrue(self.cube.cstyle('1year') is self.cube.cstyle('1year'))
+		self.assertRaises(ValueError, self.cube.cstyle, '1week')
+
+	def test_select_range(self):
+		'''The hours of some sites against the flat data.'''
+		flat = self.cube.data.reshape(3, -1)
+		part = self.cube.cselect_range([1, 3], '2007-12-31T20', '2008-01-02T05')
+		hour_s = self.cube.time_axis.chour_offset('2007-12-31T20')
+		self.assertTrue(np.array_equal(part, flat[[0, 2], hour_s:hour_s + 33]))
+		self.assertTrue(np.array_equal(self.cube.cselect_range([3, 1]), flat[[2, 0]]))
+		self.assertRaises(IndexError, self.cube.cselect_range, [4])
+
+	def test_diurnal(self):
+		'''The climatology of the local hours of UTC+8 against the UTC hours of the same days.'''
+		(mean, std, percentile) = self.cube.cdiurnal(8, (50, 95))
+		feb = np.concatenate([np.arange(*self.cube.month_offset[(each, 'Feb')]) for each in (2007, 2008)])
+		self.assertEqual(percentile.shape, (3, 12, 24, 2))
+		self.assertTrue(np.allclose(mean[:, 1, 3], np.mean(self.cube.data[:, feb - 1, 19], axis=1)))
+		self.assertTrue(np.allclose(mean[:, 1, 12], np.mean(self.cube.data[:, feb, 4], axis=1)))
+		self.assertTrue(np.allclose(std[:, 1, 12], np.std(self.cube.data[:, feb, 4], axis=1)))
+		self.assertTrue(np.allclose(percentile[:, 1, 12, 0], np.percentile(self.cube.data[:, feb, 4], 50, axis=1)))
+		self.assertTrue(self.cube.cdiurnal(8, (50, 95)) is self.cube.cdiurnal(8, (50, 95)))
+
+	def test_site_stat(self):
+		'''The statistics of all hours of each site against the flat data.'''
+		flat = self.cube.data.reshape(3, -1).astype(np.float64)
+		for (each_stat, each_expected) in zip(self.cube.csite_stat(2), \
+			(np.sum(flat, axis=1), np.mean(flat, axis=1), np.std(flat, axis=1))):
+			self.assertTrue(np.allclose(each_stat, each_expected))
+
+	def test_append(self):
+		'''The following years appended to the dense data and to the dict data.'''
+		new_data = cdict_data(3, 2009, 2009, 1)
+		cube = mcube.cappend_years(self.cube, new_data, 2009, 2009)
+		self.assertEqual((cube.start_year, cube.end_year, cube.day_num), (2007, 2009, 1096))
+		self.assertTrue(np.array_equal(cube[2][2009]['Dec'], new_data[2][2009]['Dec']))
+		self.assertTrue(np.array_equal(cube[2][2007]['Jan'], self.dict_data[2][2007]['Jan']))
+		dict_data = mcube.cappend_years(cdict_data(3, 2007, 2008), new_data, 2009, 2009)
+		self.assertTrue(np.array_equal(mcube.cto_cube(dict_data, 3, 2007, 2009).data, cube.data))
+
+	def test_invalidate(self):
+		'''The kept results are cleared by the writes.'''
+		stat = self.cube.csite_stat()[1].copy()
+		diurnal = self.cube.cdiurnal(8, (50,))[0].copy()
+		self.assertTrue(self.cube.csite_stat() is self.cube.csite_stat())
+		self.cube[1][2007]['Jan'] = 0
+		self.assertTrue(self.cube.csite_stat()[1][0] < stat[0])
+		self.assertTrue(np.allclose(self.cube.csite_stat()[1][1:], stat[1:]))
+		self.assertTrue(self.cube.cdiurnal(8, (50,))[0][0, 0].sum() < diurnal[0, 0].sum())
+		stat = self.cube.csite_stat()[1].copy()
+		self.cube.cfill_day(2008, 'Mar', 1, np.full((3, 24), 10.0))
+		self.assertTrue(np.all(self.cube.csite_stat()[1] > stat))
+		self.cube.data[:] = 0
+		self.assertTrue(np.all(self.cube.csite_stat()[1] > 0))
+		self.cube.cinvalidate()
+		self.assertTrue(np.all(self.cube.csite_stat()[1] == 0))
+
+	def test_scaled(self):
+		'''The scaled view against the scaled data, and the stored cube changed after.'''
+		gain = np.linspace(0.5, 1.5, 36).reshape(3, 12)
+		scaled = mcube.ScaledCube(self.cube, gain, -0.1)
+		expected = np.empty(self.cube.data.shape, np.float32)
+		for ((each_year, each_month), (day_s, day_e)) in self.cube.month_offset.items():
+			monthth = mcube.NasaCube.month_name.index(each_month)
+			expected[:, day_s:day_e] = self.cube.data[:, day_s:day_e] * \
+				gain[:, monthth, np.newaxis, np.newaxis].astype(np.float32) - 0.1
+		np.maximum(expected, 0, expected)
+		full = mcube.NasaCube(3, 2007, 2008, expected)
+		self.assertTrue(np.allclose(scaled.data, expected))
+		self.assertTrue(np.allclose(scaled[2][2008]['Feb'], full[2][2008]['Feb']))
+		self.assertTrue(np.allclose(scaled.cselect_site(3, 2007), full.cselect_site(3, 2007)))
+		self.assertTrue(np.allclose(scaled.cstyle('1month')[3][2008]['Dec'], full.cstyle('1month')[3][2008]['Dec']))
+		self.assertTrue(np.allclose(scaled.cstyle('10year')[1], full.cstyle('10year')[1]))
+		self.assertEqual(sorted(scaled.cstyle('1year')[1].keys()), [2007, 2008])
+		self.assertEqual(scaled.style_cache, {})
+		self.assertTrue(np.allclose(scaled.creduce('month', 'mean', 2), full.creduce('month')))
+		for each_scaled, each_full in zip(scaled.cdiurnal(8, (5, 95), 2), full.cdiurnal(8, (5, 95))):
+			self.assertTrue(np.allclose(each_scaled, each_full))
+		mean = scaled.csite_stat()[1].copy()
+		self.cube[2][2007]['Jul'] = 0
+		self.assertTrue(scaled.csite_stat()[1][1] < mean[1])
+		self.assertTrue(np.all(scaled[2][2007]['Jul'] == 0))
+		self.assertRaises(TypeError, scaled.cfill_day, 2007, 'Jan', 1, 0)
+
+	def test_archive(self):
+		'''The archive files of both layouts loaded by memory mapping.'''
+		for each_layout in ('site', 'time'):
+			file_name = os.path.join(self.temp_path, each_layout + '.cube')
+			mcube.csave_archive(self.cube, file_name, each_layout, {'product': 'wind_cf'})
+			(cube, header) = mcube.cload_archive(file_name)
+			self.assertTrue(isinstance(cube.data.base, np.memmap) or isinstance(cube.data, np.memmap))
+			self.assertEqual((header['layout'], header['product']), (each_layout, 'wind_cf'))
+			self.assertTrue(np.array_equal(cube.data, self.cube.data))
+			self.assertTrue(np.array_equal(cube.cselect_site(2, 2008, 'Feb'), self.cube.cselect_site(2, 2008, 'Feb')))
+			del cube
+		self.assertRaises(ValueError, mcube.csave_archive, self.cube, file_name, 'day')
+		scaled = mcube.ScaledCube(self.cube, 2.0)
+		file_name = os.path.join(self.temp_path, 'scaled.cube')
+		mcube.csave_archive(scaled, file_name, 'time')
+		self.assertTrue(np.array_equal(mcube.cload_archive(file_name)[0].data, scaled.data))
+		self.assertRaises(ValueError, mcube.cload_archive, __file__)
+
+	def test_archive_write(self):
+		'''The writes through an 'r+' archive are seen after cinvalidate.'''
+		file_name = os.path.join(self.temp_path, 'site.cube')
+		mcube.csave_archive(self.cube, file_name)
+		cube = mcube.cload_archive(file_name, 'r+')[0]
+		mean = cube.csite_stat()[1].copy()
+		cube.data[0] += 1
+		cube.data.flush()
+		cube.cinvalidate()
+		self.assertTrue(np.allclose(cube.csite_stat()[1][0], mean[0] + 1))
+		del cube
+		self.assertTrue(np.allclose(mcube.cload_archive(file_name)[0].data[0], self.cube.data[0] + 1))
+
+
+if __name__ == '__main__':
+	unittest.main()
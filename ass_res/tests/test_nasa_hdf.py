@@ -0,0 +1,185 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 20:31:26 2026
+########################################################################################
+# @ File name: test_nasa_hdf.py
+# @ Function: Tests of init_nasa_hdf.
+# 	The reading of mock daily NASA files against the data read directly,
+# 	see hdf_mock.
+# @ Author: Yongji Cao, Hengxu Zhang
+# @ Version: 1.0
+# @ Revision date: Oct/18/2026
+# @ Copyright (c) 2016-2026 School of Electrical Engineering, Shandong University, China
+########################################################################################
+"""
+
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import hdf_mock
+hdf_mock.cinstall()
+import init_nasa_hdf as mhdf
+import init_nasa_wind as mwind
+import init_nasa_solar as msolar
+
+
+class NasaHdfTest(unittest.TestCase):
+
+	@classmethod
+	def setUpClass(cls):
+		cls.temp_path = tempfile.mkdtemp()
+		cls.file_list = hdf_mock.cwrite_days(cls.temp_path, 2007, 2007)
+		cls.site_index = [[0, 1], [5, 7], [2, 3], [-1, -2]]
+
+	@classmethod
+	def tearDownClass(cls):
+		shutil.rmtree(cls.temp_path)
+
+	def setUp(self):
+		self.sd = mhdf.SD
+		mhdf.SD = hdf_mock.SD
+
+	def tearDown(self):
+		mhdf.SD = self.sd
+
+	def cexpected(self, idata_name, imonth=None, iindex=1, isite_index=None):
+		'''The (site_num, day_num, 24) data read directly from the files, of one month or all days.'''
+		if isite_index is None:
+			isite_index = self.site_index
+		days = [each for each in self.file_list if (imonth is None) or (each[0].month == imonth)]
+		return np.stack([hdf_mock.cread_sites(each[iindex], idata_name, isite_index) for each in days], axis=1)
+
+	def test_pool_order(self):
+		'''The blocks of a process pool in the order of the files, as the serial reading.'''
+		file_names = [each[1] for each in self.file_list[:40]]
+		import_list = [(('V50M', 'U50M'), mhdf.csite_array(self.site_index)), \
+			(('TS', 'V50M'), mhdf.csite_array(self.site_index[1:]))]
+		serial = list(mhdf.cread_days(file_names, import_list))
+		pool = list(mhdf.cread_days(file_names, import_list, 3, 4))
+		self.assertEqual(len(pool), 40)
+		for each_serial, each_pool, each_fname in zip(serial, pool, file_names):
+			self.assertTrue(np.array_equal(each_serial[0][1], hdf_mock.cread_sites(each_fname, 'U50M', self.site_index)))
+			self.assertTrue(np.array_equal(each_serial[1][0], hdf_mock.cread_sites(each_fname, 'TS', self.site_index[1:])))
+			self.assertTrue(np.array_equal(each_serial[1][1], each_serial[0][0][1:]))
+			for each_import_serial, each_import_pool in zip(each_serial, each_pool):
+				for each_name_serial, each_name_pool in zip(each_import_serial, each_import_pool):
+					self.assertTrue(np.array_equal(each_name_serial, each_name_pool))
+
+	def test_gather(self):
+		'''The sites gathered at once as the sites read one by one, repeated and negative indices included.'''
+		site_index = [[5, 7], [0, 1], [5, 7], [-1, -2], [-6, 0]]
+		fname = self.file_list[100][1]
+		oblocks = mhdf.cread_day((fname, [(('V50M', 'TS'), mhdf.csite_array(site_index)), \
+			(('TS',), mhdf.csite_array([[2, 3]]))], False))
+		self.assertEqual(oblocks[0][0].shape, (5, 24))
+		self.assertTrue(np.array_equal(oblocks[0][0], hdf_mock.cread_sites(fname, 'V50M', site_index)))
+		self.assertTrue(np.array_equal(oblocks[0][1], hdf_mock.cread_sites(fname, 'TS', site_index)))
+		self.assertTrue(np.array_equal(oblocks[1][0], hdf_mock.cread_sites(fname, 'TS', [[2, 3]])))
+
+	def test_hyperslab(self):
+		'''The bounding window of the sites read as the full data, negative indices included.'''
+		import_list = [(('V50M', 'U50M'), mhdf.csite_array([[1, 2], [3, -4]])), (('U50M',), mhdf.csite_array([[-3, 5]]))]
+		fname = self.file_list[200][1]
+		hdf_mock.SDS.read_num = 0
+		full = mhdf.cread_day((fname, import_list, False))
+		full_num = hdf_mock.SDS.read_num
+		hdf_mock.SDS.read_num = 0
+		window = mhdf.cread_day((fname, import_list, True))
+		self.assertEqual((hdf_mock.SDS.read_num, full_num), ((3 * 3 + 3 * 4) * 24, 2 * 6 * 8 * 24))
+		for each_full, each_window in zip(full, window):
+			for each_name_full, each_name_window in zip(each_full, each_window):
+				self.assertTrue(np.array_equal(each_name_full, each_name_window))
+		wind_data = mwind.WindData(self.temp_path, self.site_index, 2007, 2007)
+		hdf_mock.cquiet(wind_data.cimport_data)
+		window_data = mwind.WindData(self.temp_path, self.site_index, 2007, 2007)
+		hdf_mock.cquiet(window_data.cimport_data, iprocess_num=2, ihyperslab=True)
+		self.assertTrue(np.array_equal(window_data.dict_ref_wind.data, wind_data.dict_ref_wind.data))
+
+	def test_cache(self):
+		'''The second sweep of the same files and sites loaded from the cache, without opening the files.'''
+		cache_path = tempfile.mkdtemp()
+		try:
+			wind_data = mwind.WindData(self.temp_path, self.site_index, 2007, 2007)
+			hdf_mock.cquiet(wind_data.cimport_data, iextra_name=('TS',), icache_path=cache_path)
+			open_num = hdf_mock.SD.open_num
+			cache_data = mwind.WindData(self.temp_path, self.site_index, 2007, 2007)
+			hdf_mock.cquiet(cache_data.cimport_data, iextra_name=('TS',), icache_path=cache_path)
+			self.assertEqual(hdf_mock.SD.open_num, open_num)
+			self.assertTrue(np.array_equal(cache_data.dict_ref_wind.data, wind_data.dict_ref_wind.data))
+			self.assertTrue(np.array_equal(cache_data.dict_field['TS'].data, wind_data.dict_field['TS'].data))
+			hdf_mock.cquiet(cache_data.cimport_data, iextra_name=('V50M',), icache_path=cache_path)
+			self.assertEqual(hdf_mock.SD.open_num, open_num + 365)
+		finally:
+			shutil.rmtree(cache_path)
+
+	def test_import(self):
+		'''The wind speed and solar irradiation of each month against the files.'''
+		wind_data = mwind.WindData(self.temp_path, self.site_index, 2007, 2007)
+		hdf_mock.cquiet(wind_data.cimport_data, iprocess_num=2)
+		solar_data = msolar.SolarData(self.temp_path, self.site_index, 2007, 2007)
+		hdf_mock.cquiet(solar_data.cimport_data, iprocess_num=2)
+		for (each_monthth, each_month) in ((1, 'Jan'), (2, 'Feb'), (12, 'Dec')):
+			speed = np.hypot(self.cexpected('V50M', each_monthth), self.cexpected('U50M', each_monthth))
+			solar = self.cexpected('SWGNT', each_monthth, 2)
+			for each_siteth in range(1, 5):
+				self.assertTrue(np.allclose(wind_data.dict_ref_wind[each_siteth][2007][each_month], speed[each_siteth - 1]))
+				self.assertTrue(np.array_equal(solar_data.dict_solar[each_siteth][2007][each_month], solar[each_siteth - 1]))
+
+	def test_sweep(self):
+		'''The wind speed, other data names and ambient temperature of one sweep as the separate imports.'''
+		wind_data = mwind.WindData(self.temp_path, self.site_index, 2007, 2007)
+		solar_data = msolar.SolarData(self.temp_path, self.site_index, 2007, 2007, self.temp_path, self.site_index[:2])
+		open_num = hdf_mock.SD.open_num
+		hdf_mock.cquiet(wind_data.cimport_data, iextra_name=('TS',), isolar_data=solar_data)
+		self.assertEqual(hdf_mock.SD.open_num, open_num + 365)
+		wind_data0 = mwind.WindData(self.temp_path, self.site_index, 2007, 2007)
+		hdf_mock.cquiet(wind_data0.cimport_data)
+		solar_data0 = msolar.SolarData(self.temp_path, self.site_index, 2007, 2007, self.temp_path, self.site_index[:2])
+		hdf_mock.cquiet(solar_data0.cimport_datat)
+		temperature = self.cexpected('TS', 7)
+		for each_siteth in range(1, 5):
+			self.assertTrue(np.array_equal(wind_data.dict_ref_wind[each_siteth][2007]['Jul'], \
+				wind_data0.dict_ref_wind[each_siteth][2007]['Jul']))
+			self.assertTrue(np.array_equal(wind_data.dict_field['TS'][each_siteth][2007]['Jul'], temperature[each_siteth - 1]))
+		self.assertEqual(sorted(solar_data.dict_temperature.keys()), [1, 2])
+		for each_siteth in (1, 2):
+			self.assertTrue(np.array_equal(solar_data.dict_temperature[each_siteth][2007]['Jul'], \
+				solar_data0.dict_temperature[each_siteth][2007]['Jul']))
+			self.assertTrue(np.array_equal(solar_data.dict_temperature[each_siteth][2007]['Jul'], temperature[each_siteth - 1]))
+
+	def test_sweep_mismatch(self):
+		'''The ambient temperature of another folder or other years raises ValueError before any file is read.'''
+		wind_data = mwind.WindData(self.temp_path, self.site_index, 2007, 2007)
+		open_num = hdf_mock.SD.open_num
+		for each_solar in (msolar.SolarData(self.temp_path, self.site_index, 2007, 2007), \
+			msolar.SolarData(self.temp_path, self.site_index, 2007, 2007, os.path.dirname(self.temp_path)), \
+			msolar.SolarData(self.temp_path, self.site_index, 2007, 2008, self.temp_path)):
+			self.assertRaises(ValueError, wind_data.cimport_data, isolar_data=each_solar)
+		self.assertEqual(hdf_mock.SD.open_num, open_num)
+
+	def test_stream(self):
+		'''The streamed days and months concatenated as the full import.'''
+		wind_data = mwind.WindData(self.temp_path, self.site_index, 2007, 2007)
+		hdf_mock.cquiet(wind_data.cimport_data)
+		days = list(wind_data.cstream_data(iprefetch_num=3, ithread_num=2))
+		self.assertEqual(len(days), 365)
+		self.assertEqual(days[59][:3], (2007, 'Mar', 1))
+		self.assertTrue(np.array_equal(np.stack([each[3] for each in days], axis=1), wind_data.dict_ref_wind.data))
+		months = list(wind_data.cstream_data(True, ihyperslab=True))
+		self.assertEqual([each[:2] for each in months[:2]], [(2007, 'Jan'), (2007, 'Feb')])
+		self.assertEqual(len(months), 12)
+		self.assertTrue(np.array_equal(np.concatenate([each[2] for each in months], axis=1), wind_data.dict_ref_wind.data))
+		temperature = list(mhdf.cstream_months(wind_data.cfile_list(), [(('TS',), self.site_index[:2])], 2, 1))
+		self.assertTrue(np.array_equal(np.concatenate([each[2][0][0] for each in temperature], axis=1), \
+			self.cexpected('TS', isite_index=self.site_index[:2])))
+
+
+if __name__ == '__main__':
+	unittest.main()
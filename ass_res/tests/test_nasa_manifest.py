@@ -0,0 +1,95 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 16:52:31 2026
+########################################################################################
+# @ File name: test_nasa_manifest.py
+# @ Function: Tests of init_nasa_manifest.
+# 	The daily files of a folder of empty files with NASA names.
+# @ Author: Yongji Cao, Hengxu Zhang
+# @ Version: 1.0
+# @ Revision date: Oct/18/2026
+# @ Copyright (c) 2016-2026 School of Electrical Engineering, Shandong University, China
+########################################################################################
+"""
+
+
+import os
+import sys
+import shutil
+import datetime
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import init_nasa_manifest as mmanifest
+
+
+def cprefix_rule(iyear, imonth):
+	'''The middle name of the slv_Nx files as WindData.cfname_prefix.'''
+	if (iyear == 2010) and (imonth in ('Jun', 'Jul', 'Aug')):
+		return '/MERRA301.prod.assim.tavg1_2d_slv_Nx.'
+	return '/MERRA300.prod.assim.tavg1_2d_slv_Nx.'
+
+
+class NasaManifestTest(unittest.TestCase):
+
+	def setUp(self):
+		self.temp_path = tempfile.mkdtemp()
+		day = datetime.date(2008, 1, 1)
+		while day.year <= 2010:
+			stream = 'MERRA301' if (day.year == 2010) and (6 <= day.month <= 8) else 'MERRA300'
+			self.ctouch(stream, 'slv', day)
+			self.ctouch(stream, 'rad', day)
+			day += datetime.timedelta(1)
+		self.ctouch('MERRA300', 'slv', datetime.date(2011, 1, 1))
+		open(os.path.join(self.temp_path, 'readme.txt'), 'w').close()
+
+	def tearDown(self):
+		shutil.rmtree(self.temp_path)
+
+	def ctouch(self, istream, icollection, iday):
+		'''Create an empty daily file.'''
+		fname = '%s.prod.assim.tavg1_2d_%s_Nx.%s.SUB.hdf' % (istream, icollection, iday.strftime('%Y%m%d'))
+		open(os.path.join(self.temp_path, fname), 'w').close()
+
+	def test_parse_prefix(self):
+		'''The product stream and collection of a middle name.'''
+		self.assertEqual(mmanifest.cparse_prefix(cprefix_rule(2010, 'Jul')), ('MERRA301', 'tavg1_2d_slv_Nx'))
+		self.assertRaises(ValueError, mmanifest.cparse_prefix, '/wind.')
+
+	def test_file_list(self):
+		'''The daily files in calendar order, of the product stream of each month.'''
+		file_list = mmanifest.NasaManifest(self.temp_path).cfile_list(2008, 2010, cprefix_rule)
+		self.assertEqual(len(file_list), 366 + 365 + 365)
+		self.assertEqual(file_list[59][:3], (2008, 'Feb', 29))
+		self.assertEqual(file_list[-1][:3], (2010, 'Dec', 31))
+		self.assertTrue(all(['tavg1_2d_slv_Nx' in each[3] for each in file_list]))
+		self.assertTrue(os.path.basename(file_list[731 + 200][3]).startswith('MERRA301'))
+		self.assertTrue(os.path.basename(file_list[0][3]).startswith('MERRA300'))
+
+	def test_missing(self):
+		'''A missing day, or a day of another product stream only, raises IOError before any file is read.'''
+		os.remove(os.path.join(self.temp_path, 'MERRA300.prod.assim.tavg1_2d_slv_Nx.20090301.SUB.hdf'))
+		manifest = mmanifest.NasaManifest(self.temp_path)
+		self.assertRaises(IOError, manifest.cfile_list, 2008, 2010, cprefix_rule)
+		self.assertEqual(len(manifest.cfile_list(2010, 2010, cprefix_rule)), 365)
+		self.assertRaises(IOError, manifest.cfile_list, 2010, 2011, cprefix_rule)
+		self.assertRaises(IOError, manifest.cfile_list, 2010, 2010, lambda iyear, imonth: cprefix_rule(2009, imonth))
+
+	def test_substitute(self):
+		'''Another product stream of the same day is used only if asked.'''
+		manifest = mmanifest.NasaManifest(self.temp_path, True)
+		stdout = sys.stdout
+		sys.stdout = open(os.devnull, 'w')
+		try:
+			file_list = manifest.cfile_list(2010, 2010, lambda iyear, imonth: cprefix_rule(2009, imonth))
+		finally:
+			sys.stdout.close()
+			sys.stdout = stdout
+		self.assertEqual(len(file_list), 365)
+		self.assertTrue(os.path.basename(file_list[200][3]).startswith('MERRA301'))
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,166 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 18:02:37 2026
+########################################################################################
+# @ File name: test_nasa_wind.py
+# @ Function: Tests of init_nasa_wind.
+# 	The dense conversions against the piecewise conversion of the dict data, 
+# 	the one-pass conversion against the separate steps, the calibration and the archive checks.
+# @ Author: Yongji Cao, Hengxu Zhang
+# @ Version: 1.0
+# @ Revision date: Oct/18/2026
+# @ Copyright (c) 2016-2026 School of Electrical Engineering, Shandong University, China
+########################################################################################
+"""
+
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import hdf_mock
+hdf_mock.cinstall()
+import init_nasa_cube as mcube
+import init_power_curve as mpc
+import init_nasa_wind as mwind
+import init_nasa_solar as msolar
+from test_nasa_cube import cdict_data
+
+
+class WindDataTest(unittest.TestCase):
+
+	def setUp(self):
+		self.dict_ref_wind = cdict_data(3, 2007, 2008)
+		for each_siteth in self.dict_ref_wind:
+			for each_year in self.dict_ref_wind[each_siteth]:
+				for each_month in self.dict_ref_wind[each_siteth][each_year]:
+					self.dict_ref_wind[each_siteth][each_year][each_month] *= 25
+		self.wind_data = self.cwind_data()
+
+	def cwind_data(self):
+		'''Create a WindData of the dict speed at reference height.'''
+		owind_data = mwind.WindData(None, [[0, 0]] * 3, 2007, 2008)
+		owind_data.dict_ref_wind = self.dict_ref_wind
+		return owind_data
+
+	def cmonth_mean(self, icf):
+		'''The (site_num, year_num, 12) means of each month of the capacity factors.'''
+		return np.array([[[np.mean(icf[each_siteth][each_year][each_month], dtype=np.float64) \
+			for each_month in mcube.NasaCube.month_name] for each_year in (2007, 2008)] for each_siteth in (1, 2, 3)])
+
+	def test_dict_pipeline(self):
+		'''The capacity factors of each month as the piecewise conversion of the dict data.'''
+		self.wind_data.cref2hw(50.0, 80.0, 0.3)
+		cf = self.wind_data.cwind2cf(3.0, 25.0, 12.0, 0.9)
+		for each_siteth in (1, 3):
+			for each_month in ('Feb', 'Dec'):
+				speed = self.dict_ref_wind[each_siteth][2008][each_month] * (80.0 / 50.0) ** 0.3
+				self.assertTrue(np.allclose(self.wind_data.dict_hw_wind[each_siteth][2008][each_month], speed))
+				self.assertTrue(np.allclose(cf[each_siteth][2008][each_month], \
+					self.wind_data.cuv2cf(speed, 3.0, 25.0, 12.0, 0.9), atol=1e-6))
+
+	def test_power_curve(self):
+		'''The capacity factors of a power curve as the curve of the speed at WTGs height.'''
+		curve = mpc.PowerCurve([3.0, 6.0, 12.0, 25.0], [0.0, 0.2, 1.0, 1.0])
+		self.wind_data.cref2hw(50.0, 80.0, 0.3)
+		cf = self.wind_data.cwind2cf(ipower_curve=curve)
+		for each_siteth in (1, 2):
+			self.assertTrue(np.allclose(cf[each_siteth][2007]['Jul'], \
+				curve.cspeed2cf(self.wind_data.dict_hw_wind[each_siteth][2007]['Jul'])))
+
+	def test_ref2cf(self):
+		'''The one-pass conversion as cref2hw and cwind2cf.'''
+		curve = mpc.PowerCurve([3.0, 6.0, 12.0, 25.0], [0.0, 0.2, 1.0, 1.0])
+		for each_curve in (None, curve):
+			self.wind_data.cref2hw(50.0, 80.0, 0.3)
+			expected_hw = self.wind_data.dict_hw_wind.data
+			expected = self.wind_data.cwind2cf(ipower_curve=each_curve).data
+			wind_data = self.cwind_data()
+			cf = wind_data.cref2cf(50.0, 80.0, 0.3, ipower_curve=each_curve, ikeep=('ref', 'hw'))
+			self.assertTrue(np.array_equal(cf.data, expected))
+			self.assertTrue(np.array_equal(wind_data.dict_hw_wind.data, expected_hw))
+			self.assertTrue(isinstance(wind_data.dict_ref_wind, mcube.NasaCube))
+		wind_data = self.cwind_data()
+		wind_data.dict_ref_wind = mcube.cto_cube(self.dict_ref_wind, 3, 2007, 2008)
+		cf = wind_data.cref2cf(50.0, 80.0, 0.3, ipower_curve=curve, ikeep=())
+		self.assertTrue(np.array_equal(cf.data, expected))
+		self.assertEqual((wind_data.dict_ref_wind, wind_data.dict_hw_wind), ({}, {}))
+
+	def test_correct(self):
+		'''The one-pass corrected conversion as the capacity factors scaled on reading.'''
+		self.wind_data.cref2hw()
+		self.wind_data.cwind2cf()
+		(cf0, cf) = self.wind_data.ccorrect_cf(np.array([0.8, 1.0, 1.2], np.float32), 0.01)
+		wind_data = self.cwind_data()
+		(wind_data.alpha, wind_data.offset) = (np.array([0.8, 1.0, 1.2], np.float32), 0.01)
+		fused = wind_data.cref2cf(icorrect=True)
+		self.assertTrue(np.allclose(fused.data, cf.data))
+		self.assertTrue(np.array_equal(wind_data.dict_wind_cf0.data, cf0.data))
+
+	def test_correct_twice(self):
+		'''Correcting the one-pass corrected conversion again starts from the uncorrected capacity factors.'''
+		cf0 = self.wind_data.cref2cf().data.copy()
+		wind_data = self.cwind_data()
+		wind_data.alpha = 0.8
+		wind_data.cref2cf(icorrect=True)
+		self.assertTrue(np.array_equal(wind_data.cuncorrected_cf().data, cf0))
+		(ocf0, ocf) = wind_data.ccorrect_cf()
+		self.assertTrue(np.allclose(ocf.data, cf0 * 0.8))
+		self.assertTrue(np.allclose(wind_data.ccal_corrcoef(np.mean(cf0, axis=(1, 2)) * 0.5), 0.5))
+
+	def test_turbines(self):
+		'''The capacity factors of several WTGs as cref2hw and cwind2cf of each.'''
+		curve = mpc.PowerCurve.cfrom_param(3.5, 22.0, 11.0, 0.9)
+		turbine_cf = self.wind_data.cturbines2cf([(65.0, 0.35, None), (90.0, 0.2, curve)])
+		for (each_cf, each_hw, each_alpha, each_curve) in zip(turbine_cf, (65.0, 90.0), (0.35, 0.2), (None, curve)):
+			wind_data = self.cwind_data()
+			wind_data.cref2hw(50.0, each_hw, each_alpha)
+			self.assertTrue(np.allclose(each_cf, wind_data.cwind2cf(ipower_curve=each_curve).data))
+
+	def test_calibrate(self):
+		'''The capacity factors calibrated against the measured means, the sites not measured kept uncorrected.'''
+		self.wind_data.cref2cf()
+		observed = self.cmonth_mean(self.wind_data.dict_wind_cf) * 1.1
+		observed[2] = np.nan
+		(cf0, cf) = self.wind_data.ccalibrate(observed)
+		self.assertTrue(np.all(self.wind_data.cal_fallback[2]) and not np.any(self.wind_data.cal_fallback[:2]))
+		self.assertTrue(np.allclose(cf.cselect_site(1), cf0.cselect_site(1) * 1.1))
+		self.assertTrue(np.allclose(self.cmonth_mean(cf)[:2], observed[:2]))
+		self.assertTrue(np.array_equal(cf.cselect_site(3), cf0.cselect_site(3)))
+
+
+	def test_archive(self):
+		'''The archive of other sites or years, or in another unit, raises ValueError.'''
+		temp_path = tempfile.mkdtemp()
+		try:
+			file_name = os.path.join(temp_path, 'wind.cube')
+			self.wind_data.cref2cf(ikeep=('ref',))
+			self.wind_data.cexport_archive(file_name, 'ref_wind')
+			wind_data = mwind.WindData(None, [[0, 0]] * 3, 2007, 2008)
+			cube = wind_data.cimport_archive(file_name)
+			self.assertTrue(np.array_equal(cube.data, self.wind_data.dict_ref_wind.data))
+			del cube
+			self.assertRaises(ValueError, wind_data.cimport_archive, file_name, 'wind_cf')
+			for each_data in (mwind.WindData(None, [[0, 0], [0, 0], [1, 2]], 2007, 2008), \
+				mwind.WindData(None, [[0, 0]] * 2, 2007, 2008), mwind.WindData(None, [[0, 0]] * 3, 2007, 2009)):
+				self.assertRaises(ValueError, each_data.cimport_archive, file_name)
+			file_name = os.path.join(temp_path, 'temperature.cube')
+			solar_data = msolar.SolarData(None, [[0, 0]] * 3, 2007, 2008, None, [[1, 1]] * 3)
+			solar_data.dict_temperature = self.wind_data.dict_ref_wind
+			solar_data.cexport_archive(file_name, 'temperature')
+			self.assertRaises(ValueError, msolar.SolarData(None, [[0, 0]] * 3, 2007, 2008).cimport_archive, file_name)
+			self.assertRaises(ValueError, solar_data.cimport_archive, file_name, 'solar')
+			solar_data.cimport_archive(file_name)
+			self.assertTrue(np.array_equal(solar_data.dict_temperature.data, self.wind_data.dict_ref_wind.data))
+			del solar_data
+		finally:
+			shutil.rmtree(temp_path)
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,84 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 17:50:09 2026
+########################################################################################
+# @ File name: test_param_sweep.py
+# @ Function: Tests of ass_param_sweep.
+# 	The chunked sweeps against the statistical indices of each parameter set.
+# @ Author: Yongji Cao, Hengxu Zhang
+# @ Version: 1.0
+# @ Revision date: Oct/18/2026
+# @ Copyright (c) 2016-2026 School of Electrical Engineering, Shandong University, China
+########################################################################################
+"""
+
+
+import os
+import sys
+import unittest
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import hdf_mock
+hdf_mock.cinstall()
+import init_nasa_cube as mcube
+import init_nasa_wind as mwind
+import ass_param_sweep as msweep
+
+
+def cstats(icf):
+	'''The statistical indices of (site_num, day_num, 24) capacity factors of each site.'''
+	flat = icf.reshape(icf.shape[0], -1).astype(np.float64)
+	mean = np.mean(flat, axis=1)
+	std = np.std(flat, axis=1)
+	return mean, std, std / mean, np.mean(flat > 0.5, axis=1)
+
+
+class ParamSweepTest(unittest.TestCase):
+
+	def setUp(self):
+		rng = np.random.RandomState(0)
+		self.cf = rng.rand(5, 3, 60, 24).astype(np.float32)
+
+	def test_grid(self):
+		'''The grid of parameters, the last parameter varying fastest.'''
+		grid = msweep.cparam_grid(ispeed_rate=[12.0, 13.5], ispeed_in=[2.5, 3.0, 3.5])
+		self.assertEqual(len(grid), 6)
+		self.assertEqual(grid[0], {'ispeed_in': 2.5, 'ispeed_rate': 12.0})
+		self.assertEqual(grid[1], {'ispeed_in': 2.5, 'ispeed_rate': 13.5})
+		self.assertEqual(grid[-1], {'ispeed_in': 3.5, 'ispeed_rate': 13.5})
+
+	def test_stats(self):
+		'''The indices of each parameter set against numpy.'''
+		stats = msweep.cass_stats(self.cf.copy())
+		for each_paramth in range(5):
+			for each_stat, each_expected in zip(stats, cstats(self.cf[each_paramth])):
+				self.assertTrue(np.allclose(each_stat[each_paramth], each_expected))
+
+	def test_sweep_chunk(self):
+		'''The chunks of parameter sets give the same indices.'''
+		def cfill(iparamth, iout):
+			iout[...] = self.cf[iparamth]
+		expected = msweep.cass_stats(self.cf.copy())
+		for each_chunk in (1, 2, 5, 8):
+			for each_stat, each_expected in zip(msweep.csweep(5, self.cf.shape[1:], cfill, each_chunk), expected):
+				self.assertTrue(np.allclose(each_stat, each_expected))
+
+	def test_sweep_wind(self):
+		'''The sweep of WTGs parameters against WindData.cref2cf of each set.'''
+		rng = np.random.RandomState(1)
+		wind_data = mwind.WindData(None, [[0, 0]] * 3, 2007, 2008)
+		ref_wind = mcube.NasaCube(3, 2007, 2008, (rng.rand(3, 731, 24) * 20).astype(np.float32))
+		wind_data.dict_ref_wind = ref_wind
+		params = msweep.cparam_grid(ihw=[65.0, 80.0], ispeed_rate=[12.0, 13.5])
+		stats = msweep.csweep_wind(wind_data, params, 3)
+		for each_paramth, each_param in enumerate(params):
+			cf = wind_data.cref2cf(ihw=each_param['ihw'], ispeed_rate=each_param['ispeed_rate'])
+			for each_stat, each_expected in zip(stats, cstats(cf.data)):
+				self.assertTrue(np.allclose(each_stat[each_paramth], each_expected))
+		self.assertRaises(ValueError, msweep.csweep_wind, wind_data, [{'ihub': 80.0}])
+
+
+if __name__ == '__main__':
+	unittest.main()
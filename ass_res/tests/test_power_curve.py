@@ -0,0 +1,84 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 17:15:53 2026
+########################################################################################
+# @ File name: test_power_curve.py
+# @ Function: Tests of init_power_curve.
+# 	The chunked power curves against the piecewise WindData.cuv2cf and numpy.interp.
+# @ Author: Yongji Cao, Hengxu Zhang
+# @ Version: 1.0
+# @ Revision date: Oct/18/2026
+# @ Copyright (c) 2016-2026 School of Electrical Engineering, Shandong University, China
+########################################################################################
+"""
+
+
+import os
+import sys
+import unittest
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import init_power_curve as mpc
+
+
+def cuv2cf(idata, ispeed_in, ispeed_out, ispeed_rate, inita):
+	'''The piecewise power curve of WindData.cuv2cf.'''
+	with np.errstate(invalid='ignore'):
+		return np.piecewise(
+			idata, 
+			[np.logical_or(idata < ispeed_in, idata > ispeed_out), 
+			np.logical_and(idata >= ispeed_in, idata <= ispeed_rate), 
+			np.logical_and(idata > ispeed_rate, idata <= ispeed_out)], 
+			[0, 
+			lambda idata: (idata - ispeed_in) / (ispeed_rate - ispeed_in) * inita, 
+			1 * inita])
+
+
+class PowerCurveTest(unittest.TestCase):
+
+	def setUp(self):
+		rng = np.random.RandomState(0)
+		self.speed = (rng.rand(3, 50, 24) * 30).astype(np.float32)
+		self.speed[0, 0, :6] = [0.0, 3.0, 13.5, 25.0, np.nextafter(np.float32(25.0), np.float32(30.0)), np.nan]
+		self.chunk_size = mpc.PowerCurve.chunk_size
+
+	def tearDown(self):
+		mpc.PowerCurve.chunk_size = self.chunk_size
+
+	def test_param(self):
+		'''The curve of the cut-in, rated and cut-out speeds as the piecewise curve, NaN speeds give 0.'''
+		for each_param in ((3.0, 25.0, 13.5, 0.95), (2.5, 20.0, 11.0, 1.0)):
+			expected = cuv2cf(self.speed, *each_param)
+			expected[np.isnan(expected)] = 0
+			curve = mpc.PowerCurve.cfrom_param(*each_param)
+			self.assertTrue(np.allclose(curve.cspeed2cf(self.speed), expected, atol=1e-6))
+		self.assertEqual(curve.cspeed2cf(self.speed)[0, 0, 5], 0)
+
+	def test_chunk(self):
+		'''The chunks, in place and non-contiguous arrays give the same capacity factors.'''
+		curve = mpc.PowerCurve.cfrom_param()
+		expected = curve.cspeed2cf(self.speed)
+		mpc.PowerCurve.chunk_size = 7
+		self.assertTrue(np.array_equal(curve.cspeed2cf(self.speed), expected))
+		speed = self.speed.copy()
+		self.assertTrue(curve.cspeed2cf(speed, speed) is speed)
+		self.assertTrue(np.array_equal(speed, expected))
+		self.assertTrue(np.array_equal(curve.cspeed2cf(self.speed.transpose(1, 0, 2)), expected.transpose(1, 0, 2)))
+
+	def test_table(self):
+		'''The tabulated curve interpolated linearly, 0 out of the table and for NaN speeds.'''
+		table_speed = [3.0, 5.0, 8.0, 12.0, 25.0]
+		table_cf = [0.0, 0.1, 0.4, 1.0, 1.0]
+		curve = mpc.PowerCurve(table_speed, table_cf, 0.9)
+		expected = np.interp(self.speed, table_speed, np.array(table_cf) * 0.9, 0.0, 0.0)
+		expected[np.isnan(expected)] = 0
+		mpc.PowerCurve.chunk_size = 11
+		self.assertTrue(np.allclose(curve.cspeed2cf(self.speed), expected))
+		self.assertRaises(ValueError, mpc.PowerCurve, [3.0, 3.0], [0.0, 1.0])
+		self.assertRaises(ValueError, mpc.PowerCurve, [3.0, 4.0], [0.0])
+
+
+if __name__ == '__main__':
+	unittest.main()
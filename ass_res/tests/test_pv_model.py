@@ -0,0 +1,62 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 17:27:14 2026
+########################################################################################
+# @ File name: test_pv_model.py
+# @ Function: Tests of init_pv_model.
+# 	The chunked PV models against the formulas of SolarData.csolar2cf_model1 and csolar2cf_model2.
+# @ Author: Yongji Cao, Hengxu Zhang
+# @ Version: 1.0
+# @ Revision date: Oct/18/2026
+# @ Copyright (c) 2016-2026 School of Electrical Engineering, Shandong University, China
+########################################################################################
+"""
+
+
+import os
+import sys
+import unittest
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import init_pv_model as mpv
+
+
+class PvModelTest(unittest.TestCase):
+
+	def setUp(self):
+		rng = np.random.RandomState(0)
+		self.solar = (rng.rand(3, 50, 24) * 1100).astype(np.float32)
+		self.temperature = (rng.rand(3, 50, 24) * 40 + 263.15).astype(np.float32)
+		self.chunk_size = mpv.PvModel.chunk_size
+
+	def tearDown(self):
+		mpv.PvModel.chunk_size = self.chunk_size
+
+	def test_model1(self):
+		'''PV model1 as Ff = (idata * iarea_m2 * ieffi_ratio) / irated_powr.'''
+		expected = (self.solar * 1.6368 * 0.1248) / 255.0
+		model = mpv.PvModel.cfrom_model1()
+		self.assertTrue(np.allclose(model.csolar2cf(self.solar), expected))
+		mpv.PvModel.chunk_size = 13
+		solar = self.solar.copy()
+		self.assertTrue(model.csolar2cf(solar, None, solar) is solar)
+		self.assertTrue(np.allclose(solar, expected))
+		self.assertTrue(np.allclose(mpv.PvModel.cfrom_model1(200.0).csolar2cf(self.solar, iclip=True), \
+			np.clip(self.solar * 1.6368 * 0.1248 / 200.0, 0, 1)))
+
+	def test_model2(self):
+		'''PV model2 as Ff = (idataf / iHSTC) * iC1 * (1 + iC2(Tf - iTSTC)), Tf = idatat + idataf * (iTfTETC - iTaTETC) / iHTETC.'''
+		cell = (self.temperature - 273.15) + self.solar * (47.0 - 20.0) / 800.0
+		expected = (self.solar / 1000.0) * 0.93 * (1 + (-0.005) * (cell - 25.0))
+		model = mpv.PvModel.cfrom_model2()
+		mpv.PvModel.chunk_size = 17
+		self.assertTrue(np.allclose(model.csolar2cf(self.solar, self.temperature), expected, atol=1e-6))
+		self.assertTrue(np.allclose(model.csolar2cf(self.solar.transpose(1, 0, 2), self.temperature.transpose(1, 0, 2)), \
+			expected.transpose(1, 0, 2), atol=1e-6))
+		self.assertRaises(ValueError, mpv.PvModel, 3, ())
+
+
+if __name__ == '__main__':
+	unittest.main()
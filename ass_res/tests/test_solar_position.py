@@ -0,0 +1,70 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 17:39:48 2026
+########################################################################################
+# @ File name: test_solar_position.py
+# @ Function: Tests of init_solar_position.
+# 	The solar position at known dates and sites, and the plane-of-array irradiation.
+# @ Author: Yongji Cao, Hengxu Zhang
+# @ Version: 1.0
+# @ Revision date: Oct/18/2026
+# @ Copyright (c) 2016-2026 School of Electrical Engineering, Shandong University, China
+########################################################################################
+"""
+
+
+import os
+import sys
+import datetime
+import unittest
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import init_solar_position as mposition
+
+
+class SolarPositionTest(unittest.TestCase):
+
+	def setUp(self):
+		self.lat = [0.0, 36.65, -33.9]
+		self.lon = [0.0, 117.0, 151.2]
+		(self.zenith, self.azimuth) = mposition.csolar_position(self.lat, self.lon, 2008, 2008)
+		rng = np.random.RandomState(0)
+		self.ghi = (np.clip(np.cos(np.radians(self.zenith)), 0, None) * 900 * rng.rand(*self.zenith.shape)).astype(np.float32)
+
+	def test_position(self):
+		'''The noon zenith at the equinox and the summer solstice.'''
+		self.assertEqual(self.zenith.shape, (3, 366, 24))
+		self.assertEqual(self.zenith.dtype, np.float32)
+		self.assertTrue(np.all((self.azimuth >= 0) & (self.azimuth < 360)))
+		equinox = datetime.date(2008, 3, 20).timetuple().tm_yday - 1
+		solstice = datetime.date(2008, 6, 21).timetuple().tm_yday - 1
+		self.assertTrue(self.zenith[0, equinox].min() < 8.0)
+		self.assertTrue(self.zenith[0, equinox].max() > 170.0)
+		self.assertAlmostEqual(self.zenith[1, solstice].min(), 36.65 - 23.44, delta=1.0)
+		self.assertAlmostEqual(self.zenith[2, solstice].min(), 33.9 + 23.44, delta=1.0)
+		noon = np.argmin(self.zenith[2, solstice])
+		self.assertAlmostEqual(self.azimuth[2, solstice, noon], 0.0, delta=20.0)
+
+	def test_erbs(self):
+		'''The beam and diffuse parts add up to the global horizontal irradiation.'''
+		cos_zenith = np.cos(np.radians(self.zenith))
+		(dni, dhi) = mposition.cerbs(self.ghi, cos_zenith, 1367.0)
+		day = cos_zenith > 0.065
+		self.assertTrue(np.allclose((dni * cos_zenith + dhi)[day], self.ghi[day], rtol=1e-4))
+		self.assertTrue(np.all(dni >= 0) and np.all(dhi >= 0))
+
+	def test_poa(self):
+		'''Horizontal modules get the global horizontal irradiation, site chunks give the same irradiation.'''
+		poa = mposition.cpoa(self.ghi, self.lat, self.lon, 2008, 2008, itilt=0.0, isite_chunk=2)
+		self.assertTrue(np.allclose(poa, np.where(np.cos(np.radians(self.zenith)) > 0, self.ghi, 0), atol=1e-3))
+		fixed = mposition.cpoa(self.ghi, self.lat, self.lon, 2008, 2008)
+		self.assertTrue(np.allclose(mposition.cpoa(self.ghi, self.lat, self.lon, 2008, 2008, isite_chunk=1), fixed))
+		tracking = mposition.cpoa(self.ghi, self.lat, self.lon, 2008, 2008, itracking=True)
+		self.assertTrue(np.all(np.sum(tracking, axis=(1, 2)) > np.sum(poa, axis=(1, 2))))
+		self.assertTrue(np.all(fixed >= 0))
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,119 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 16:05:12 2026
+########################################################################################
+# @ File name: test_time_axis.py
+# @ Function: Tests of init_time_axis.
+# 	The groups and reductions across leap years against a calendar built by datetime.
+# @ Author: Yongji Cao, Hengxu Zhang
+# @ Version: 1.0
+# @ Revision date: Oct/18/2026
+# @ Copyright (c) 2016-2026 School of Electrical Engineering, Shandong University, China
+########################################################################################
+"""
+
+
+import os
+import sys
+import datetime
+import unittest
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import init_time_axis as mtime
+
+
+def cday_label(istart_year, iend_year):
+	'''Label each day of the years by datetime, as the groups of TimeAxis.
+	Args:
+		istart_year: int; the start year.
+		iend_year: int; the end year.
+	Returns:
+		dict of (day_num,) labels of each group but 'hour'.
+	'''
+	olabel = dict([(each, []) for each in ('year', 'year_month', 'day', 'month', 'day_of_year', 'season')])
+	day = datetime.date(istart_year, 1, 1)
+	dayth = 0
+	while day.year <= iend_year:
+		olabel['year'].append(day.year - istart_year)
+		olabel['year_month'].append((day.year - istart_year) * 12 + day.month - 1)
+		olabel['day'].append(dayth)
+		olabel['month'].append(day.month - 1)
+		olabel['day_of_year'].append(datetime.date(2000, day.month, day.day).timetuple().tm_yday - 1)
+		olabel['season'].append(mtime.month_season[day.month - 1])
+		day += datetime.timedelta(1)
+		dayth += 1
+	return dict([(each, np.array(olabel[each])) for each in olabel])
+
+
+class TimeAxisTest(unittest.TestCase):
+
+	def setUp(self):
+		self.axis = mtime.TimeAxis(2007, 2009)
+		self.label = cday_label(2007, 2009)
+
+	def test_calendar(self):
+		'''The days and month offsets across a leap year.'''
+		self.assertEqual(self.axis.day_num, 365 + 366 + 365)
+		self.assertEqual(self.axis.month_offset[(2008, 'Feb')], (365 + 31, 365 + 60))
+		self.assertEqual(self.axis.cday_index(2008, 'Mar', 1), 365 + 60)
+		self.assertEqual(self.axis.cday_index(2009, 1, 1), 365 + 366)
+		self.assertTrue(mtime.ctime_axis(2007, 2009) is mtime.ctime_axis(2007, 2009))
+
+	def test_hour_offset(self):
+		'''The flat hour offsets of times and back.'''
+		hour = self.axis.chour_offset('2008-02-29T13')
+		self.assertEqual(hour, (365 + 59) * 24 + 13)
+		self.assertEqual(self.axis.chour_offset(datetime.datetime(2009, 12, 31, 23)), self.axis.hour_num - 1)
+		self.assertEqual(str(self.axis.ctime(hour)), '2008-02-29T13')
+		self.assertRaises(IndexError, self.axis.chour_offset, '2010-01-01T00')
+		self.assertEqual(self.axis.chour_range(), (0, self.axis.hour_num))
+		self.assertEqual(self.axis.chour_range('2008-01-01T00', hour), (365 * 24, hour))
+		self.assertRaises(IndexError, self.axis.chour_range, hour, 0)
+
+	def test_group(self):
+		'''The group of each day against datetime.'''
+		for each_group in self.label:
+			(index, group_num) = self.axis.cday_group(each_group)
+			self.assertTrue(np.array_equal(index, self.label[each_group]), each_group)
+			self.assertTrue(np.all(index < group_num), each_group)
+
+	def test_day_of_year(self):
+		'''Feb 29 has its own group, empty in non-leap years.'''
+		(index, group_num) = self.axis.cday_group('day_of_year')
+		self.assertEqual(group_num, 366)
+		count = self.axis.ccount('day_of_year')
+		self.assertEqual(count[59], 24)
+		self.assertEqual(count[58], 3 * 24)
+		self.assertEqual(count[60], 3 * 24)
+		self.assertEqual(index[self.axis.cday_index(2007, 'Mar', 1)], index[self.axis.cday_index(2008, 'Mar', 1)])
+		self.assertEqual(index[self.axis.cday_index(2009, 'Dec', 31)], 365)
+
+	def test_reduce(self):
+		'''The sums and means of each group against boolean masks.'''
+		rng = np.random.RandomState(0)
+		data = rng.rand(2, self.axis.day_num, 24).astype(np.float32)
+		hour_label = dict([(each, np.repeat(self.label[each], 24)) for each in self.label])
+		hour_label['hour'] = np.tile(np.arange(24), self.axis.day_num)
+		flat = data.reshape(2, -1)
+		for each_group in mtime.TimeAxis.group_name:
+			osum = self.axis.creduce(data, each_group, 'sum')
+			omean = self.axis.creduce(flat, each_group, 'mean')
+			for each_th in range(osum.shape[-1]):
+				mask = hour_label[each_group] == each_th
+				self.assertTrue(np.allclose(osum[:, each_th], np.sum(flat[:, mask], axis=1, dtype=np.float64)))
+				self.assertTrue(np.allclose(omean[:, each_th], np.mean(flat[:, mask], axis=1, dtype=np.float64)))
+			self.assertTrue(np.array_equal(self.axis.ccount(each_group), np.bincount(hour_label[each_group])))
+		self.assertRaises(ValueError, self.axis.creduce, data[:, 1:], 'year')
+
+	def test_local_day(self):
+		'''The complete local days of a UTC offset.'''
+		self.assertEqual(self.axis.clocal_day(0), (0, self.axis.day_num, 0))
+		self.assertEqual(self.axis.clocal_day(8), (1, self.axis.day_num, 16))
+		self.assertEqual(self.axis.clocal_day(-5), (0, self.axis.day_num - 1, 5))
+		self.assertRaises(ValueError, self.axis.clocal_day, 24)
+
+
+if __name__ == '__main__':
+	unittest.main()